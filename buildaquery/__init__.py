@@ -15,6 +15,7 @@ from buildaquery.compiler import (
 from buildaquery.execution import (
     CockroachExecutor,
     ClickHouseExecutor,
+    ConnectionPool,
     ConnectionSettings,
     ConnectionTimeoutError,
     DeadlockError,
@@ -83,6 +84,7 @@ __all__ = [
     "MsSqlExecutor",
     "RetryPolicy",
     "ExecutorCapabilities",
+    "ConnectionPool",
     "ConnectionSettings",
     "ObservabilitySettings",
     "QueryObservation",
@@ -5,14 +5,14 @@ from typing import Any
 # ==================================================
 # Base classes
 # ==================================================
-@dataclass
+@dataclass(slots=True)
 class ASTNode(ABC):
     """
     A generic AST node. All specific AST node types will inherit from this base class.
     """
     pass
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionNode(ASTNode):
     """
     A base class for all expression nodes in the AST.
@@ -23,14 +23,14 @@ class ExpressionNode(ASTNode):
 # Specific expression nodes
 # ==================================================
 
-@dataclass
+@dataclass(slots=True)
 class LiteralNode(ExpressionNode):
     """
     Represents a literal value in the AST, such as a number or string.
     """
     value: Any
 
-@dataclass
+@dataclass(slots=True)
 class ColumnNode(ExpressionNode):
     """
     Represents a column reference in the AST.
@@ -38,7 +38,7 @@ class ColumnNode(ExpressionNode):
     name: str
     table: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class BinaryOperationNode(ExpressionNode):
     """
     Represents a binary operation in the AST, such as addition, subtraction, etc.
@@ -51,21 +51,21 @@ class BinaryOperationNode(ExpressionNode):
 # Statement nodes
 # ==================================================
 
-@dataclass
+@dataclass(slots=True)
 class StatementNode(ASTNode):
     """
     A base class for all statement nodes in the AST.
     """
     pass
 
-@dataclass
+@dataclass(slots=True)
 class FromClauseNode(ASTNode):
     """
     Represents a FROM clause in the AST, anything can appears here, including subqueries, joins, etc.
     """
     pass
 
-@dataclass
+@dataclass(slots=True)
 class SubqueryNode(ExpressionNode, FromClauseNode):
     """
     Represents a subquery that can be used in an expression or a FROM clause.
@@ -73,7 +73,7 @@ class SubqueryNode(ExpressionNode, FromClauseNode):
     statement: 'SelectStatementNode'
     alias: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class JoinClauseNode(FromClauseNode):
     """
     Represents a JOIN clause in the AST.
@@ -83,7 +83,7 @@ class JoinClauseNode(FromClauseNode):
     on_condition: ExpressionNode
     join_type: str
 
-@dataclass
+@dataclass(slots=True)
 class OrderByClauseNode(ASTNode):
     """
     Represents a single item in the ORDER BY clause in the AST.
@@ -91,7 +91,7 @@ class OrderByClauseNode(ASTNode):
     expression: ExpressionNode
     direction: str = "ASC" # default to ascending order
 
-@dataclass
+@dataclass(slots=True)
 class TopClauseNode(ASTNode):
     """
     Represents a TOP clause in the AST.
@@ -101,7 +101,7 @@ class TopClauseNode(ASTNode):
     on_expression: ExpressionNode | None = None
     direction: str = "DESC" # default to descending order for TOP
 
-@dataclass
+@dataclass(slots=True)
 class LockClauseNode(ASTNode):
     """
     Represents row-level locking modifiers for SELECT statements.
@@ -110,14 +110,14 @@ class LockClauseNode(ASTNode):
     nowait: bool = False
     skip_locked: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class ConflictTargetNode(ASTNode):
     """
     Represents the conflict target columns used by upsert semantics.
     """
     columns: list[ColumnNode]
 
-@dataclass
+@dataclass(slots=True)
 class UpsertClauseNode(ASTNode):
     """
     Represents a dialect-aware upsert strategy attached to INSERT.
@@ -126,14 +126,14 @@ class UpsertClauseNode(ASTNode):
     do_nothing: bool = False
     update_columns: list[str] | None = None
 
-@dataclass
+@dataclass(slots=True)
 class ReturningClauseNode(ASTNode):
     """
     Represents a write-return payload clause (e.g., RETURNING / OUTPUT).
     """
     expressions: list[ExpressionNode]
 
-@dataclass
+@dataclass(slots=True)
 class TableNode(FromClauseNode):
     """
     Represents a table reference in the AST.
@@ -142,57 +142,57 @@ class TableNode(FromClauseNode):
     schema: str | None = None
     alias: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class AliasNode(ExpressionNode):
     """Represents an aliased expression (e.g., 'column AS new_name')."""
     expression: ExpressionNode
     name: str
 
-@dataclass
+@dataclass(slots=True)
 class OverClauseNode(ASTNode):
     """Represents an OVER clause for window functions."""
     partition_by: list[ExpressionNode] | None = None
     order_by: list[OrderByClauseNode] | None = None
 
-@dataclass
+@dataclass(slots=True)
 class CastNode(ExpressionNode):
     """Represents a type cast (e.g., 'CAST(column AS type)' or 'column::type')."""
     expression: ExpressionNode
     data_type: str
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCallNode(ExpressionNode):
     """Represents a function call (e.g., COUNT(*), MAX(price))."""
     name: str
     args: list[ExpressionNode]
     over: OverClauseNode | None = None # optional OVER clause for window functions
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOperationNode(ExpressionNode):
     """Represents a unary operation (e.g., NOT, -)."""
     operator: str
     operand: ExpressionNode
 
-@dataclass
+@dataclass(slots=True)
 class InNode(ExpressionNode):
     """Represents an IN expression (e.g., 'column IN (1, 2, 3)')."""
     expression: ExpressionNode
     values: list[ExpressionNode]
     negated: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class WhenThenNode(ASTNode):
     """Represents a WHEN ... THEN ... clause in a CASE expression."""
     condition: ExpressionNode
     result: ExpressionNode
 
-@dataclass
+@dataclass(slots=True)
 class CaseExpressionNode(ExpressionNode):
     """Represents a CASE expression (e.g., 'CASE WHEN cond THEN res ELSE default END')."""
     cases: list[WhenThenNode]
     else_result: ExpressionNode | None = None
 
-@dataclass
+@dataclass(slots=True)
 class BetweenNode(ExpressionNode):
     """Represents a BETWEEN expression (e.g., 'column BETWEEN 1 AND 10')."""
     expression: ExpressionNode
@@ -200,33 +200,33 @@ class BetweenNode(ExpressionNode):
     high: ExpressionNode
     negated: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class StarNode(ExpressionNode):
     """Represents the '*' in 'SELECT *'."""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class WhereClauseNode(ASTNode):
     """A wrapper for the expression in a WHERE clause."""
     condition: ExpressionNode
 
-@dataclass
+@dataclass(slots=True)
 class GroupByClauseNode(ASTNode):
     """A wrapper for the list of expressions in a GROUP BY clause."""
     expressions: list[ExpressionNode]
 
-@dataclass
+@dataclass(slots=True)
 class HavingClauseNode(ASTNode):
     """A wrapper for the expression in a HAVING clause."""
     condition: ExpressionNode
 
-@dataclass
+@dataclass(slots=True)
 class CTENode(ASTNode):
     """Represents a Common Table Expression (WITH clause)."""
     name: str
     subquery: 'SelectStatementNode'
 
-@dataclass
+@dataclass(slots=True)
 class SelectStatementNode(StatementNode):
     """
     Represents a SELECT statement in the AST.
@@ -244,7 +244,7 @@ class SelectStatementNode(StatementNode):
     offset: int | None = None # optional offset for skipping results
     lock_clause: LockClauseNode | None = None # optional row-locking clause (e.g., FOR UPDATE)
 
-@dataclass
+@dataclass(slots=True)
 class DeleteStatementNode(StatementNode):
     """
     Represents a DELETE statement in the AST.
@@ -253,7 +253,7 @@ class DeleteStatementNode(StatementNode):
     where_clause: WhereClauseNode | None = None
     returning_clause: ReturningClauseNode | None = None
 
-@dataclass
+@dataclass(slots=True)
 class ColumnDefinitionNode(ASTNode):
     """Represents a column definition in a CREATE TABLE statement."""
     name: str
@@ -262,22 +262,22 @@ class ColumnDefinitionNode(ASTNode):
     not_null: bool = False
     default: ExpressionNode | None = None
 
-@dataclass
+@dataclass(slots=True)
 class TableConstraintNode(ASTNode):
     """Base class for table-level constraints."""
     name: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class PrimaryKeyConstraintNode(TableConstraintNode):
     """Represents a table-level PRIMARY KEY constraint."""
     columns: list[ColumnNode] | None = None
 
-@dataclass
+@dataclass(slots=True)
 class UniqueConstraintNode(TableConstraintNode):
     """Represents a table-level UNIQUE constraint."""
     columns: list[ColumnNode] | None = None
 
-@dataclass
+@dataclass(slots=True)
 class ForeignKeyConstraintNode(TableConstraintNode):
     """Represents a table-level FOREIGN KEY constraint."""
     columns: list[ColumnNode] | None = None
@@ -286,40 +286,40 @@ class ForeignKeyConstraintNode(TableConstraintNode):
     on_delete: str | None = None
     on_update: str | None = None
 
-@dataclass
+@dataclass(slots=True)
 class CheckConstraintNode(TableConstraintNode):
     """Represents a table-level CHECK constraint."""
     condition: ExpressionNode | None = None
 
-@dataclass
+@dataclass(slots=True)
 class AlterTableActionNode(ASTNode):
     """Base class for ALTER TABLE actions."""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class AddColumnActionNode(AlterTableActionNode):
     """Represents ALTER TABLE ... ADD COLUMN action."""
     column: ColumnDefinitionNode
 
-@dataclass
+@dataclass(slots=True)
 class DropColumnActionNode(AlterTableActionNode):
     """Represents ALTER TABLE ... DROP COLUMN action."""
     column_name: str
     if_exists: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class AddConstraintActionNode(AlterTableActionNode):
     """Represents ALTER TABLE ... ADD CONSTRAINT action."""
     constraint: TableConstraintNode
 
-@dataclass
+@dataclass(slots=True)
 class DropConstraintActionNode(AlterTableActionNode):
     """Represents ALTER TABLE ... DROP CONSTRAINT action."""
     constraint_name: str
     if_exists: bool = False
     cascade: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class CreateStatementNode(StatementNode):
     """Represents a CREATE TABLE statement."""
     table: TableNode
@@ -327,14 +327,14 @@ class CreateStatementNode(StatementNode):
     constraints: list[TableConstraintNode] | None = None
     if_not_exists: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class DropStatementNode(StatementNode):
     """Represents a DROP TABLE statement."""
     table: TableNode
     if_exists: bool = False
     cascade: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class CreateIndexStatementNode(StatementNode):
     """Represents a CREATE INDEX statement."""
     name: str
@@ -343,7 +343,7 @@ class CreateIndexStatementNode(StatementNode):
     unique: bool = False
     if_not_exists: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class DropIndexStatementNode(StatementNode):
     """Represents a DROP INDEX statement."""
     name: str
@@ -351,13 +351,13 @@ class DropIndexStatementNode(StatementNode):
     if_exists: bool = False
     cascade: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class AlterTableStatementNode(StatementNode):
     """Represents an ALTER TABLE statement with one or more actions."""
     table: TableNode
     actions: list[AlterTableActionNode]
 
-@dataclass
+@dataclass(slots=True)
 class InsertStatementNode(StatementNode):
     """
     Represents an INSERT statement in the AST.
@@ -369,17 +369,17 @@ class InsertStatementNode(StatementNode):
     upsert_clause: UpsertClauseNode | None = None
     returning_clause: ReturningClauseNode | None = None
 
-@dataclass
+@dataclass(slots=True)
 class UpdateStatementNode(StatementNode):
     """
     Represents an UPDATE statement in the AST.
     """
     table: TableNode
-    set_clauses: dict[str, ExpressionNode] # Map column names to new values/expressions
+    set_clauses: dict[str, ExpressionNode] | list[tuple[str, ExpressionNode]] # column -> new value, as a dict or ordered (column, value) pairs
     where_clause: WhereClauseNode | None = None
     returning_clause: ReturningClauseNode | None = None
 
-@dataclass
+@dataclass(slots=True)
 class SetOperationNode(StatementNode):
     """
     Base class for set operations like UNION, INTERSECT, EXCEPT.
@@ -388,17 +388,17 @@ class SetOperationNode(StatementNode):
     right: StatementNode
     all: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class UnionNode(SetOperationNode):
     """Represents a UNION operation."""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class IntersectNode(SetOperationNode):
     """Represents an INTERSECT operation."""
     pass
 
-@dataclass
+@dataclass(slots=True)
 class ExceptNode(SetOperationNode):
     """Represents an EXCEPT operation."""
     pass
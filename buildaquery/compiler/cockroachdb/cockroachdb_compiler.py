@@ -1,7 +1,11 @@
-from typing import Any
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Hashable
 
+from buildaquery.compiler.column_definitions import COLUMN_CONSTRAINT_SUFFIXES
 from buildaquery.compiler.compiled_query import CompiledQuery
 from buildaquery.compiler.identifier_validation import validate_identifier
+from buildaquery.compiler.shape_key import param_slots, shape_key
 from buildaquery.abstract_syntax_tree.models import (
     ASTNode,
     SelectStatementNode,
@@ -58,13 +62,38 @@ from buildaquery.traversal.visitor_pattern import Visitor
 # CockroachDB Compiler
 # ==================================================
 
+# Placeholder per exact literal type; strings are cast so CockroachDB does not
+# have to infer the parameter type. None stays a bound parameter.
+_LITERAL_PLACEHOLDERS: dict[type, str] = {
+    int: "%s",
+    float: "%s",
+    bool: "%s",
+    type(None): "%s",
+    str: "CAST(%s AS STRING)",
+}
+
+
+def _literal_placeholder(value: Any) -> str:
+    placeholder = _LITERAL_PLACEHOLDERS.get(type(value))
+    if placeholder is not None:
+        return placeholder
+    # Subclasses (str enums, numpy scalars, ...) take the isinstance path.
+    return "CAST(%s AS STRING)" if isinstance(value, str) else "%s"
+
+
 class CockroachDbCompiler(Visitor):
     """
     A visitor that compiles an AST into a CockroachDB query string and a list of parameters.
     """
 
+    _COMPILE_CACHE_SIZE = 1024
+
     def __init__(self) -> None:
         self._params: list[Any] = []
+        # LiteralNode behind each bound param, in param order.
+        self._param_nodes: list[LiteralNode] = []
+        # shape key -> (sql, index into the key's literal list for each param)
+        self._compile_cache: OrderedDict[Hashable, tuple[str, tuple[int, ...]]] = OrderedDict()
 
     def _validate_identifier(self, identifier: str, *, kind: str) -> str:
         return validate_identifier(identifier, kind=kind)
@@ -76,8 +105,30 @@ class CockroachDbCompiler(Visitor):
         """
         The main entry point for compiling an AST node.
         """
+        literals: list[LiteralNode] = []
+        try:
+            key: Hashable | None = shape_key(node, literals)
+            hash(key)
+        except (TypeError, RecursionError):
+            # Unhashable structural values and very deep trees skip the cache.
+            key = None
+        if key is not None:
+            cached = self._compile_cache.get(key)
+            if cached is not None:
+                self._compile_cache.move_to_end(key)
+                return CompiledQuery(sql=cached[0], params=[literals[i].value for i in cached[1]])
+
         self._params = []
+        self._param_nodes = []
         sql = self.visit(node)
+        if key is not None and len(self._param_nodes) == len(self._params):
+            # Params follow visit order, which need not match field order (CTEs, ORDER BY, ...).
+            # Subclass visitors that bind params without recording their nodes skip the cache.
+            slots = param_slots(literals, self._param_nodes)
+            if slots is not None:
+                self._compile_cache[key] = (sql, slots)
+                if len(self._compile_cache) > self._COMPILE_CACHE_SIZE:
+                    self._compile_cache.popitem(last=False)
         return CompiledQuery(sql=sql, params=self._params)
 
     def to_sql(self, node: ASTNode) -> CompiledQuery:
@@ -176,13 +227,12 @@ class CockroachDbCompiler(Visitor):
         if node.columns:
             cols = f" ({', '.join([self._validate_column_identifier(c.name) for c in node.columns])})"
 
-        values_sql = self._compile_insert_values(node)
-        sql = f"INSERT INTO {table}{cols} {values_sql}"
+        parts = [f"INSERT INTO {table}{cols}", self._compile_insert_values(node)]
         if node.upsert_clause:
-            sql += f" {self._compile_upsert_clause(node.upsert_clause)}"
+            parts.append(self._compile_upsert_clause(node.upsert_clause))
         if node.returning_clause:
-            sql += f" {self._compile_returning_clause(node.returning_clause)}"
-        return sql
+            parts.append(self._compile_returning_clause(node.returning_clause))
+        return " ".join(parts)
 
     def _compile_insert_values(self, node: InsertStatementNode) -> str:
         has_values = node.values is not None
@@ -193,6 +243,13 @@ class CockroachDbCompiler(Visitor):
         if node.values is not None:
             if node.columns and len(node.columns) != len(node.values):
                 raise ValueError("Insert columns and values must have the same length.")
+            if all(type(value) is LiteralNode for value in node.values):
+                # Same placeholders visit_LiteralNode would emit, without a dispatch per value.
+                literals = [value.value for value in node.values]
+                self._params.extend(literals)
+                self._param_nodes.extend(node.values)
+                vals = ", ".join([_literal_placeholder(value) for value in literals])
+                return f"VALUES ({vals})"
             vals = ", ".join([self.visit(v) for v in node.values])
             return f"VALUES ({vals})"
 
@@ -204,11 +261,25 @@ class CockroachDbCompiler(Visitor):
             raise ValueError("Insert rows cannot be empty.")
         if node.columns and len(node.columns) != expected:
             raise ValueError("Insert columns and row values must have the same length.")
-        row_sql: list[str] = []
         for row in node.rows:
             if len(row) != expected:
                 raise ValueError("All insert rows must have the same number of values.")
-            row_sql.append(f"({', '.join([self.visit(v) for v in row])})")
+        if all(type(value) is LiteralNode for row in node.rows for value in row):
+            # Literal-only rows: string literals need CAST(... AS STRING), so reuse one
+            # placeholder group per distinct row shape instead of visiting every value.
+            templates: dict[tuple[bool, ...], str] = {}
+            row_sql: list[str] = []
+            for row in node.rows:
+                shape = tuple([isinstance(value.value, str) for value in row])
+                template = templates.get(shape)
+                if template is None:
+                    template = f"({', '.join(['CAST(%s AS STRING)' if is_str else '%s' for is_str in shape])})"
+                    templates[shape] = template
+                row_sql.append(template)
+            self._params.extend(chain.from_iterable([value.value for value in row] for row in node.rows))
+            self._param_nodes.extend(chain.from_iterable(node.rows))
+            return f"VALUES {', '.join(row_sql)}"
+        row_sql = [f"({', '.join([self.visit(v) for v in row])})" for row in node.rows]
         return f"VALUES {', '.join(row_sql)}"
 
     def _compile_upsert_clause(self, clause: UpsertClauseNode) -> str:
@@ -242,8 +313,9 @@ class CockroachDbCompiler(Visitor):
         Compiles an UPDATE statement.
         """
         table = self.visit(node.table)
+        set_clauses = node.set_clauses.items() if isinstance(node.set_clauses, dict) else node.set_clauses
         sets = ", ".join(
-            [f"{self._validate_column_identifier(col)} = {self.visit(expr)}" for col, expr in node.set_clauses.items()]
+            [f"{self._validate_column_identifier(col)} = {self.visit(expr)}" for col, expr in set_clauses]
         )
 
         parts = [f"UPDATE {table} SET {sets}"]
@@ -276,14 +348,11 @@ class CockroachDbCompiler(Visitor):
         """
         Compiles a column definition.
         """
-        parts = [self._validate_column_identifier(node.name), node.data_type]
-        if node.primary_key:
-            parts.append("PRIMARY KEY")
-        if node.not_null:
-            parts.append("NOT NULL")
-        if node.default:
-            parts.append(f"DEFAULT {self.visit(node.default)}")
-        return " ".join(parts)
+        name = self._validate_column_identifier(node.name)
+        suffix = COLUMN_CONSTRAINT_SUFFIXES[(bool(node.primary_key), bool(node.not_null))]
+        if node.default is None:
+            return f"{name} {node.data_type}{suffix}"
+        return f"{name} {node.data_type}{suffix} DEFAULT {self.visit(node.default)}"
 
     def visit_DropStatementNode(self, node: DropStatementNode) -> str:
         """
@@ -352,14 +421,22 @@ class CockroachDbCompiler(Visitor):
         Parametrizes the literal value to prevent SQL injection.
         """
         self._params.append(node.value)
-        if isinstance(node.value, str):
-            return "CAST(%s AS STRING)"
-        return "%s"
+        self._param_nodes.append(node)
+        return _literal_placeholder(node.value)
 
     def visit_BinaryOperationNode(self, node: BinaryOperationNode) -> str:
-        left = self.visit(node.left)
-        right = self.visit(node.right)
-        return f"({left} {node.operator} {right})"
+        # Walk left-deep chains such as a AND b AND c iteratively: one visit per
+        # operand instead of per level, and long generated filters cannot hit the
+        # recursion limit. Output and param order match the recursive form.
+        chain_nodes = [node]
+        left = node.left
+        while type(left) is BinaryOperationNode:
+            chain_nodes.append(left)
+            left = left.left
+        sql = self.visit(left)
+        for link in reversed(chain_nodes):
+            sql = f"({sql} {link.operator} {self.visit(link.right)})"
+        return sql
 
     def visit_StarNode(self, node: StarNode) -> str:
         return "*"
@@ -373,10 +450,9 @@ class CockroachDbCompiler(Visitor):
 
     def visit_FunctionCallNode(self, node: FunctionCallNode) -> str:
         args = ", ".join([self.visit(arg) for arg in node.args])
-        sql = f"{node.name}({args})"
         if node.over:
-            sql += f" OVER {self.visit(node.over)}"
-        return sql
+            return f"{node.name}({args}) OVER {self.visit(node.over)}"
+        return f"{node.name}({args})"
 
     def visit_OverClauseNode(self, node: OverClauseNode) -> str:
         """
@@ -401,7 +477,14 @@ class CockroachDbCompiler(Visitor):
         Compiles an IN expression.
         """
         expr = self.visit(node.expression)
-        vals = ", ".join([self.visit(v) for v in node.values])
+        if all(type(v) is LiteralNode for v in node.values):
+            # Literal-only lists (the common case): bind in one extend, no dispatch per value.
+            literals = [v.value for v in node.values]
+            self._params.extend(literals)
+            self._param_nodes.extend(node.values)
+            vals = ", ".join([_literal_placeholder(value) for value in literals])
+        else:
+            vals = ", ".join([self.visit(v) for v in node.values])
         op = "NOT IN" if node.negated else "IN"
         return f"({expr} {op} ({vals}))"
 
@@ -437,11 +520,11 @@ class CockroachDbCompiler(Visitor):
         """
         Compiles a subquery.
         """
-        sql = f"({self.visit(node.statement)})"
+        statement_sql = self.visit(node.statement)
         if node.alias:
             alias_name = self._validate_identifier(node.alias, kind="alias")
-            sql += f" AS {alias_name}"
-        return sql
+            return f"({statement_sql}) AS {alias_name}"
+        return f"({statement_sql})"
 
     # --------------------------------------------------
     # Clause Nodes
@@ -0,0 +1,8 @@
+# Inline column constraints keyed by (primary_key, not_null). Every dialect renders
+# them the same way; DEFAULT is an expression, so it is still compiled per column.
+COLUMN_CONSTRAINT_SUFFIXES: dict[tuple[bool, bool], str] = {
+    (False, False): "",
+    (True, False): " PRIMARY KEY",
+    (False, True): " NOT NULL",
+    (True, True): " PRIMARY KEY NOT NULL",
+}
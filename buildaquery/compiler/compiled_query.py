@@ -5,13 +5,15 @@ from typing import Any, Mapping, Sequence
 # Compiled Output
 # ==================================================
 
-@dataclass
+@dataclass(slots=True)
 class CompiledQuery:
     """
     Represents the result of the compilation process.
     """
     sql: str
     params: Sequence[Any] | Mapping[str, Any] = field(default_factory=list)
+    # Set by compilers that know the statement kind; None means "check the cursor".
+    returns_rows: bool | None = field(default=None, compare=False)
 
     def to_sql(self) -> str:
         """
@@ -1,3 +1,4 @@
+from functools import lru_cache
 import re
 
 
@@ -5,16 +6,22 @@ _IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 _COLUMN_EXPRESSION_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*\(\*\)$")
 
 
+@lru_cache(maxsize=4096)
+def _is_safe_identifier(identifier: str, allow_column_expression: bool) -> bool:
+    # Schemas reuse a small set of names, so each one is regex-checked only once.
+    if identifier == "*":
+        return True
+    if allow_column_expression and _COLUMN_EXPRESSION_RE.fullmatch(identifier):
+        return True
+    return _IDENTIFIER_RE.fullmatch(identifier) is not None
+
+
 def validate_identifier(
     identifier: str,
     *,
     kind: str = "identifier",
     allow_column_expression: bool = False,
 ) -> str:
-    if identifier == "*":
-        return identifier
-    if allow_column_expression and _COLUMN_EXPRESSION_RE.fullmatch(identifier):
-        return identifier
-    if not _IDENTIFIER_RE.fullmatch(identifier):
+    if not _is_safe_identifier(identifier, allow_column_expression):
         raise ValueError(f"Unsafe SQL identifier for {kind}: {identifier!r}")
     return identifier
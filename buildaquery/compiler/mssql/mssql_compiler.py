@@ -1,6 +1,8 @@
+from itertools import chain
 import re
 from typing import Any
 
+from buildaquery.compiler.column_definitions import COLUMN_CONSTRAINT_SUFFIXES
 from buildaquery.compiler.compiled_query import CompiledQuery
 from buildaquery.abstract_syntax_tree.models import (
     ASTNode,
@@ -193,11 +195,10 @@ class MsSqlCompiler(Visitor):
             cols = f" ({', '.join([self._validate_identifier(c.name, 'column name') for c in node.columns])})"
 
         values_sql = self._compile_insert_values(node)
-        sql = f"INSERT INTO {table}{cols}"
         if node.returning_clause:
-            sql += f" {self._compile_output_clause('INSERT', node.returning_clause)}"
-        sql += f" {values_sql}"
-        return sql
+            output_sql = self._compile_output_clause("INSERT", node.returning_clause)
+            return f"INSERT INTO {table}{cols} {output_sql} {values_sql}"
+        return f"INSERT INTO {table}{cols} {values_sql}"
 
     def _compile_insert_values(self, node: InsertStatementNode) -> str:
         has_values = node.values is not None
@@ -219,11 +220,16 @@ class MsSqlCompiler(Visitor):
             raise ValueError("Insert rows cannot be empty.")
         if node.columns and len(node.columns) != expected:
             raise ValueError("Insert columns and row values must have the same length.")
-        row_sql: list[str] = []
         for row in node.rows:
             if len(row) != expected:
                 raise ValueError("All insert rows must have the same number of values.")
-            row_sql.append(f"({', '.join([self.visit(v) for v in row])})")
+        if all(type(value) is LiteralNode for row in node.rows for value in row):
+            # Literal-only rows share one placeholder group, so bind the params in one
+            # pass and repeat the group instead of visiting every value.
+            self._params.extend(chain.from_iterable([value.value for value in row] for row in node.rows))
+            row_placeholders = f"({', '.join(['?'] * expected)})"
+            return f"VALUES {', '.join([row_placeholders] * len(node.rows))}"
+        row_sql = [f"({', '.join([self.visit(v) for v in row])})" for row in node.rows]
         return f"VALUES {', '.join(row_sql)}"
 
     def _compile_merge_upsert(self, node: InsertStatementNode) -> str:
@@ -290,8 +296,9 @@ class MsSqlCompiler(Visitor):
         Compiles an UPDATE statement.
         """
         table = self.visit(node.table)
+        set_clauses = node.set_clauses.items() if isinstance(node.set_clauses, dict) else node.set_clauses
         sets = ", ".join(
-            [f"{self._validate_identifier(col, 'column name')} = {self.visit(expr)}" for col, expr in node.set_clauses.items()]
+            [f"{self._validate_identifier(col, 'column name')} = {self.visit(expr)}" for col, expr in set_clauses]
         )
 
         parts = [f"UPDATE {table} SET {sets}"]
@@ -328,16 +335,19 @@ class MsSqlCompiler(Visitor):
         """
         Compiles a CREATE TABLE statement.
         """
+        if node.if_not_exists:
+            # The existence check's placeholders come first in the SQL, so bind them
+            # before any column DEFAULT literals.
+            schema_name = self._validate_identifier(node.table.schema or "dbo", "schema name")
+            table_name = self._validate_identifier(node.table.name, "table name")
+            self._params.append(table_name)
+            self._params.append(schema_name)
         table = self.visit(node.table)
         parts = [self.visit(c) for c in node.columns]
         if node.constraints:
             parts.extend([self.visit(constraint) for constraint in node.constraints])
         cols = ", ".join(parts)
         if node.if_not_exists:
-            schema_name = self._validate_identifier(node.table.schema or "dbo", "schema name")
-            table_name = self._validate_identifier(node.table.name, "table name")
-            self._params.append(table_name)
-            self._params.append(schema_name)
             return (
                 "IF NOT EXISTS (SELECT 1 FROM sys.tables "
                 "WHERE name = ? AND schema_id = SCHEMA_ID(?)) "
@@ -349,14 +359,11 @@ class MsSqlCompiler(Visitor):
         """
         Compiles a column definition.
         """
-        parts = [self._validate_identifier(node.name, "column name"), node.data_type]
-        if node.primary_key:
-            parts.append("PRIMARY KEY")
-        if node.not_null:
-            parts.append("NOT NULL")
-        if node.default:
-            parts.append(f"DEFAULT {self.visit(node.default)}")
-        return " ".join(parts)
+        name = self._validate_identifier(node.name, "column name")
+        suffix = COLUMN_CONSTRAINT_SUFFIXES[(bool(node.primary_key), bool(node.not_null))]
+        if node.default is None:
+            return f"{name} {node.data_type}{suffix}"
+        return f"{name} {node.data_type}{suffix} DEFAULT {self.visit(node.default)}"
 
     def visit_DropStatementNode(self, node: DropStatementNode) -> str:
         """
@@ -452,10 +459,9 @@ class MsSqlCompiler(Visitor):
 
     def visit_FunctionCallNode(self, node: FunctionCallNode) -> str:
         args = ", ".join([self.visit(arg) for arg in node.args])
-        sql = f"{node.name}({args})"
         if node.over:
-            sql += f" OVER {self.visit(node.over)}"
-        return sql
+            return f"{node.name}({args}) OVER {self.visit(node.over)}"
+        return f"{node.name}({args})"
 
     def visit_OverClauseNode(self, node: OverClauseNode) -> str:
         """
@@ -480,7 +486,12 @@ class MsSqlCompiler(Visitor):
         Compiles an IN expression.
         """
         expr = self.visit(node.expression)
-        vals = ", ".join([self.visit(v) for v in node.values])
+        if all(type(v) is LiteralNode for v in node.values):
+            # Literal-only lists (the common case): bind in one extend, no dispatch per value.
+            self._params.extend([v.value for v in node.values])
+            vals = ", ".join(["?"] * len(node.values))
+        else:
+            vals = ", ".join([self.visit(v) for v in node.values])
         op = "NOT IN" if node.negated else "IN"
         return f"({expr} {op} ({vals}))"
 
@@ -516,11 +527,11 @@ class MsSqlCompiler(Visitor):
         """
         Compiles a subquery.
         """
-        sql = f"({self.visit(node.statement)})"
+        statement_sql = self.visit(node.statement)
         if node.alias:
             alias_name = self._validate_identifier(node.alias, "alias")
-            sql += f" AS {alias_name}"
-        return sql
+            return f"({statement_sql}) AS {alias_name}"
+        return f"({statement_sql})"
 
     # --------------------------------------------------
     # Clause Nodes
@@ -1,7 +1,11 @@
-from typing import Any
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Hashable
 
+from buildaquery.compiler.column_definitions import COLUMN_CONSTRAINT_SUFFIXES
 from buildaquery.compiler.compiled_query import CompiledQuery
 from buildaquery.compiler.identifier_validation import validate_identifier
+from buildaquery.compiler.shape_key import param_slots, shape_key
 from buildaquery.abstract_syntax_tree.models import (
     ASTNode,
     SelectStatementNode,
@@ -62,8 +66,16 @@ class MySqlCompiler(Visitor):
     A visitor that compiles an AST into a MySQL query string and a list of parameters.
     """
 
+    _COMPILE_CACHE_SIZE = 1024
+
     def __init__(self) -> None:
         self._params: list[Any] = []
+        # LiteralNode behind each bound param, in param order.
+        self._param_nodes: list[LiteralNode] = []
+        # id(statement) -> (sql, params start, params end) for subqueries in the current compile
+        self._subquery_sql: dict[int, tuple[str, int, int]] = {}
+        # shape key -> (sql, index into the key's literal list for each param)
+        self._compile_cache: OrderedDict[Hashable, tuple[str, tuple[int, ...]]] = OrderedDict()
 
     def _validate_identifier(self, identifier: str, *, kind: str) -> str:
         return validate_identifier(identifier, kind=kind)
@@ -75,8 +87,31 @@ class MySqlCompiler(Visitor):
         """
         The main entry point for compiling an AST node.
         """
+        literals: list[LiteralNode] = []
+        try:
+            key: Hashable | None = shape_key(node, literals)
+            hash(key)
+        except (TypeError, RecursionError):
+            # Unhashable structural values and very deep trees skip the cache.
+            key = None
+        if key is not None:
+            cached = self._compile_cache.get(key)
+            if cached is not None:
+                self._compile_cache.move_to_end(key)
+                return CompiledQuery(sql=cached[0], params=[literals[i].value for i in cached[1]])
+
         self._params = []
+        self._param_nodes = []
+        self._subquery_sql = {}
         sql = self.visit(node)
+        if key is not None and len(self._param_nodes) == len(self._params):
+            # Params follow visit order, which need not match field order (CTEs, ORDER BY, ...).
+            # Subclass visitors that bind params without recording their nodes skip the cache.
+            slots = param_slots(literals, self._param_nodes)
+            if slots is not None:
+                self._compile_cache[key] = (sql, slots)
+                if len(self._compile_cache) > self._COMPILE_CACHE_SIZE:
+                    self._compile_cache.popitem(last=False)
         return CompiledQuery(sql=sql, params=self._params)
 
     def to_sql(self, node: ASTNode) -> CompiledQuery:
@@ -176,12 +211,12 @@ class MySqlCompiler(Visitor):
             cols = f" ({', '.join([self._validate_column_identifier(c.name) for c in node.columns])})"
 
         values_sql = self._compile_insert_values(node)
-        sql = f"INSERT INTO {table}{cols} {values_sql}"
+        parts = [f"INSERT INTO {table}{cols}", values_sql]
         if node.upsert_clause:
-            sql += f" {self._compile_upsert_clause(node.upsert_clause)}"
+            parts.append(self._compile_upsert_clause(node.upsert_clause))
         if node.returning_clause:
             raise ValueError("MySQL does not support generic RETURNING payloads for INSERT.")
-        return sql
+        return " ".join(parts)
 
     def _compile_insert_values(self, node: InsertStatementNode) -> str:
         has_values = node.values is not None
@@ -203,11 +238,17 @@ class MySqlCompiler(Visitor):
             raise ValueError("Insert rows cannot be empty.")
         if node.columns and len(node.columns) != expected:
             raise ValueError("Insert columns and row values must have the same length.")
-        row_sql: list[str] = []
         for row in node.rows:
             if len(row) != expected:
                 raise ValueError("All insert rows must have the same number of values.")
-            row_sql.append(f"({', '.join([self.visit(v) for v in row])})")
+        if all(type(value) is LiteralNode for row in node.rows for value in row):
+            # Literal-only rows share one placeholder group, so bind the params in one
+            # pass and repeat the group instead of visiting every value.
+            self._params.extend(chain.from_iterable([value.value for value in row] for row in node.rows))
+            self._param_nodes.extend(chain.from_iterable(node.rows))
+            row_placeholders = f"({', '.join(['%s'] * expected)})"
+            return f"VALUES {', '.join([row_placeholders] * len(node.rows))}"
+        row_sql = [f"({', '.join([self.visit(v) for v in row])})" for row in node.rows]
         return f"VALUES {', '.join(row_sql)}"
 
     def _compile_upsert_clause(self, clause: UpsertClauseNode) -> str:
@@ -231,8 +272,9 @@ class MySqlCompiler(Visitor):
         Compiles an UPDATE statement.
         """
         table = self.visit(node.table)
+        set_clauses = node.set_clauses.items() if isinstance(node.set_clauses, dict) else node.set_clauses
         sets = ", ".join(
-            [f"{self._validate_column_identifier(col)} = {self.visit(expr)}" for col, expr in node.set_clauses.items()]
+            [f"{self._validate_column_identifier(col)} = {self.visit(expr)}" for col, expr in set_clauses]
         )
 
         parts = [f"UPDATE {table} SET {sets}"]
@@ -259,14 +301,11 @@ class MySqlCompiler(Visitor):
         """
         Compiles a column definition.
         """
-        parts = [self._validate_column_identifier(node.name), node.data_type]
-        if node.primary_key:
-            parts.append("PRIMARY KEY")
-        if node.not_null:
-            parts.append("NOT NULL")
-        if node.default:
-            parts.append(f"DEFAULT {self.visit(node.default)}")
-        return " ".join(parts)
+        name = self._validate_column_identifier(node.name)
+        suffix = COLUMN_CONSTRAINT_SUFFIXES[(bool(node.primary_key), bool(node.not_null))]
+        if node.default is None:
+            return f"{name} {node.data_type}{suffix}"
+        return f"{name} {node.data_type}{suffix} DEFAULT {self.visit(node.default)}"
 
     def visit_DropStatementNode(self, node: DropStatementNode) -> str:
         """
@@ -339,6 +378,7 @@ class MySqlCompiler(Visitor):
         Parametrizes the literal value to prevent SQL injection.
         """
         self._params.append(node.value)
+        self._param_nodes.append(node)
         return "%s"
 
     def visit_BinaryOperationNode(self, node: BinaryOperationNode) -> str:
@@ -358,10 +398,9 @@ class MySqlCompiler(Visitor):
 
     def visit_FunctionCallNode(self, node: FunctionCallNode) -> str:
         args = ", ".join([self.visit(arg) for arg in node.args])
-        sql = f"{node.name}({args})"
         if node.over:
-            sql += f" OVER {self.visit(node.over)}"
-        return sql
+            return f"{node.name}({args}) OVER {self.visit(node.over)}"
+        return f"{node.name}({args})"
 
     def visit_OverClauseNode(self, node: OverClauseNode) -> str:
         """
@@ -386,7 +425,13 @@ class MySqlCompiler(Visitor):
         Compiles an IN expression.
         """
         expr = self.visit(node.expression)
-        vals = ", ".join([self.visit(v) for v in node.values])
+        if all(type(v) is LiteralNode for v in node.values):
+            # Literal-only lists (the common case): bind in one extend, no dispatch per value.
+            self._params.extend([v.value for v in node.values])
+            self._param_nodes.extend(node.values)
+            vals = ", ".join(["%s"] * len(node.values))
+        else:
+            vals = ", ".join([self.visit(v) for v in node.values])
         op = "NOT IN" if node.negated else "IN"
         return f"({expr} {op} ({vals}))"
 
@@ -422,11 +467,21 @@ class MySqlCompiler(Visitor):
         """
         Compiles a subquery.
         """
-        sql = f"({self.visit(node.statement)})"
+        statement = node.statement
+        cached = self._subquery_sql.get(id(statement))
+        if cached is None:
+            start = len(self._params)
+            statement_sql = self.visit(statement)
+            self._subquery_sql[id(statement)] = (statement_sql, start, len(self._params))
+        else:
+            # The same statement object used again in this tree: reuse its SQL and params.
+            statement_sql, start, end = cached
+            self._params.extend(self._params[start:end])
+            self._param_nodes.extend(self._param_nodes[start:end])
         if node.alias:
             alias_name = self._validate_identifier(node.alias, kind="alias")
-            sql += f" AS {alias_name}"
-        return sql
+            return f"({statement_sql}) AS {alias_name}"
+        return f"({statement_sql})"
 
     # --------------------------------------------------
     # Clause Nodes
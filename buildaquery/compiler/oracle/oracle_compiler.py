@@ -1,5 +1,6 @@
 from typing import Any
 
+from buildaquery.compiler.column_definitions import COLUMN_CONSTRAINT_SUFFIXES
 from buildaquery.compiler.compiled_query import CompiledQuery
 from buildaquery.compiler.identifier_validation import validate_identifier
 from buildaquery.abstract_syntax_tree.models import (
@@ -277,8 +278,9 @@ class OracleCompiler(Visitor):
         Compiles an UPDATE statement.
         """
         table = self.visit(node.table)
+        set_clauses = node.set_clauses.items() if isinstance(node.set_clauses, dict) else node.set_clauses
         sets = ", ".join(
-            [f"{self._validate_column_identifier(col)} = {self.visit(expr)}" for col, expr in node.set_clauses.items()]
+            [f"{self._validate_column_identifier(col)} = {self.visit(expr)}" for col, expr in set_clauses]
         )
 
         parts = [f"UPDATE {table} SET {sets}"]
@@ -306,14 +308,11 @@ class OracleCompiler(Visitor):
         """
         Compiles a column definition.
         """
-        parts = [self._validate_column_identifier(node.name), node.data_type]
-        if node.primary_key:
-            parts.append("PRIMARY KEY")
-        if node.not_null:
-            parts.append("NOT NULL")
-        if node.default:
-            parts.append(f"DEFAULT {self.visit(node.default)}")
-        return " ".join(parts)
+        name = self._validate_column_identifier(node.name)
+        suffix = COLUMN_CONSTRAINT_SUFFIXES[(bool(node.primary_key), bool(node.not_null))]
+        if node.default is None:
+            return f"{name} {node.data_type}{suffix}"
+        return f"{name} {node.data_type}{suffix} DEFAULT {self.visit(node.default)}"
 
     def visit_DropStatementNode(self, node: DropStatementNode) -> str:
         """
@@ -409,10 +408,9 @@ class OracleCompiler(Visitor):
 
     def visit_FunctionCallNode(self, node: FunctionCallNode) -> str:
         args = ", ".join([self.visit(arg) for arg in node.args])
-        sql = f"{node.name}({args})"
         if node.over:
-            sql += f" OVER {self.visit(node.over)}"
-        return sql
+            return f"{node.name}({args}) OVER {self.visit(node.over)}"
+        return f"{node.name}({args})"
 
     def visit_OverClauseNode(self, node: OverClauseNode) -> str:
         """
@@ -437,7 +435,13 @@ class OracleCompiler(Visitor):
         Compiles an IN expression.
         """
         expr = self.visit(node.expression)
-        vals = ", ".join([self.visit(v) for v in node.values])
+        if all(type(v) is LiteralNode for v in node.values):
+            # Literal-only lists (the common case): bind in one extend, no dispatch per value.
+            start = len(self._params) + 1
+            self._params.extend([v.value for v in node.values])
+            vals = ", ".join([f":{position}" for position in range(start, len(self._params) + 1)])
+        else:
+            vals = ", ".join([self.visit(v) for v in node.values])
         op = "NOT IN" if node.negated else "IN"
         return f"({expr} {op} ({vals}))"
 
@@ -473,11 +477,11 @@ class OracleCompiler(Visitor):
         """
         Compiles a subquery.
         """
-        sql = f"({self.visit(node.statement)})"
+        statement_sql = self.visit(node.statement)
         if node.alias:
             alias_name = self._validate_identifier(node.alias, kind="alias")
-            sql += f" {alias_name}"
-        return sql
+            return f"({statement_sql}) {alias_name}"
+        return f"({statement_sql})"
 
     # --------------------------------------------------
     # Clause Nodes
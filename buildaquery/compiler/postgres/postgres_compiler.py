@@ -1,5 +1,7 @@
+from itertools import chain
 from typing import Any
 
+from buildaquery.compiler.column_definitions import COLUMN_CONSTRAINT_SUFFIXES
 from buildaquery.compiler.compiled_query import CompiledQuery
 from buildaquery.compiler.identifier_validation import validate_identifier
 from buildaquery.abstract_syntax_tree.models import (
@@ -190,12 +192,12 @@ class PostgresCompiler(Visitor):
             cols = f" ({', '.join([self._validate_column_identifier(c.name) for c in node.columns])})"
 
         values_sql = self._compile_insert_values(node)
-        sql = f"INSERT INTO {table}{cols} {values_sql}"
+        parts = [f"INSERT INTO {table}{cols}", values_sql]
         if node.upsert_clause:
-            sql += f" {self._compile_upsert_clause(node.upsert_clause)}"
+            parts.append(self._compile_upsert_clause(node.upsert_clause))
         if node.returning_clause:
-            sql += f" {self._compile_returning_clause(node.returning_clause)}"
-        return sql
+            parts.append(self._compile_returning_clause(node.returning_clause))
+        return " ".join(parts)
 
     def _compile_insert_values(self, node: InsertStatementNode) -> str:
         has_values = node.values is not None
@@ -217,11 +219,16 @@ class PostgresCompiler(Visitor):
             raise ValueError("Insert rows cannot be empty.")
         if node.columns and len(node.columns) != expected:
             raise ValueError("Insert columns and row values must have the same length.")
-        row_sql: list[str] = []
         for row in node.rows:
             if len(row) != expected:
                 raise ValueError("All insert rows must have the same number of values.")
-            row_sql.append(f"({', '.join([self.visit(v) for v in row])})")
+        if all(type(value) is LiteralNode for row in node.rows for value in row):
+            # Literal-only rows share one placeholder group, so bind the params in one
+            # pass and repeat the group instead of visiting every value.
+            self._params.extend(chain.from_iterable([value.value for value in row] for row in node.rows))
+            row_placeholders = f"({', '.join(['%s'] * expected)})"
+            return f"VALUES {', '.join([row_placeholders] * len(node.rows))}"
+        row_sql = [f"({', '.join([self.visit(v) for v in row])})" for row in node.rows]
         return f"VALUES {', '.join(row_sql)}"
 
     def _compile_upsert_clause(self, clause: UpsertClauseNode) -> str:
@@ -255,8 +262,9 @@ class PostgresCompiler(Visitor):
         Compiles an UPDATE statement.
         """
         table = self.visit(node.table)
+        set_clauses = node.set_clauses.items() if isinstance(node.set_clauses, dict) else node.set_clauses
         sets = ", ".join(
-            [f"{self._validate_column_identifier(col)} = {self.visit(expr)}" for col, expr in node.set_clauses.items()]
+            [f"{self._validate_column_identifier(col)} = {self.visit(expr)}" for col, expr in set_clauses]
         )
         
         parts = [f"UPDATE {table} SET {sets}"]
@@ -289,14 +297,11 @@ class PostgresCompiler(Visitor):
         """
         Compiles a column definition.
         """
-        parts = [self._validate_column_identifier(node.name), node.data_type]
-        if node.primary_key:
-            parts.append("PRIMARY KEY")
-        if node.not_null:
-            parts.append("NOT NULL")
-        if node.default:
-            parts.append(f"DEFAULT {self.visit(node.default)}")
-        return " ".join(parts)
+        name = self._validate_column_identifier(node.name)
+        suffix = COLUMN_CONSTRAINT_SUFFIXES[(bool(node.primary_key), bool(node.not_null))]
+        if node.default is None:
+            return f"{name} {node.data_type}{suffix}"
+        return f"{name} {node.data_type}{suffix} DEFAULT {self.visit(node.default)}"
 
     def visit_DropStatementNode(self, node: DropStatementNode) -> str:
         """
@@ -384,10 +389,9 @@ class PostgresCompiler(Visitor):
 
     def visit_FunctionCallNode(self, node: FunctionCallNode) -> str:
         args = ", ".join([self.visit(arg) for arg in node.args])
-        sql = f"{node.name}({args})"
         if node.over:
-            sql += f" OVER {self.visit(node.over)}"
-        return sql
+            return f"{node.name}({args}) OVER {self.visit(node.over)}"
+        return f"{node.name}({args})"
 
     def visit_OverClauseNode(self, node: OverClauseNode) -> str:
         """
@@ -412,7 +416,12 @@ class PostgresCompiler(Visitor):
         Compiles an IN expression.
         """
         expr = self.visit(node.expression)
-        vals = ", ".join([self.visit(v) for v in node.values])
+        if all(type(v) is LiteralNode for v in node.values):
+            # Literal-only lists (the common case): bind in one extend, no dispatch per value.
+            self._params.extend([v.value for v in node.values])
+            vals = ", ".join(["%s"] * len(node.values))
+        else:
+            vals = ", ".join([self.visit(v) for v in node.values])
         op = "NOT IN" if node.negated else "IN"
         return f"({expr} {op} ({vals}))"
 
@@ -448,11 +457,11 @@ class PostgresCompiler(Visitor):
         """
         Compiles a subquery.
         """
-        sql = f"({self.visit(node.statement)})"
+        statement_sql = self.visit(node.statement)
         if node.alias:
             alias_name = self._validate_identifier(node.alias, kind="alias")
-            sql += f" AS {alias_name}"
-        return sql
+            return f"({statement_sql}) AS {alias_name}"
+        return f"({statement_sql})"
 
     # --------------------------------------------------
     # Clause Nodes
@@ -0,0 +1,38 @@
+from dataclasses import fields
+from typing import Any, Hashable
+
+from buildaquery.abstract_syntax_tree.models import ASTNode, LiteralNode
+
+# AST nodes are slotted dataclasses, so field names come from the dataclass, not vars().
+_NODE_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def shape_key(value: Any, literals: list[LiteralNode]) -> Hashable:
+    # Recomputed on every compile, so mutating an AST simply produces a new key.
+    if type(value) is LiteralNode:
+        # SQL depends only on the literal's type; the value is rebound on cache hits.
+        literals.append(value)
+        return (LiteralNode, type(value.value))
+    if isinstance(value, ASTNode):
+        node_type = type(value)
+        names = _NODE_FIELD_NAMES.get(node_type)
+        if names is None:
+            names = tuple([f.name for f in fields(value)])
+            _NODE_FIELD_NAMES[node_type] = names
+        return (node_type, tuple([shape_key(getattr(value, name), literals) for name in names]))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple([shape_key(item, literals) for item in value]))
+    if isinstance(value, dict):
+        return (dict, tuple([(key, shape_key(item, literals)) for key, item in value.items()]))
+    # The type keeps equal-but-distinct values such as 1 and True apart.
+    return (type(value), value)
+
+
+def param_slots(literals: list[LiteralNode], param_nodes: list[LiteralNode]) -> tuple[int, ...] | None:
+    # Maps each bound param to its literal's position in shape order. A node object
+    # reused in the tree fills several positions, and nothing records which one each
+    # of its params came from, so such trees return None and are not cached.
+    positions = {id(literal): index for index, literal in enumerate(literals)}
+    if len(positions) != len(literals):
+        return None
+    return tuple([positions[id(literal)] for literal in param_nodes])
@@ -1,3 +1,4 @@
+from itertools import chain
 from typing import Any
 
 from buildaquery.abstract_syntax_tree.models import (
@@ -49,7 +50,10 @@ from buildaquery.abstract_syntax_tree.models import (
     UpsertClauseNode,
     ConflictTargetNode,
     ReturningClauseNode,
+    SetOperationNode,
+    StatementNode,
 )
+from buildaquery.compiler.column_definitions import COLUMN_CONSTRAINT_SUFFIXES
 from buildaquery.compiler.compiled_query import CompiledQuery
 from buildaquery.compiler.identifier_validation import validate_identifier
 from buildaquery.traversal.visitor_pattern import Visitor
@@ -63,8 +67,11 @@ class SqliteCompiler(Visitor):
     A visitor that compiles an AST into a SQLite query string and a list of parameters.
     """
 
+    _INSERT_TEMPLATE_CACHE_SIZE = 256
+
     def __init__(self) -> None:
         self._params: list[Any] = []
+        self._insert_templates: dict[tuple[Any, ...], str] = {}
 
     def _validate_identifier(self, identifier: str, *, kind: str) -> str:
         return validate_identifier(identifier, kind=kind)
@@ -78,7 +85,16 @@ class SqliteCompiler(Visitor):
         """
         self._params = []
         sql = self.visit(node)
-        return CompiledQuery(sql=sql, params=self._params)
+        return CompiledQuery(sql=sql, params=self._params, returns_rows=self._returns_rows(node))
+
+    def _returns_rows(self, node: ASTNode) -> bool | None:
+        if isinstance(node, (SelectStatementNode, SetOperationNode)):
+            return True
+        if isinstance(node, (InsertStatementNode, UpdateStatementNode, DeleteStatementNode)):
+            return node.returning_clause is not None
+        if isinstance(node, StatementNode):
+            return False
+        return None
 
     def to_sql(self, node: ASTNode) -> CompiledQuery:
         """
@@ -171,17 +187,46 @@ class SqliteCompiler(Visitor):
         """
         Compiles an INSERT statement.
         """
+        if (
+            node.values is not None
+            and node.rows is None
+            and node.upsert_clause is None
+            and node.returning_clause is None
+            and all(type(value) is LiteralNode for value in node.values)
+        ):
+            return self._compile_literal_insert(node, node.values)
+
         table = self.visit(node.table)
         cols = ""
         if node.columns:
             cols = f" ({', '.join([self._validate_column_identifier(c.name) for c in node.columns])})"
 
         values_sql = self._compile_insert_values(node)
-        sql = f"INSERT INTO {table}{cols} {values_sql}"
+        parts = [f"INSERT INTO {table}{cols}", values_sql]
         if node.upsert_clause:
-            sql += f" {self._compile_upsert_clause(node.upsert_clause)}"
+            parts.append(self._compile_upsert_clause(node.upsert_clause))
         if node.returning_clause:
-            sql += f" {self._compile_returning_clause(node.returning_clause)}"
+            parts.append(self._compile_returning_clause(node.returning_clause))
+        return " ".join(parts)
+
+    def _compile_literal_insert(self, node: InsertStatementNode, values: list[Any]) -> str:
+        # Single-row literal INSERTs only differ in their params, so the SQL is
+        # cached per (table, columns, width) and identifiers are validated once.
+        columns = tuple([c.name for c in node.columns]) if node.columns else None
+        table = node.table
+        key = (table.name, table.schema, table.alias, columns, len(values))
+        sql = self._insert_templates.get(key)
+        if sql is None:
+            if columns is not None and len(columns) != len(values):
+                raise ValueError("Insert columns and values must have the same length.")
+            cols = ""
+            if columns is not None:
+                cols = f" ({', '.join([self._validate_column_identifier(c) for c in columns])})"
+            sql = f"INSERT INTO {self.visit(table)}{cols} VALUES ({', '.join(['?'] * len(values))})"
+            if len(self._insert_templates) >= self._INSERT_TEMPLATE_CACHE_SIZE:
+                self._insert_templates.clear()
+            self._insert_templates[key] = sql
+        self._params.extend([value.value for value in values])
         return sql
 
     def _compile_insert_values(self, node: InsertStatementNode) -> str:
@@ -204,11 +249,16 @@ class SqliteCompiler(Visitor):
             raise ValueError("Insert rows cannot be empty.")
         if node.columns and len(node.columns) != expected:
             raise ValueError("Insert columns and row values must have the same length.")
-        row_sql: list[str] = []
         for row in node.rows:
             if len(row) != expected:
                 raise ValueError("All insert rows must have the same number of values.")
-            row_sql.append(f"({', '.join([self.visit(v) for v in row])})")
+        if all(type(value) is LiteralNode for row in node.rows for value in row):
+            # Literal-only rows share one placeholder group, so bind the params in one
+            # pass and repeat the group instead of visiting every value.
+            self._params.extend(chain.from_iterable([value.value for value in row] for row in node.rows))
+            row_placeholders = f"({', '.join(['?'] * expected)})"
+            return f"VALUES {', '.join([row_placeholders] * len(node.rows))}"
+        row_sql = [f"({', '.join([self.visit(v) for v in row])})" for row in node.rows]
         return f"VALUES {', '.join(row_sql)}"
 
     def _compile_upsert_clause(self, clause: UpsertClauseNode) -> str:
@@ -242,8 +292,9 @@ class SqliteCompiler(Visitor):
         Compiles an UPDATE statement.
         """
         table = self.visit(node.table)
+        set_clauses = node.set_clauses.items() if isinstance(node.set_clauses, dict) else node.set_clauses
         sets = ", ".join(
-            [f"{self._validate_column_identifier(col)} = {self.visit(expr)}" for col, expr in node.set_clauses.items()]
+            [f"{self._validate_column_identifier(col)} = {self.visit(expr)}" for col, expr in set_clauses]
         )
 
         parts = [f"UPDATE {table} SET {sets}"]
@@ -276,14 +327,11 @@ class SqliteCompiler(Visitor):
         """
         Compiles a column definition.
         """
-        parts = [self._validate_column_identifier(node.name), node.data_type]
-        if node.primary_key:
-            parts.append("PRIMARY KEY")
-        if node.not_null:
-            parts.append("NOT NULL")
-        if node.default:
-            parts.append(f"DEFAULT {self.visit(node.default)}")
-        return " ".join(parts)
+        name = self._validate_column_identifier(node.name)
+        suffix = COLUMN_CONSTRAINT_SUFFIXES[(bool(node.primary_key), bool(node.not_null))]
+        if node.default is None:
+            return f"{name} {node.data_type}{suffix}"
+        return f"{name} {node.data_type}{suffix} DEFAULT {self.visit(node.default)}"
 
     def visit_DropStatementNode(self, node: DropStatementNode) -> str:
         """
@@ -375,10 +423,9 @@ class SqliteCompiler(Visitor):
 
     def visit_FunctionCallNode(self, node: FunctionCallNode) -> str:
         args = ", ".join([self.visit(arg) for arg in node.args])
-        sql = f"{node.name}({args})"
         if node.over:
-            sql += f" OVER {self.visit(node.over)}"
-        return sql
+            return f"{node.name}({args}) OVER {self.visit(node.over)}"
+        return f"{node.name}({args})"
 
     def visit_OverClauseNode(self, node: OverClauseNode) -> str:
         """
@@ -403,7 +450,12 @@ class SqliteCompiler(Visitor):
         Compiles an IN expression.
         """
         expr = self.visit(node.expression)
-        vals = ", ".join([self.visit(v) for v in node.values])
+        if all(type(v) is LiteralNode for v in node.values):
+            # Literal-only lists (the common case): bind in one extend, no dispatch per value.
+            self._params.extend([v.value for v in node.values])
+            vals = ", ".join(["?"] * len(node.values))
+        else:
+            vals = ", ".join([self.visit(v) for v in node.values])
         op = "NOT IN" if node.negated else "IN"
         return f"({expr} {op} ({vals}))"
 
@@ -439,11 +491,11 @@ class SqliteCompiler(Visitor):
         """
         Compiles a subquery.
         """
-        sql = f"({self.visit(node.statement)})"
+        statement_sql = self.visit(node.statement)
         if node.alias:
             alias_name = self._validate_identifier(node.alias, kind="alias")
-            sql += f" AS {alias_name}"
-        return sql
+            return f"({statement_sql}) AS {alias_name}"
+        return f"({statement_sql})"
 
     # --------------------------------------------------
     # Clause Nodes
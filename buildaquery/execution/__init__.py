@@ -10,6 +10,7 @@ from buildaquery.execution.clickhouse import ClickHouseExecutor
 from buildaquery.execution.capabilities import ExecutorCapabilities
 from buildaquery.execution.retry import RetryPolicy
 from buildaquery.execution.connection import ConnectionSettings
+from buildaquery.execution.pool import ConnectionPool
 from buildaquery.execution.observability import (
     ExecutionEvent,
     InMemoryMetricsAdapter,
@@ -47,6 +48,7 @@ __all__ = [
     "ExecutorCapabilities",
     "RetryPolicy",
     "ConnectionSettings",
+    "ConnectionPool",
     "ObservabilitySettings",
     "QueryObservation",
     "ExecutionEvent",
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 import time
-from typing import Any, Literal, Mapping, Sequence
+from typing import Any, Callable, Literal, Mapping, Sequence
 from uuid import uuid4
 from buildaquery.abstract_syntax_tree.models import ASTNode
 from buildaquery.compiler.compiled_query import CompiledQuery
@@ -65,6 +65,22 @@ class Executor(ABC):
         lock_skip_locked=False,
     )
 
+    # Set by executors whose `with executor:` block holds one connection for every call.
+    _hold_connection = False
+    _held_connection: Any = None
+    _held_release_mode: str | None = None
+
+    @property
+    def observability_settings(self) -> ObservabilitySettings:
+        return self._observability_settings
+
+    @observability_settings.setter
+    def observability_settings(self, settings: ObservabilitySettings) -> None:
+        # Cache whether anyone is listening so hot paths can skip timing and events.
+        self._observability_settings = settings
+        self._observability_enabled = isinstance(settings, ObservabilitySettings) and settings.has_any_subscriber()
+        self._event_fields = {"dialect": self._dialect_name(), "executor": self.__class__.__name__}
+
     @abstractmethod
     def execute(self, compiled_query: CompiledQuery) -> Any:
         """
@@ -210,8 +226,15 @@ class Executor(ABC):
         return sql, params
 
     def _normalize_compiled_query(self, query: CompiledQuery) -> CompiledQuery:
+        # Positional list params are already in executable form; skip the copy.
+        if type(query.params) is list:
+            return query
         sql, params = self._normalize_sql_params(query.sql, query.params)
-        return CompiledQuery(sql=sql, params=[] if params is None else params)
+        return CompiledQuery(
+            sql=sql,
+            params=[] if params is None else params,
+            returns_rows=query.returns_rows,
+        )
 
     def _validate_row_output(self, row_output: str, row_model: type[Any] | None) -> RowOutput:
         allowed: tuple[str, ...] = ("tuple", "dict", "model")
@@ -360,6 +383,8 @@ class Executor(ABC):
         return base
 
     def _emit_event(self, event: str, *, success: bool, **kwargs: Any) -> None:
+        if not getattr(self, "_observability_enabled", False):
+            return
         settings = getattr(self, "observability_settings", None)
         if not isinstance(settings, ObservabilitySettings) or settings.event_observer is None:
             return
@@ -367,14 +392,59 @@ class Executor(ABC):
         payload = ExecutionEvent(
             timestamp=datetime.now(timezone.utc).isoformat(),
             event=event,
-            dialect=self._dialect_name(),
-            executor=self.__class__.__name__,
             success=success,
             metadata=self._metadata(),
+            **self._event_fields,
             **kwargs,
         )
         settings.event_observer(payload)
 
+    def _acquire_observed(self, acquire: Callable[[], Any]) -> Any:
+        # Unobserved executors skip the event calls and their connection_id formatting.
+        if not getattr(self, "_observability_enabled", False):
+            return acquire()
+        self._emit_event("connection.acquire.start", success=True)
+        conn = acquire()
+        self._emit_event("connection.acquire.end", success=True, connection_id=str(id(conn)))
+        return conn
+
+    def _connect(self) -> Any:
+        # Driver-specific connect call; executors that open their own connections override it.
+        raise NotImplementedError(f"{self.__class__.__name__} does not open its own connections.")
+
+    def _release_connection(self, conn: Any, mode: str | None) -> None:
+        # Returns a per-call connection according to its release mode; executors override it.
+        raise NotImplementedError(f"{self.__class__.__name__} does not release connections.")
+
+    def _get_held_connection(self) -> Any:
+        # Opened lazily on the first call inside `with executor:` and reused until exit.
+        if self._held_connection is None:
+            settings = getattr(self, "connection_settings", None)
+            if settings is not None and settings.acquire_connection is not None:
+                self._held_connection = self._acquire_observed(settings.acquire_connection)
+                self._held_release_mode = "release"
+            else:
+                self._held_connection = self._acquire_observed(self._connect)
+                self._held_release_mode = "close"
+        return self._held_connection
+
+    def _reset_held_connection(self, conn: Any) -> None:
+        # Keep the block's connection but end any read transaction so later calls see fresh data.
+        if getattr(conn, "autocommit", False) is False:
+            try:
+                conn.rollback()
+            except Exception:
+                self._release_held_connection()
+
+    def _release_held_connection(self) -> None:
+        conn = self._held_connection
+        mode = self._held_release_mode
+        if conn is None:
+            return
+        self._held_connection = None
+        self._held_release_mode = None
+        self._release_connection(conn, mode)
+
     def _dialect_name(self) -> str:
         name = self.__class__.__name__.lower()
         name = name.replace("executor", "")
@@ -396,15 +466,15 @@ class Executor(ABC):
 
     def _observe_query(
         self,
-        *,
         operation: str,
         sql: str,
         params: Sequence[Any] | None,
-        run: Any,
+        fn: Callable[..., Any],
+        *args: Any,
     ) -> Any:
-        settings = getattr(self, "observability_settings", None)
-        if not isinstance(settings, ObservabilitySettings):
-            return run()
+        if not getattr(self, "_observability_enabled", False):
+            return fn(*args)
+        settings = self.observability_settings
 
         query_id = self._next_query_id()
         self._emit_event(
@@ -417,7 +487,7 @@ class Executor(ABC):
         started = time.perf_counter()
         error: Exception | None = None
         try:
-            result = run()
+            result = fn(*args)
             return result
         except Exception as exc:
             error = exc
@@ -1,4 +1,4 @@
-from typing import Any, Mapping, Sequence, cast
+from typing import Any, Mapping, Sequence
 from urllib.parse import unquote, urlparse
 import re
 
@@ -65,6 +65,8 @@ class ClickHouseExecutor(Executor):
         self._closed = False
 
     def _compile_if_needed(self, query: CompiledQuery | ASTNode) -> CompiledQuery:
+        if type(query) is CompiledQuery:
+            return self._normalize_compiled_query(query)
         if isinstance(query, ASTNode):
             return self.compiler.compile(query)
         return self._normalize_compiled_query(query)
@@ -183,14 +185,8 @@ class ClickHouseExecutor(Executor):
         if self.connection is not None:
             return self.connection, None
         if self.connection_settings.acquire_connection is not None:
-            self._emit_event("connection.acquire.start", success=True)
-            conn = self.connection_settings.acquire_connection()
-            self._emit_event("connection.acquire.end", success=True, connection_id=str(id(conn)))
-            return conn, "release"
-        self._emit_event("connection.acquire.start", success=True)
-        conn = self._connect()
-        self._emit_event("connection.acquire.end", success=True, connection_id=str(id(conn)))
-        return conn, "close"
+            return self._acquire_observed(self.connection_settings.acquire_connection), "release"
+        return self._acquire_observed(self._connect), "close"
 
     def _release_connection(self, conn: Any, mode: str | None) -> None:
         if mode is None:
@@ -209,10 +205,11 @@ class ClickHouseExecutor(Executor):
     def execute(self, query: CompiledQuery | ASTNode) -> Any:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="execute",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._execute_observed(compiled_query),
+            "execute",
+            compiled_query.sql,
+            compiled_query.params,
+            self._execute_observed,
+            compiled_query,
         )
 
     def _execute_observed(self, compiled_query: CompiledQuery) -> Any:
@@ -225,10 +222,11 @@ class ClickHouseExecutor(Executor):
     def fetch_all(self, query: CompiledQuery | ASTNode) -> Sequence[Sequence[Any]]:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="fetch_all",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._fetch_all_observed(compiled_query),
+            "fetch_all",
+            compiled_query.sql,
+            compiled_query.params,
+            self._fetch_all_observed,
+            compiled_query,
         )
 
     def _fetch_all_observed(self, compiled_query: CompiledQuery) -> Sequence[Sequence[Any]]:
@@ -237,7 +235,7 @@ class ClickHouseExecutor(Executor):
             cursor = conn.cursor()
             try:
                 self._cursor_execute(cursor, compiled_query.sql, compiled_query.params)
-                return cast(Sequence[Sequence[Any]], self._shape_rows(cursor.fetchall(), cursor.description))
+                return self._shape_rows(cursor.fetchall(), cursor.description)
             finally:
                 cursor.close()
         finally:
@@ -246,10 +244,11 @@ class ClickHouseExecutor(Executor):
     def fetch_one(self, query: CompiledQuery | ASTNode) -> Sequence[Any] | None:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="fetch_one",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._fetch_one_observed(compiled_query),
+            "fetch_one",
+            compiled_query.sql,
+            compiled_query.params,
+            self._fetch_one_observed,
+            compiled_query,
         )
 
     def _fetch_one_observed(self, compiled_query: CompiledQuery) -> Sequence[Any] | None:
@@ -258,7 +257,7 @@ class ClickHouseExecutor(Executor):
             cursor = conn.cursor()
             try:
                 self._cursor_execute(cursor, compiled_query.sql, compiled_query.params)
-                return cast(Sequence[Any] | None, self._shape_single_row(cursor.fetchone(), cursor.description))
+                return self._shape_single_row(cursor.fetchone(), cursor.description)
             finally:
                 cursor.close()
         finally:
@@ -268,10 +267,12 @@ class ClickHouseExecutor(Executor):
         if not param_sets:
             return
         self._observe_query(
-            operation="execute_many",
-            sql=sql,
-            params=param_sets[0],
-            run=lambda: self._execute_many_observed(sql, param_sets),
+            "execute_many",
+            sql,
+            param_sets[0],
+            self._execute_many_observed,
+            sql,
+            param_sets,
         )
 
     def _execute_many_observed(self, sql: str, param_sets: Sequence[Sequence[Any]]) -> None:
@@ -293,10 +294,12 @@ class ClickHouseExecutor(Executor):
         self._enforce_execute_raw_policy(sql=sql, trusted=trusted)
         sql, params = self._normalize_sql_params(sql, params)
         self._observe_query(
-            operation="execute_raw",
-            sql=sql,
-            params=params,
-            run=lambda: self._execute_raw_observed(sql, params),
+            "execute_raw",
+            sql,
+            params,
+            self._execute_raw_observed,
+            sql,
+            params,
         )
 
     def _execute_raw_observed(self, sql: str, params: Sequence[Any] | Mapping[str, Any] | None = None) -> None:
@@ -1,6 +1,6 @@
 import importlib
 import time
-from typing import Any, Mapping, Sequence, cast
+from typing import Any, Mapping, Sequence
 from uuid import uuid4
 
 from buildaquery.abstract_syntax_tree.models import ASTNode
@@ -71,6 +71,8 @@ class DuckDbExecutor(Executor):
         self._savepoint_supported: bool | None = None
 
     def _compile_if_needed(self, query: CompiledQuery | ASTNode) -> CompiledQuery:
+        if type(query) is CompiledQuery:
+            return self._normalize_compiled_query(query)
         if isinstance(query, ASTNode):
             return self.compiler.compile(query)
         return self._normalize_compiled_query(query)
@@ -111,14 +113,8 @@ class DuckDbExecutor(Executor):
         if self.connection is not None:
             return self.connection, None
         if self.connection_settings.acquire_connection is not None:
-            self._emit_event("connection.acquire.start", success=True)
-            conn = self.connection_settings.acquire_connection()
-            self._emit_event("connection.acquire.end", success=True, connection_id=str(id(conn)))
-            return conn, "release"
-        self._emit_event("connection.acquire.start", success=True)
-        conn = self._connect()
-        self._emit_event("connection.acquire.end", success=True, connection_id=str(id(conn)))
-        return conn, "close"
+            return self._acquire_observed(self.connection_settings.acquire_connection), "release"
+        return self._acquire_observed(self._connect), "close"
 
     def _release_connection(self, conn: Any, mode: str | None) -> None:
         if mode is None:
@@ -143,10 +139,11 @@ class DuckDbExecutor(Executor):
     def execute(self, query: CompiledQuery | ASTNode) -> Any:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="execute",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._execute_observed(compiled_query),
+            "execute",
+            compiled_query.sql,
+            compiled_query.params,
+            self._execute_observed,
+            compiled_query,
         )
 
     def _execute_observed(self, compiled_query: CompiledQuery) -> Any:
@@ -162,34 +159,36 @@ class DuckDbExecutor(Executor):
     def fetch_all(self, query: CompiledQuery | ASTNode) -> Sequence[Sequence[Any]]:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="fetch_all",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._fetch_all_observed(compiled_query),
+            "fetch_all",
+            compiled_query.sql,
+            compiled_query.params,
+            self._fetch_all_observed,
+            compiled_query,
         )
 
     def _fetch_all_observed(self, compiled_query: CompiledQuery) -> Sequence[Sequence[Any]]:
         conn, release_mode = self._get_connection_for_query()
         try:
             cursor = conn.execute(compiled_query.sql, compiled_query.params)
-            return cast(Sequence[Sequence[Any]], self._shape_rows(cursor.fetchall(), cursor.description))
+            return self._shape_rows(cursor.fetchall(), cursor.description)
         finally:
             self._release_connection(conn, release_mode)
 
     def fetch_one(self, query: CompiledQuery | ASTNode) -> Sequence[Any] | None:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="fetch_one",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._fetch_one_observed(compiled_query),
+            "fetch_one",
+            compiled_query.sql,
+            compiled_query.params,
+            self._fetch_one_observed,
+            compiled_query,
         )
 
     def _fetch_one_observed(self, compiled_query: CompiledQuery) -> Sequence[Any] | None:
         conn, release_mode = self._get_connection_for_query()
         try:
             cursor = conn.execute(compiled_query.sql, compiled_query.params)
-            return cast(Sequence[Any] | None, self._shape_single_row(cursor.fetchone(), cursor.description))
+            return self._shape_single_row(cursor.fetchone(), cursor.description)
         finally:
             self._release_connection(conn, release_mode)
 
@@ -197,10 +196,12 @@ class DuckDbExecutor(Executor):
         if not param_sets:
             return
         self._observe_query(
-            operation="execute_many",
-            sql=sql,
-            params=param_sets[0],
-            run=lambda: self._execute_many_observed(sql, param_sets),
+            "execute_many",
+            sql,
+            param_sets[0],
+            self._execute_many_observed,
+            sql,
+            param_sets,
         )
 
     def _execute_many_observed(self, sql: str, param_sets: Sequence[Sequence[Any]]) -> None:
@@ -216,10 +217,12 @@ class DuckDbExecutor(Executor):
         self._enforce_execute_raw_policy(sql=sql, trusted=trusted)
         sql, params = self._normalize_sql_params(sql, params)
         self._observe_query(
-            operation="execute_raw",
-            sql=sql,
-            params=params,
-            run=lambda: self._execute_raw_observed(sql, params),
+            "execute_raw",
+            sql,
+            params,
+            self._execute_raw_observed,
+            sql,
+            params,
         )
 
     def _execute_raw_observed(self, sql: str, params: Sequence[Any] | Mapping[str, Any] | None = None) -> None:
@@ -246,15 +249,11 @@ class DuckDbExecutor(Executor):
             self._transaction_connection = self.connection
             self._transaction_release_mode = None
         elif self.connection_settings.acquire_connection is not None:
-            self._emit_event("connection.acquire.start", success=True)
-            self._transaction_connection = self.connection_settings.acquire_connection()
+            self._transaction_connection = self._acquire_observed(self.connection_settings.acquire_connection)
             self._transaction_release_mode = "release"
-            self._emit_event("connection.acquire.end", success=True, connection_id=str(id(self._transaction_connection)))
         else:
-            self._emit_event("connection.acquire.start", success=True)
-            self._transaction_connection = self._connect()
+            self._transaction_connection = self._acquire_observed(self._connect)
             self._transaction_release_mode = "close"
-            self._emit_event("connection.acquire.end", success=True, connection_id=str(id(self._transaction_connection)))
 
         if normalized:
             self._transaction_connection.execute(f"BEGIN {normalized}")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Any
 
@@ -78,6 +79,52 @@ class ProgrammingExecutionError(ExecutionError):
     pass
 
 
+# Classification tables are built once at import. Earlier entries win: a message
+# naming a deadlock outranks a lock-timeout SQLSTATE, and so on down the list.
+_ERROR_PRIORITY: tuple[type[ExecutionError], ...] = (
+    DeadlockError,
+    SerializationError,
+    LockTimeoutError,
+    ConnectionTimeoutError,
+    IntegrityConstraintError,
+    ProgrammingExecutionError,
+)
+_ERROR_RANK: dict[type[ExecutionError], int] = {error_type: rank for rank, error_type in enumerate(_ERROR_PRIORITY)}
+
+_SQLSTATE_EXACT: dict[str, type[ExecutionError]] = {
+    "40P01": DeadlockError,
+    "1213": DeadlockError,
+    "40001": SerializationError,
+    "55P03": LockTimeoutError,
+    "57014": LockTimeoutError,
+    "1205": LockTimeoutError,
+}
+
+_SQLSTATE_CLASS: dict[str, type[ExecutionError]] = {
+    "23": IntegrityConstraintError,
+    "42": ProgrammingExecutionError,
+}
+
+_MESSAGE_RE = re.compile(
+    r"(?P<deadlock>deadlock)"
+    r"|(?P<serialization>serialization failure|could not serialize)"
+    r"|(?P<lock_timeout>lock wait timeout|database is locked|lock timeout)"
+    r"|(?P<connection_timeout>timed out|login timeout|could not connect|connection refused)"
+    r"|(?P<integrity>unique constraint|foreign key constraint|duplicate key)"
+    r"|(?P<programming>syntax error|invalid identifier|unknown column)",
+    re.IGNORECASE,
+)
+
+_MESSAGE_GROUP_ERRORS: dict[str, type[ExecutionError]] = {
+    "deadlock": DeadlockError,
+    "serialization": SerializationError,
+    "lock_timeout": LockTimeoutError,
+    "connection_timeout": ConnectionTimeoutError,
+    "integrity": IntegrityConstraintError,
+    "programming": ProgrammingExecutionError,
+}
+
+
 def _extract_sqlstate(exc: Exception) -> str | None:
     sqlstate = getattr(exc, "sqlstate", None)
     if isinstance(sqlstate, str) and sqlstate:
@@ -94,6 +141,25 @@ def _extract_sqlstate(exc: Exception) -> str | None:
     return None
 
 
+def _classify_error(sqlstate: str | None, message: str) -> type[ExecutionError]:
+    # O(1) SQLSTATE lookups, then one regex pass; the best-ranked match wins.
+    error_type: type[ExecutionError] = ExecutionError
+    rank = len(_ERROR_PRIORITY)
+    if sqlstate is not None:
+        state_error = _SQLSTATE_EXACT.get(sqlstate) or _SQLSTATE_CLASS.get(sqlstate[:2])
+        if state_error is not None:
+            error_type = state_error
+            rank = _ERROR_RANK[state_error]
+    for match in _MESSAGE_RE.finditer(message):
+        message_error = _MESSAGE_GROUP_ERRORS[match.lastgroup or ""]
+        if _ERROR_RANK[message_error] < rank:
+            error_type = message_error
+            rank = _ERROR_RANK[message_error]
+            if rank == 0:
+                break
+    return error_type
+
+
 def normalize_execution_error(
     *,
     dialect: str,
@@ -105,52 +171,12 @@ def normalize_execution_error(
     Maps driver exceptions to a normalized execution error taxonomy.
     """
     sqlstate = _extract_sqlstate(exc)
-    message = str(exc).lower()
+    message = str(exc)
     details = ExecutionErrorDetails(
         dialect=dialect,
         operation=operation,
         sqlstate=sqlstate,
         sql=_redact_sql(sql),
-        original_message=str(exc),
+        original_message=message,
     )
-
-    deadlock_states = {"40P01", "1213"}
-    serialization_states = {"40001"}
-    lock_timeout_states = {"55P03", "57014", "1205"}
-    integrity_prefixes = {"23"}
-    programming_prefixes = {"42"}
-
-    if sqlstate in deadlock_states or "deadlock" in message:
-        return DeadlockError(details, exc)
-
-    if sqlstate in serialization_states or "serialization failure" in message or "could not serialize" in message:
-        return SerializationError(details, exc)
-
-    if (
-        sqlstate in lock_timeout_states
-        or "lock wait timeout" in message
-        or "database is locked" in message
-        or "lock timeout" in message
-    ):
-        return LockTimeoutError(details, exc)
-
-    if (
-        "connection timed out" in message
-        or "timed out" in message
-        or "login timeout" in message
-        or "could not connect" in message
-        or "connection refused" in message
-    ):
-        return ConnectionTimeoutError(details, exc)
-
-    if sqlstate and sqlstate[:2] in integrity_prefixes:
-        return IntegrityConstraintError(details, exc)
-    if "unique constraint" in message or "foreign key constraint" in message or "duplicate key" in message:
-        return IntegrityConstraintError(details, exc)
-
-    if sqlstate and sqlstate[:2] in programming_prefixes:
-        return ProgrammingExecutionError(details, exc)
-    if "syntax error" in message or "invalid identifier" in message or "unknown column" in message:
-        return ProgrammingExecutionError(details, exc)
-
-    return ExecutionError(details, exc)
+    return _classify_error(sqlstate, message)(details, exc)
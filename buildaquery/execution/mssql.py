@@ -1,5 +1,5 @@
 import importlib
-from typing import Any, Mapping, Sequence, cast
+from typing import Any, Mapping, Sequence
 from urllib.parse import parse_qs, unquote, urlparse
 import time
 from uuid import uuid4
@@ -72,6 +72,8 @@ class MsSqlExecutor(Executor):
         self._transaction_started_at: float | None = None
 
     def _compile_if_needed(self, query: CompiledQuery | ASTNode) -> CompiledQuery:
+        if type(query) is CompiledQuery:
+            return self._normalize_compiled_query(query)
         if isinstance(query, ASTNode):
             return self.compiler.compile(query)
         return self._normalize_compiled_query(query)
@@ -171,19 +173,18 @@ class MsSqlExecutor(Executor):
             return self._transaction_connection, None
         if self.connection is not None:
             return self.connection, None
+        if self._hold_connection:
+            return self._get_held_connection(), "hold"
         if self.connection_settings.acquire_connection is not None:
-            self._emit_event("connection.acquire.start", success=True)
-            conn = self.connection_settings.acquire_connection()
-            self._emit_event("connection.acquire.end", success=True, connection_id=str(id(conn)))
-            return conn, "release"
-        self._emit_event("connection.acquire.start", success=True)
-        conn = self._connect()
-        self._emit_event("connection.acquire.end", success=True, connection_id=str(id(conn)))
-        return conn, "close"
+            return self._acquire_observed(self.connection_settings.acquire_connection), "release"
+        return self._acquire_observed(self._connect), "close"
 
     def _release_connection(self, conn: Any, mode: str | None) -> None:
         if mode is None:
             return
+        if mode == "hold":
+            self._reset_held_connection(conn)
+            return
         if mode == "release":
             self._emit_event("connection.release", success=True, connection_id=str(id(conn)))
             if self.connection_settings.release_connection is not None:
@@ -204,10 +205,11 @@ class MsSqlExecutor(Executor):
     def execute(self, query: CompiledQuery | ASTNode) -> Any:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="execute",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._execute_observed(compiled_query),
+            "execute",
+            compiled_query.sql,
+            compiled_query.params,
+            self._execute_observed,
+            compiled_query,
         )
 
     def _execute_observed(self, compiled_query: CompiledQuery) -> Any:
@@ -223,10 +225,11 @@ class MsSqlExecutor(Executor):
     def fetch_all(self, query: CompiledQuery | ASTNode) -> Sequence[Sequence[Any]]:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="fetch_all",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._fetch_all_observed(compiled_query),
+            "fetch_all",
+            compiled_query.sql,
+            compiled_query.params,
+            self._fetch_all_observed,
+            compiled_query,
         )
 
     def _fetch_all_observed(self, compiled_query: CompiledQuery) -> Sequence[Sequence[Any]]:
@@ -235,7 +238,7 @@ class MsSqlExecutor(Executor):
             cursor = conn.cursor()
             try:
                 cursor.execute(compiled_query.sql, compiled_query.params)
-                return cast(Sequence[Sequence[Any]], self._shape_rows(cursor.fetchall(), cursor.description))
+                return self._shape_rows(cursor.fetchall(), cursor.description)
             finally:
                 cursor.close()
         finally:
@@ -244,10 +247,11 @@ class MsSqlExecutor(Executor):
     def fetch_one(self, query: CompiledQuery | ASTNode) -> Sequence[Any] | None:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="fetch_one",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._fetch_one_observed(compiled_query),
+            "fetch_one",
+            compiled_query.sql,
+            compiled_query.params,
+            self._fetch_one_observed,
+            compiled_query,
         )
 
     def _fetch_one_observed(self, compiled_query: CompiledQuery) -> Sequence[Any] | None:
@@ -256,7 +260,7 @@ class MsSqlExecutor(Executor):
             cursor = conn.cursor()
             try:
                 cursor.execute(compiled_query.sql, compiled_query.params)
-                return cast(Sequence[Any] | None, self._shape_single_row(cursor.fetchone(), cursor.description))
+                return self._shape_single_row(cursor.fetchone(), cursor.description)
             finally:
                 cursor.close()
         finally:
@@ -266,10 +270,12 @@ class MsSqlExecutor(Executor):
         if not param_sets:
             return
         self._observe_query(
-            operation="execute_many",
-            sql=sql,
-            params=param_sets[0],
-            run=lambda: self._execute_many_observed(sql, param_sets),
+            "execute_many",
+            sql,
+            param_sets[0],
+            self._execute_many_observed,
+            sql,
+            param_sets,
         )
 
     def _execute_many_observed(self, sql: str, param_sets: Sequence[Sequence[Any]]) -> None:
@@ -289,10 +295,12 @@ class MsSqlExecutor(Executor):
         self._enforce_execute_raw_policy(sql=sql, trusted=trusted)
         sql, params = self._normalize_sql_params(sql, params)
         self._observe_query(
-            operation="execute_raw",
-            sql=sql,
-            params=params,
-            run=lambda: self._execute_raw_observed(sql, params),
+            "execute_raw",
+            sql,
+            params,
+            self._execute_raw_observed,
+            sql,
+            params,
         )
 
     def _execute_raw_observed(self, sql: str, params: Sequence[Any] | Mapping[str, Any] | None = None) -> None:
@@ -316,24 +324,15 @@ class MsSqlExecutor(Executor):
         if self.connection is not None:
             self._transaction_connection = self.connection
             self._transaction_release_mode = None
+        elif self._hold_connection:
+            self._transaction_connection = self._get_held_connection()
+            self._transaction_release_mode = None
         elif self.connection_settings.acquire_connection is not None:
-            self._emit_event("connection.acquire.start", success=True)
-            self._transaction_connection = self.connection_settings.acquire_connection()
+            self._transaction_connection = self._acquire_observed(self.connection_settings.acquire_connection)
             self._transaction_release_mode = "release"
-            self._emit_event(
-                "connection.acquire.end",
-                success=True,
-                connection_id=str(id(self._transaction_connection)),
-            )
         else:
-            self._emit_event("connection.acquire.start", success=True)
-            self._transaction_connection = self._connect()
+            self._transaction_connection = self._acquire_observed(self._connect)
             self._transaction_release_mode = "close"
-            self._emit_event(
-                "connection.acquire.end",
-                success=True,
-                connection_id=str(id(self._transaction_connection)),
-            )
 
         if hasattr(self._transaction_connection, "autocommit"):
             self._transaction_previous_autocommit = bool(self._transaction_connection.autocommit)
@@ -431,4 +430,14 @@ class MsSqlExecutor(Executor):
             except Exception:
                 pass
             self._finalize_transaction()
+        self._hold_connection = False
+        self._release_held_connection()
         self._closed = True
+
+    def __enter__(self) -> "MsSqlExecutor":
+        """
+        Holds one connection for every call in the block; it is released when the block exits.
+        """
+        self._ensure_open()
+        self._hold_connection = True
+        return self
@@ -23,8 +23,14 @@ class ObservabilitySettings:
     event_observer: EventObserveHook | None = None
     metadata: Mapping[str, Any] = field(default_factory=dict)
 
+    def has_any_subscriber(self) -> bool:
+        """
+        Returns True when at least one query or event observer is configured.
+        """
+        return self.query_observer is not None or self.event_observer is not None
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class QueryObservation:
     """
     Structured query execution observation payload.
@@ -42,7 +48,7 @@ class QueryObservation:
     error_message: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionEvent:
     """
     Structured executor lifecycle event payload.
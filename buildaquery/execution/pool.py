@@ -0,0 +1,140 @@
+import threading
+import time
+from typing import Any, Callable
+
+# ==================================================
+# Connection Pool
+# ==================================================
+
+
+class ConnectionPool:
+    """
+    A thread-safe LIFO pool of driver connections for the acquire/release hooks.
+
+    Pass `acquire_connection=pool.acquire` and `release_connection=pool.release` to
+    any executor; one pool can be shared by several executors for the same database.
+    At most `max_size` connections are open at once, idle or checked out.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        max_size: int = 10,
+        acquire_timeout_seconds: float = 30.0,
+        idle_ttl_seconds: float | None = None,
+        pre_ping: Callable[[Any], Any] | None = None,
+        close_connection: Callable[[Any], Any] | None = None,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1.")
+        if acquire_timeout_seconds <= 0:
+            raise ValueError("acquire_timeout_seconds must be positive.")
+        if idle_ttl_seconds is not None and idle_ttl_seconds <= 0:
+            raise ValueError("idle_ttl_seconds must be positive when provided.")
+        self._connect = connect
+        self.max_size = max_size
+        self.acquire_timeout_seconds = acquire_timeout_seconds
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.pre_ping = pre_ping
+        self._close_connection = close_connection
+        # (connection, released_at) pairs; the end of the list is the most recently used handle.
+        self._idle: list[tuple[Any, float]] = []
+        # Connections currently open through this pool, idle or checked out.
+        self._open = 0
+        self._available = threading.Condition(threading.Lock())
+        self._closed = False
+
+    def acquire(self) -> Any:
+        """
+        Returns an idle connection, opens a new one below `max_size`, or waits for a release.
+        """
+        deadline: float | None = None
+        while True:
+            with self._available:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Connection pool is closed.")
+                    if self._idle:
+                        conn, released_at = self._idle.pop()
+                        break
+                    if self._open < self.max_size:
+                        self._open += 1
+                        conn = None
+                        break
+                    if deadline is None:
+                        deadline = time.monotonic() + self.acquire_timeout_seconds
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise RuntimeError(
+                            f"All {self.max_size} pooled connections are in use; none was returned "
+                            f"within {self.acquire_timeout_seconds} seconds."
+                        )
+                    self._available.wait(remaining)
+            if conn is None:
+                try:
+                    return self._connect()
+                except Exception:
+                    self._forget()
+                    raise
+            if self.idle_ttl_seconds is not None and time.monotonic() - released_at > self.idle_ttl_seconds:
+                self._discard(conn)
+                continue
+            if self.pre_ping is not None:
+                try:
+                    self.pre_ping(conn)
+                except Exception:
+                    self._discard(conn)
+                    continue
+            return conn
+
+    def release(self, conn: Any) -> None:
+        """
+        Returns a connection to the pool, closing it when the pool is closed.
+        """
+        # Reads on non-autocommit drivers leave a transaction open; never hand that on.
+        try:
+            conn.rollback()
+        except Exception:
+            self._discard(conn)
+            return
+        with self._available:
+            if not self._closed:
+                self._idle.append((conn, time.monotonic()))
+                self._available.notify()
+                return
+        self._discard(conn)
+
+    def close(self) -> None:
+        """
+        Closes every idle connection; connections released later are closed too.
+        """
+        with self._available:
+            self._closed = True
+            idle = self._idle
+            self._idle = []
+            self._available.notify_all()
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close()
+
+    def _discard(self, conn: Any) -> None:
+        try:
+            if self._close_connection is not None:
+                self._close_connection(conn)
+            else:
+                conn.close()
+        except Exception:
+            pass
+        self._forget()
+
+    def _forget(self) -> None:
+        # Frees one slot of max_size and wakes a waiter that can now open a connection.
+        with self._available:
+            self._open -= 1
+            self._available.notify()
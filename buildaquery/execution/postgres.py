@@ -1,4 +1,4 @@
-from typing import Any, Mapping, Sequence, cast
+from typing import Any, ClassVar, Iterator, Mapping, Sequence
 import time
 from uuid import uuid4
 
@@ -33,6 +33,9 @@ class PostgresExecutor(Executor):
         lock_skip_locked=True,
     )
 
+    # The driver module is process-wide, so the import is cached once per class.
+    _psycopg: ClassVar[Any] = None
+
     def __init__(
         self,
         connection_info: str | dict[str, Any] | None = None,
@@ -61,7 +64,6 @@ class PostgresExecutor(Executor):
         )
         self.observability_settings = observability_settings or ObservabilitySettings()
         self.raw_sql_policy = self._validate_raw_sql_policy(raw_sql_policy)
-        self._psycopg = None
         self._closed = False
         self._transaction_connection: Any | None = None
         self._transaction_release_mode: str | None = None
@@ -70,6 +72,8 @@ class PostgresExecutor(Executor):
         self._transaction_started_at: float | None = None
 
     def _compile_if_needed(self, query: CompiledQuery | ASTNode) -> CompiledQuery:
+        if type(query) is CompiledQuery:
+            return self._normalize_compiled_query(query)
         if isinstance(query, ASTNode):
             return self.compiler.compile(query)
         return self._normalize_compiled_query(query)
@@ -79,7 +83,7 @@ class PostgresExecutor(Executor):
             try:
                 import psycopg
 
-                self._psycopg = psycopg
+                type(self)._psycopg = psycopg
             except ImportError:
                 raise ImportError(
                     "The 'psycopg' library is required for PostgresExecutor. "
@@ -110,19 +114,18 @@ class PostgresExecutor(Executor):
             return self._transaction_connection, None
         if self.connection is not None:
             return self.connection, None
+        if self._hold_connection:
+            return self._get_held_connection(), "hold"
         if self.connection_settings.acquire_connection is not None:
-            self._emit_event("connection.acquire.start", success=True)
-            conn = self.connection_settings.acquire_connection()
-            self._emit_event("connection.acquire.end", success=True, connection_id=str(id(conn)))
-            return conn, "release"
-        self._emit_event("connection.acquire.start", success=True)
-        conn = self._connect()
-        self._emit_event("connection.acquire.end", success=True, connection_id=str(id(conn)))
-        return conn, "close"
+            return self._acquire_observed(self.connection_settings.acquire_connection), "release"
+        return self._acquire_observed(self._connect), "close"
 
     def _release_connection(self, conn: Any, mode: str | None) -> None:
         if mode is None:
             return
+        if mode == "hold":
+            self._reset_held_connection(conn)
+            return
         if mode == "release":
             self._emit_event("connection.release", success=True, connection_id=str(id(conn)))
             if self.connection_settings.release_connection is not None:
@@ -143,19 +146,24 @@ class PostgresExecutor(Executor):
     def execute(self, query: CompiledQuery | ASTNode) -> Any:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="execute",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._execute_observed(compiled_query),
+            "execute",
+            compiled_query.sql,
+            compiled_query.params,
+            self._execute_observed,
+            compiled_query,
         )
 
     def _execute_observed(self, compiled_query: CompiledQuery) -> Any:
         conn, release_mode = self._get_connection_for_query()
         try:
-            with conn.cursor() as cur:
-                cur.execute(compiled_query.sql, compiled_query.params)
+            # Connection.execute returns an open cursor; close it so cursors do not
+            # pile up on connections that outlive the call (pooled or held).
+            cur = conn.execute(compiled_query.sql, compiled_query.params)
+            try:
                 if cur.description:
                     return self._shape_rows(cur.fetchall(), cur.description)
+            finally:
+                cur.close()
         finally:
             if release_mode is not None:
                 if getattr(conn, "autocommit", False) is False:
@@ -165,47 +173,90 @@ class PostgresExecutor(Executor):
     def fetch_all(self, query: CompiledQuery | ASTNode) -> Sequence[Sequence[Any]]:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="fetch_all",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._fetch_all_observed(compiled_query),
+            "fetch_all",
+            compiled_query.sql,
+            compiled_query.params,
+            self._fetch_all_observed,
+            compiled_query,
         )
 
     def _fetch_all_observed(self, compiled_query: CompiledQuery) -> Sequence[Sequence[Any]]:
         conn, release_mode = self._get_connection_for_query()
         try:
-            with conn.cursor() as cur:
-                cur.execute(compiled_query.sql, compiled_query.params)
-                return cast(Sequence[Sequence[Any]], self._shape_rows(cur.fetchall(), cur.description))
+            cur = conn.execute(compiled_query.sql, compiled_query.params)
+            try:
+                return self._shape_rows(cur.fetchall(), cur.description)
+            finally:
+                cur.close()
         finally:
             self._release_connection(conn, release_mode)
 
     def fetch_one(self, query: CompiledQuery | ASTNode) -> Sequence[Any] | None:
         compiled_query = self._compile_if_needed(query)
         return self._observe_query(
-            operation="fetch_one",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._fetch_one_observed(compiled_query),
+            "fetch_one",
+            compiled_query.sql,
+            compiled_query.params,
+            self._fetch_one_observed,
+            compiled_query,
         )
 
     def _fetch_one_observed(self, compiled_query: CompiledQuery) -> Sequence[Any] | None:
         conn, release_mode = self._get_connection_for_query()
         try:
-            with conn.cursor() as cur:
-                cur.execute(compiled_query.sql, compiled_query.params)
-                return cast(Sequence[Any] | None, self._shape_single_row(cur.fetchone(), cur.description))
+            cur = conn.execute(compiled_query.sql, compiled_query.params)
+            try:
+                return self._shape_single_row(cur.fetchone(), cur.description)
+            finally:
+                cur.close()
         finally:
             self._release_connection(conn, release_mode)
 
+    def fetch_iter(self, query: CompiledQuery | ASTNode, chunk_size: int = 1000) -> Iterator[Any]:
+        """
+        Streams result rows through a server-side cursor in chunks of chunk_size rows.
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        compiled_query = self._compile_if_needed(query)
+        return self._fetch_iter_observed(compiled_query, chunk_size)
+
+    def _fetch_iter_observed(self, compiled_query: CompiledQuery, chunk_size: int) -> Iterator[Any]:
+        conn, release_mode = self._get_connection_for_query()
+        try:
+            # Cursors declared outside a transaction block must be WITH HOLD.
+            withhold = getattr(conn, "autocommit", False) is True
+            with conn.cursor(name=f"baq_{uuid4().hex}", withhold=withhold) as cur:
+                cur.itersize = chunk_size
+                self._observe_query(
+                    "fetch_iter",
+                    compiled_query.sql,
+                    compiled_query.params,
+                    cur.execute,
+                    compiled_query.sql,
+                    compiled_query.params,
+                )
+                while True:
+                    rows = cur.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield from self._shape_rows(rows, cur.description)
+        finally:
+            if release_mode is not None:
+                if getattr(conn, "autocommit", False) is False:
+                    conn.rollback()
+                self._release_connection(conn, release_mode)
+
     def execute_many(self, sql: str, param_sets: Sequence[Sequence[Any]]) -> None:
         if not param_sets:
             return
         self._observe_query(
-            operation="execute_many",
-            sql=sql,
-            params=param_sets[0],
-            run=lambda: self._execute_many_observed(sql, param_sets),
+            "execute_many",
+            sql,
+            param_sets[0],
+            self._execute_many_observed,
+            sql,
+            param_sets,
         )
 
     def _execute_many_observed(self, sql: str, param_sets: Sequence[Sequence[Any]]) -> None:
@@ -223,17 +274,18 @@ class PostgresExecutor(Executor):
         self._enforce_execute_raw_policy(sql=sql, trusted=trusted)
         sql, params = self._normalize_sql_params(sql, params)
         self._observe_query(
-            operation="execute_raw",
-            sql=sql,
-            params=params,
-            run=lambda: self._execute_raw_observed(sql, params),
+            "execute_raw",
+            sql,
+            params,
+            self._execute_raw_observed,
+            sql,
+            params,
         )
 
     def _execute_raw_observed(self, sql: str, params: Sequence[Any] | Mapping[str, Any] | None = None) -> None:
         conn, release_mode = self._get_connection_for_query()
         try:
-            with conn.cursor() as cur:
-                cur.execute(sql, params)
+            conn.execute(sql, params).close()
         finally:
             if release_mode is not None:
                 if getattr(conn, "autocommit", False) is False:
@@ -248,24 +300,15 @@ class PostgresExecutor(Executor):
         if self.connection is not None:
             self._transaction_connection = self.connection
             self._transaction_release_mode = None
+        elif self._hold_connection:
+            self._transaction_connection = self._get_held_connection()
+            self._transaction_release_mode = None
         elif self.connection_settings.acquire_connection is not None:
-            self._emit_event("connection.acquire.start", success=True)
-            self._transaction_connection = self.connection_settings.acquire_connection()
+            self._transaction_connection = self._acquire_observed(self.connection_settings.acquire_connection)
             self._transaction_release_mode = "release"
-            self._emit_event(
-                "connection.acquire.end",
-                success=True,
-                connection_id=str(id(self._transaction_connection)),
-            )
         else:
-            self._emit_event("connection.acquire.start", success=True)
-            self._transaction_connection = self._connect()
+            self._transaction_connection = self._acquire_observed(self._connect)
             self._transaction_release_mode = "close"
-            self._emit_event(
-                "connection.acquire.end",
-                success=True,
-                connection_id=str(id(self._transaction_connection)),
-            )
 
         if hasattr(self._transaction_connection, "autocommit"):
             self._transaction_previous_autocommit = self._transaction_connection.autocommit
@@ -356,4 +399,14 @@ class PostgresExecutor(Executor):
             except Exception:
                 pass
             self._finalize_transaction()
+        self._hold_connection = False
+        self._release_held_connection()
         self._closed = True
+
+    def __enter__(self) -> "PostgresExecutor":
+        """
+        Holds one connection for every call in the block; it is released when the block exits.
+        """
+        self._ensure_open()
+        self._hold_connection = True
+        return self
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import time
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, TypeVar, cast
 
 from buildaquery.execution.errors import ExecutionError, TransientExecutionError
 
 T = TypeVar("T")
+C = TypeVar("C")
 
 
 # ==================================================
@@ -24,6 +25,9 @@ class RetryPolicy:
     base_delay_seconds: float = 0.05
     max_delay_seconds: float = 1.0
     backoff_multiplier: float = 2.0
+    first_retry_immediate: bool = True
+    _delays: tuple[float, ...] = field(default=(), init=False, repr=False, compare=False)
+    _delays_key: tuple[float, float, float, int] | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.max_attempts < 1:
@@ -34,25 +38,89 @@ class RetryPolicy:
             raise ValueError("max_delay_seconds must be >= 0")
         if self.backoff_multiplier < 1:
             raise ValueError("backoff_multiplier must be >= 1")
+        _delay_table(self)
+
+
+def _delay_table(policy: RetryPolicy) -> tuple[float, ...]:
+    # The policy is mutable, so the table is keyed on the fields it derives from
+    # and rebuilt whenever one of them has changed since the last lookup.
+    key = (policy.base_delay_seconds, policy.max_delay_seconds, policy.backoff_multiplier, policy.max_attempts)
+    if policy._delays_key != key:
+        policy._delays = _build_delay_table(policy)
+        policy._delays_key = key
+    return policy._delays
+
+
+def _build_delay_table(policy: RetryPolicy) -> tuple[float, ...]:
+    delays: list[float] = []
+    for step in range(policy.max_attempts):
+        try:
+            delay = policy.base_delay_seconds * (policy.backoff_multiplier**step)
+        except OverflowError:
+            break
+        if delay >= policy.max_delay_seconds:
+            delays.append(policy.max_delay_seconds)
+            break
+        delays.append(delay)
+    return tuple(delays)
 
 
 def _compute_delay(policy: RetryPolicy, attempt: int) -> float:
+    if policy.first_retry_immediate:
+        if attempt == 1:
+            return 0.0
+        attempt -= 1
+    delays = _delay_table(policy)
+    if attempt <= len(delays):
+        return delays[attempt - 1]
+    if delays and delays[-1] == policy.max_delay_seconds:
+        return policy.max_delay_seconds
     delay = policy.base_delay_seconds * (policy.backoff_multiplier ** (attempt - 1))
     return min(delay, policy.max_delay_seconds)
 
 
 def run_with_retry(
     *,
-    operation: Callable[[], T],
+    operation: Callable[[], T] | Callable[[C], T],
     normalize_error: Callable[[Exception], ExecutionError],
     policy: RetryPolicy,
     sleep_fn: Callable[[float], Any] = time.sleep,
     on_retry: Callable[[ExecutionError, int, float], Any] | None = None,
     on_giveup: Callable[[ExecutionError, int], Any] | None = None,
+    setup: Callable[[], C] | None = None,
+    teardown: Callable[[C], Any] | None = None,
 ) -> T:
     """
     Runs an operation with transient-failure retry handling.
+
+    When `setup` is given it runs once before the first attempt and its result
+    is passed to `operation(ctx)` on every attempt, so a resource such as a
+    pooled connection is shared across retries. `teardown(ctx)` runs once after
+    the final attempt, whether it succeeded or not.
     """
+    if setup is None:
+        return _retry_loop(
+            cast(Callable[[], T], operation), normalize_error, policy, sleep_fn, on_retry, on_giveup
+        )
+    ctx = setup()
+    bound_operation = cast(Callable[[C], T], operation)
+    try:
+        return _retry_loop(
+            lambda: bound_operation(ctx), normalize_error, policy, sleep_fn, on_retry, on_giveup
+        )
+    finally:
+        if teardown is not None:
+            teardown(ctx)
+
+
+def _retry_loop(
+    operation: Callable[[], T],
+    normalize_error: Callable[[Exception], ExecutionError],
+    policy: RetryPolicy,
+    sleep_fn: Callable[[float], Any],
+    on_retry: Callable[[ExecutionError, int, float], Any] | None,
+    on_giveup: Callable[[ExecutionError, int], Any] | None,
+) -> T:
     attempt = 1
     while True:
         try:
@@ -1,19 +1,98 @@
-from typing import Any, Mapping, Sequence, cast
+from functools import lru_cache
+from itertools import chain, groupby, islice
+from typing import Any, Callable, ClassVar, Iterable, Literal, Mapping, NamedTuple, Sequence, cast
 import time
 from uuid import uuid4
 
 from buildaquery.abstract_syntax_tree.models import ASTNode
 from buildaquery.compiler.compiled_query import CompiledQuery
+from buildaquery.compiler.identifier_validation import validate_identifier
 from buildaquery.compiler.sqlite.sqlite_compiler import SqliteCompiler
 from buildaquery.execution.capabilities import ExecutorCapabilities
 from buildaquery.execution.base import Executor, RawSqlPolicy
 from buildaquery.execution.connection import ConnectionAcquireHook, ConnectionReleaseHook, ConnectionSettings
 from buildaquery.execution.observability import ObservabilitySettings
+from buildaquery.execution.pool import ConnectionPool
 
 # ==================================================
 # SQLite Executor
 # ==================================================
 
+SqlitePerformanceProfile = Literal["safe", "fast", "bulk"]
+
+# Applied to every connection the executor opens itself. "safe" keeps SQLite's
+# defaults; "fast" trades durability of the last commits on power loss for WAL
+# concurrency; "bulk" also spends memory on cache, temp storage, and mmap.
+_PERFORMANCE_PRAGMAS: dict[str, tuple[str, ...]] = {
+    "safe": (),
+    "fast": (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+    ),
+    "bulk": (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-64000",
+        "PRAGMA mmap_size=268435456",
+    ),
+}
+
+@lru_cache(maxsize=128)
+def _savepoint_sql(command: str, name: str) -> str:
+    # Savepoint names cannot be bound as parameters, so they are allowlisted instead.
+    validate_identifier(name, kind="savepoint name")
+    return f"{command} {name}"
+
+
+class _SqliteTransaction(NamedTuple):
+    connection: Any
+    release_mode: str | None
+    # Both are None when the transaction began with no observer subscribed.
+    transaction_id: str | None
+    started_at: float | None
+
+
+class _SqliteBatchContext:
+    """
+    Context manager that queues writes and submits them as one transaction on exit.
+    """
+
+    def __init__(self, executor: "SqliteExecutor") -> None:
+        self._executor = executor
+
+    def __enter__(self) -> "SqliteExecutor":
+        self._executor._start_batch()
+        return self._executor
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        _ = exc
+        _ = tb
+        statements = self._executor._end_batch()
+        if exc_type is None:
+            self._executor._flush_batch(statements)
+        return False
+
+
+def _is_select(sql: str) -> bool:
+    return sql.lstrip()[:6].upper() == "SELECT"
+
+
+# sqlite3 only accepts these leading keywords in executemany.
+_DML_KEYWORDS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+def _is_dml(sql: str) -> bool:
+    return sql.lstrip()[:7].upper().startswith(_DML_KEYWORDS)
+
+
+def _is_param_set_batch(params: Any) -> bool:
+    return (
+        isinstance(params, (list, tuple))
+        and len(params) > 0
+        and isinstance(params[0], (list, tuple))
+    )
+
 
 class SqliteExecutor(Executor):
     """
@@ -33,6 +112,9 @@ class SqliteExecutor(Executor):
         lock_skip_locked=False,
     )
 
+    # The driver module is process-wide, so the import is cached once per class.
+    _sqlite3: ClassVar[Any] = None
+
     def __init__(
         self,
         connection_info: str | None = None,
@@ -45,9 +127,34 @@ class SqliteExecutor(Executor):
         release_connection: ConnectionReleaseHook | None = None,
         observability_settings: ObservabilitySettings | None = None,
         raw_sql_policy: RawSqlPolicy = "allow",
+        statement_cache_size: int | None = None,
+        batch_size: int = 1000,
+        pool_size: int = 5,
+        pool_timeout_seconds: float = 30.0,
+        performance_profile: SqlitePerformanceProfile = "safe",
+        read_replicas: int = 0,
     ) -> None:
         if connection_info is None and connection is None and acquire_connection is None:
             raise ValueError("Provide connection_info, connection, or acquire_connection.")
+        if statement_cache_size is not None and statement_cache_size < 0:
+            raise ValueError("statement_cache_size must be >= 0")
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if pool_size < 1:
+            raise ValueError("pool_size must be >= 1")
+        if pool_timeout_seconds <= 0:
+            raise ValueError("pool_timeout_seconds must be > 0")
+        if read_replicas < 0:
+            raise ValueError("read_replicas must be >= 0")
+        if read_replicas and (
+            connection is not None or acquire_connection is not None or connection_info == ":memory:"
+        ):
+            raise ValueError("read_replicas requires a file-backed connection_info.")
+        if performance_profile not in _PERFORMANCE_PRAGMAS:
+            raise ValueError(
+                f"Invalid performance_profile {performance_profile!r}. "
+                f"Expected one of: {', '.join(_PERFORMANCE_PRAGMAS)}"
+            )
 
         self.connection_info = connection_info
         self.connection = connection
@@ -61,14 +168,32 @@ class SqliteExecutor(Executor):
         )
         self.observability_settings = observability_settings or ObservabilitySettings()
         self.raw_sql_policy = self._validate_raw_sql_policy(raw_sql_policy)
-        self._sqlite3 = None
+        self.statement_cache_size = statement_cache_size
+        self.batch_size = batch_size
+        self.performance_profile = performance_profile
         self._closed = False
-        self._transaction_connection: Any | None = None
-        self._transaction_release_mode: str | None = None
-        self._transaction_id: str | None = None
-        self._transaction_started_at: float | None = None
+        self._tx: _SqliteTransaction | None = None
+        self._batch_statements: list[tuple[str, Sequence[Any]]] | None = None
+        # Handles are opened lazily; every pooled ":memory:" handle would be a separate database.
+        self._pool = ConnectionPool(
+            self._open_pooled_connection,
+            max_size=1 if connection_info == ":memory:" else pool_size,
+            acquire_timeout_seconds=pool_timeout_seconds,
+            close_connection=self._close_pooled_connection,
+        )
+        # Read-only handles for SELECTs outside a transaction; writes keep using _pool.
+        self._readers: ConnectionPool | None = None
+        if read_replicas:
+            self._readers = ConnectionPool(
+                self._open_reader_connection,
+                max_size=read_replicas,
+                acquire_timeout_seconds=pool_timeout_seconds,
+                close_connection=self._close_pooled_connection,
+            )
 
     def _compile_if_needed(self, query: CompiledQuery | ASTNode) -> CompiledQuery:
+        if type(query) is CompiledQuery:
+            return self._normalize_compiled_query(query)
         if isinstance(query, ASTNode):
             return self.compiler.compile(query)
         return self._normalize_compiled_query(query)
@@ -77,164 +202,419 @@ class SqliteExecutor(Executor):
         if self._sqlite3 is None:
             import sqlite3
 
-            self._sqlite3 = sqlite3
+            type(self)._sqlite3 = sqlite3
         return self._sqlite3
 
     def _ensure_open(self) -> None:
         if self._closed:
             raise RuntimeError("Executor is closed.")
 
-    def _connect(self) -> Any:
+    def _connect(self, **kwargs: Any) -> Any:
         sqlite3 = self._get_sqlite3()
         timeout = self.connection_settings.connect_timeout_seconds
-        if timeout is None:
-            return sqlite3.connect(self.connection_info)
-        return sqlite3.connect(self.connection_info, timeout=timeout)
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+        # sqlite3 keeps an LRU of prepared statements per connection keyed by SQL
+        # text; it pays off because pooled connections outlive each call.
+        if self.statement_cache_size is not None:
+            kwargs["cached_statements"] = self.statement_cache_size
+        conn = sqlite3.connect(self.connection_info, **kwargs)
+        for pragma in _PERFORMANCE_PRAGMAS[self.performance_profile]:
+            conn.execute(pragma)
+        return conn
+
+    def _open_pooled_connection(self) -> Any:
+        return self._acquire_observed(lambda: self._connect(check_same_thread=False))
+
+    def _close_pooled_connection(self, conn: Any) -> None:
+        self._emit_event("connection.close", success=True, connection_id=str(id(conn)))
+        conn.close()
+
+    def _open_reader_connection(self) -> Any:
+        conn = self._open_pooled_connection()
+        conn.execute("PRAGMA query_only=1")
+        return conn
 
     def _execute_with_connection(self, connection: Any, compiled_query: CompiledQuery) -> Any:
         cur = connection.execute(compiled_query.sql, compiled_query.params)
+        if compiled_query.returns_rows is False:
+            return None
         if cur.description:
             return self._shape_rows(cur.fetchall(), cur.description)
         return None
 
     def _has_active_transaction(self) -> bool:
-        return self._transaction_connection is not None
+        return self._tx is not None
 
     def _get_connection_for_query(self) -> tuple[Any, str | None]:
         self._ensure_open()
-        if self._transaction_connection is not None:
-            return self._transaction_connection, None
+        tx = self._tx
+        if tx is not None:
+            return tx.connection, None
         if self.connection is not None:
             return self.connection, None
         if self.connection_settings.acquire_connection is not None:
-            self._emit_event("connection.acquire.start", success=True)
-            conn = self.connection_settings.acquire_connection()
-            self._emit_event(
-                "connection.acquire.end",
-                success=True,
-                connection_id=str(id(conn)),
-            )
-            return conn, "release"
-        self._emit_event("connection.acquire.start", success=True)
-        conn = self._connect()
-        self._emit_event(
-            "connection.acquire.end",
-            success=True,
-            connection_id=str(id(conn)),
-        )
-        return conn, "close"
+            return self._acquire_observed(self.connection_settings.acquire_connection), "release"
+        return self._pool.acquire(), "pool"
+
+    def _get_connection_for_read(self, sql: str) -> tuple[Any, str | None]:
+        readers = self._readers
+        if readers is None or self._tx is not None or not _is_select(sql):
+            return self._get_connection_for_query()
+        return readers.acquire(), "reader"
 
     def _release_connection(self, conn: Any, mode: str | None) -> None:
         if mode is None:
             return
+        if mode == "pool":
+            self._pool.release(conn)
+            return
+        if mode == "reader" and self._readers is not None:
+            self._readers.release(conn)
+            return
         if mode == "release":
             self._emit_event("connection.release", success=True, connection_id=str(id(conn)))
             if self.connection_settings.release_connection is not None:
                 self.connection_settings.release_connection(conn)
                 return
             conn.close()
-            return
-        if mode == "close":
-            self._emit_event("connection.close", success=True, connection_id=str(id(conn)))
-            conn.close()
 
-    def _require_active_transaction_connection(self) -> Any:
+    def _require_active_transaction(self) -> _SqliteTransaction:
         self._ensure_open()
-        if self._transaction_connection is None:
+        tx = self._tx
+        if tx is None:
             raise RuntimeError("No active transaction. Call begin() first.")
-        return self._transaction_connection
+        return tx
 
     def execute(self, query: CompiledQuery | ASTNode) -> Any:
         compiled_query = self._compile_if_needed(query)
+        if self._batch_statements is not None:
+            returns_rows = compiled_query.returns_rows
+            if returns_rows or (returns_rows is None and _is_select(compiled_query.sql)):
+                self._reject_rows_in_batch()
+            self._batch_statements.append((compiled_query.sql, compiled_query.params))
+            return None
+        if not self._observability_enabled:
+            return self._execute_observed(compiled_query)
         return self._observe_query(
-            operation="execute",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._execute_observed(compiled_query),
+            "execute",
+            compiled_query.sql,
+            compiled_query.params,
+            self._execute_observed,
+            compiled_query,
         )
 
     def _execute_observed(self, compiled_query: CompiledQuery) -> Any:
         conn, release_mode = self._get_connection_for_query()
         try:
             result = self._execute_with_connection(conn, compiled_query)
-            if release_mode is not None:
+            # Only writes open an implicit transaction; plain SELECTs skip the COMMIT.
+            if release_mode is not None and getattr(conn, "in_transaction", True):
                 conn.commit()
             return result
         finally:
             self._release_connection(conn, release_mode)
 
+    def execute_void(self, query: CompiledQuery | ASTNode) -> None:
+        """
+        Executes a statement and discards its result without inspecting the cursor.
+        """
+        compiled_query = self._compile_if_needed(query)
+        if self._batch_statements is not None:
+            self._batch_statements.append((compiled_query.sql, compiled_query.params))
+            return
+        if not self._observability_enabled:
+            self._execute_void_observed(compiled_query)
+            return
+        self._observe_query(
+            "execute_void",
+            compiled_query.sql,
+            compiled_query.params,
+            self._execute_void_observed,
+            compiled_query,
+        )
+
+    def _execute_void_observed(self, compiled_query: CompiledQuery) -> None:
+        conn, release_mode = self._get_connection_for_query()
+        try:
+            conn.execute(compiled_query.sql, compiled_query.params)
+            if release_mode is not None and getattr(conn, "in_transaction", True):
+                conn.commit()
+        finally:
+            self._release_connection(conn, release_mode)
+
     def fetch_all(self, query: CompiledQuery | ASTNode) -> Sequence[Sequence[Any]]:
         compiled_query = self._compile_if_needed(query)
+        if not self._observability_enabled:
+            return self._fetch_all_observed(compiled_query)
         return self._observe_query(
-            operation="fetch_all",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._fetch_all_observed(compiled_query),
+            "fetch_all",
+            compiled_query.sql,
+            compiled_query.params,
+            self._fetch_all_observed,
+            compiled_query,
         )
 
     def _fetch_all_observed(self, compiled_query: CompiledQuery) -> Sequence[Sequence[Any]]:
-        conn, release_mode = self._get_connection_for_query()
+        conn, release_mode = self._get_connection_for_read(compiled_query.sql)
         try:
             cur = conn.execute(compiled_query.sql, compiled_query.params)
-            return cast(Sequence[Sequence[Any]], self._shape_rows(cur.fetchall(), cur.description))
+            return self._shape_rows(cur.fetchall(), cur.description)
         finally:
             self._release_connection(conn, release_mode)
 
     def fetch_one(self, query: CompiledQuery | ASTNode) -> Sequence[Any] | None:
         compiled_query = self._compile_if_needed(query)
+        if not self._observability_enabled:
+            return self._fetch_one_observed(compiled_query)
         return self._observe_query(
-            operation="fetch_one",
-            sql=compiled_query.sql,
-            params=compiled_query.params,
-            run=lambda: self._fetch_one_observed(compiled_query),
+            "fetch_one",
+            compiled_query.sql,
+            compiled_query.params,
+            self._fetch_one_observed,
+            compiled_query,
         )
 
     def _fetch_one_observed(self, compiled_query: CompiledQuery) -> Sequence[Any] | None:
-        conn, release_mode = self._get_connection_for_query()
+        conn, release_mode = self._get_connection_for_read(compiled_query.sql)
         try:
             cur = conn.execute(compiled_query.sql, compiled_query.params)
-            return cast(Sequence[Any] | None, self._shape_single_row(cur.fetchone(), cur.description))
+            return self._shape_single_row(cur.fetchone(), cur.description)
         finally:
             self._release_connection(conn, release_mode)
 
-    def execute_many(self, sql: str, param_sets: Sequence[Sequence[Any]]) -> None:
-        if not param_sets:
+    def execute_many(self, sql: str, param_sets: Iterable[Sequence[Any]]) -> None:
+        if isinstance(param_sets, (list, tuple)):
+            if not param_sets:
+                return
+            first = param_sets[0]
+        else:
+            # Iterators are streamed to sqlite3 in batch_size chunks; peek the
+            # first row for observability without consuming it.
+            rows = iter(param_sets)
+            try:
+                first = next(rows)
+            except StopIteration:
+                return
+            param_sets = chain((first,), rows)
+        if self._batch_statements is not None:
+            self._batch_statements.extend((sql, params) for params in param_sets)
+            return
+        if not self._observability_enabled:
+            self._execute_many_observed(sql, param_sets)
             return
         self._observe_query(
-            operation="execute_many",
-            sql=sql,
-            params=param_sets[0],
-            run=lambda: self._execute_many_observed(sql, param_sets),
+            "execute_many",
+            sql,
+            first,
+            self._execute_many_observed,
+            sql,
+            param_sets,
         )
 
-    def _execute_many_observed(self, sql: str, param_sets: Sequence[Sequence[Any]]) -> None:
+    def _execute_many_observed(self, sql: str, param_sets: Iterable[Sequence[Any]]) -> None:
         conn, release_mode = self._get_connection_for_query()
         try:
-            conn.executemany(sql, param_sets)
-            if release_mode is not None:
-                conn.commit()
+            if release_mode is None:
+                self._executemany_chunked(conn, sql, param_sets)
+                return
+            # Pooled connection: take the write lock up front so the whole batch
+            # commits once instead of racing concurrent writers per statement.
+            if not getattr(conn, "in_transaction", False):
+                conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._executemany_chunked(conn, sql, param_sets)
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
         finally:
             self._release_connection(conn, release_mode)
 
-    def execute_raw(self, sql: str, params: Sequence[Any] | Mapping[str, Any] | None = None, *, trusted: bool = False) -> None:
+    def _executemany_chunked(self, conn: Any, sql: str, param_sets: Iterable[Sequence[Any]]) -> None:
+        batch_size = self.batch_size
+        if isinstance(param_sets, (list, tuple)) and len(param_sets) <= batch_size:
+            conn.executemany(sql, param_sets)
+            return
+        # One cursor serves every chunk instead of a throwaway cursor per executemany.
+        cur = conn.cursor()
+        try:
+            rows = iter(param_sets)
+            while True:
+                chunk = list(islice(rows, batch_size))
+                if not chunk:
+                    return
+                cur.executemany(sql, chunk)
+        finally:
+            cur.close()
+
+    def execute_raw(
+        self,
+        sql: str,
+        params: Sequence[Any] | Sequence[Sequence[Any]] | Mapping[str, Any] | None = None,
+        *,
+        trusted: bool = False,
+    ) -> None:
         self._enforce_execute_raw_policy(sql=sql, trusted=trusted)
-        sql, params = self._normalize_sql_params(sql, params)
+        if self._batch_statements is not None and _is_select(sql):
+            self._reject_rows_in_batch()
+        # A sequence of row sequences runs through executemany in one transaction;
+        # a flat sequence such as (1, 2, 3) is still bound as a single row.
+        if _is_param_set_batch(params):
+            param_sets = cast(Sequence[Sequence[Any]], params)
+            if self._batch_statements is not None:
+                self._batch_statements.extend((sql, row) for row in param_sets)
+                return
+            if not self._observability_enabled:
+                self._execute_many_observed(sql, param_sets)
+                return
+            self._observe_query(
+                "execute_raw",
+                sql,
+                param_sets[0],
+                self._execute_many_observed,
+                sql,
+                param_sets,
+            )
+            return
+        sql, params = self._normalize_sql_params(sql, cast(Sequence[Any] | Mapping[str, Any] | None, params))
+        if self._batch_statements is not None:
+            self._batch_statements.append((sql, [] if params is None else params))
+            return
+        if not self._observability_enabled:
+            self._execute_raw_observed(sql, params)
+            return
         self._observe_query(
-            operation="execute_raw",
-            sql=sql,
-            params=params,
-            run=lambda: self._execute_raw_observed(sql, params),
+            "execute_raw",
+            sql,
+            params,
+            self._execute_raw_observed,
+            sql,
+            params,
         )
 
     def _execute_raw_observed(self, sql: str, params: Sequence[Any] | Mapping[str, Any] | None = None) -> None:
         conn, release_mode = self._get_connection_for_query()
         try:
-            conn.execute(sql, params or [])
-            if release_mode is not None:
+            if params is not None:
+                conn.execute(sql, params)
+            else:
+                conn.execute(sql)
+            if release_mode is not None and getattr(conn, "in_transaction", True):
                 conn.commit()
         finally:
             self._release_connection(conn, release_mode)
 
+    def execute_raw_many(self, statements: Sequence[str], *, trusted: bool = False) -> None:
+        """
+        Executes several parameterless raw SQL statements in one transaction.
+        """
+        if not statements:
+            return
+        for sql in statements:
+            self._enforce_execute_raw_policy(sql=sql, trusted=trusted)
+        if self._batch_statements is not None:
+            self._batch_statements.extend((sql, []) for sql in statements)
+            return
+        if not self._observability_enabled:
+            self._execute_raw_many_observed(statements)
+            return
+        self._observe_query(
+            "execute_raw_many",
+            statements[0],
+            None,
+            self._execute_raw_many_observed,
+            statements,
+        )
+
+    def _execute_raw_many_observed(self, statements: Sequence[str]) -> None:
+        conn, release_mode = self._get_connection_for_query()
+        try:
+            if release_mode is None:
+                for sql in statements:
+                    conn.execute(sql)
+                return
+            # Statements run one by one rather than joined into a script, so a
+            # trailing "-- comment" cannot swallow the separator after it.
+            if not getattr(conn, "in_transaction", False):
+                conn.execute("BEGIN IMMEDIATE")
+            try:
+                for sql in statements:
+                    conn.execute(sql)
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+        finally:
+            self._release_connection(conn, release_mode)
+
+    def batch(self) -> _SqliteBatchContext:
+        """
+        Returns a context manager that queues `execute`, `execute_many`, and
+        `execute_raw` calls and submits them in one transaction on exit.
+        """
+        return _SqliteBatchContext(self)
+
+    def _reject_rows_in_batch(self) -> None:
+        # Queued statements run on exit, so a SELECT here could never return its rows.
+        raise RuntimeError(
+            "Row-returning statements cannot be queued in batch(); use fetch_all() or fetch_one() instead."
+        )
+
+    def _start_batch(self) -> None:
+        self._ensure_open()
+        if self._batch_statements is not None:
+            raise RuntimeError("Batch already active.")
+        self._batch_statements = []
+
+    def _end_batch(self) -> list[tuple[str, Sequence[Any]]]:
+        statements = self._batch_statements or []
+        self._batch_statements = None
+        return statements
+
+    def _flush_batch(self, statements: list[tuple[str, Sequence[Any]]]) -> None:
+        if not statements:
+            return
+        if not self._observability_enabled:
+            self._flush_batch_observed(statements)
+            return
+        first_sql, first_params = statements[0]
+        self._observe_query(
+            "batch",
+            first_sql,
+            first_params,
+            self._flush_batch_observed,
+            statements,
+        )
+
+    def _flush_batch_observed(self, statements: list[tuple[str, Sequence[Any]]]) -> None:
+        conn, release_mode = self._get_connection_for_query()
+        try:
+            if release_mode is None:
+                self._run_batch_statements(conn, statements)
+                return
+            if not getattr(conn, "in_transaction", False):
+                conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._run_batch_statements(conn, statements)
+            except Exception:
+                conn.rollback()
+                raise
+            conn.commit()
+        finally:
+            self._release_connection(conn, release_mode)
+
+    def _run_batch_statements(self, conn: Any, statements: list[tuple[str, Sequence[Any]]]) -> None:
+        # Consecutive DML statements with identical SQL collapse into one executemany
+        # call; anything else (DDL, PRAGMA) runs statement by statement.
+        for sql, group in groupby(statements, key=lambda statement: statement[0]):
+            param_sets = [params for _, params in group]
+            if len(param_sets) > 1 and _is_dml(sql):
+                self._executemany_chunked(conn, sql, param_sets)
+                continue
+            for params in param_sets:
+                conn.execute(sql, params)
+
     def begin(self, isolation_level: str | None = None) -> None:
         self._ensure_open()
         if self._has_active_transaction():
@@ -248,130 +628,120 @@ class SqliteExecutor(Executor):
                     "SQLite isolation_level must be one of: DEFERRED, IMMEDIATE, EXCLUSIVE."
                 )
 
+        conn: Any
+        release_mode: str | None
         if self.connection is not None:
-            self._transaction_connection = self.connection
-            self._transaction_release_mode = None
+            conn = self.connection
+            release_mode = None
         elif self.connection_settings.acquire_connection is not None:
-            self._emit_event("connection.acquire.start", success=True)
-            self._transaction_connection = self.connection_settings.acquire_connection()
-            self._transaction_release_mode = "release"
-            self._emit_event(
-                "connection.acquire.end",
-                success=True,
-                connection_id=str(id(self._transaction_connection)),
-            )
+            conn = self._acquire_observed(self.connection_settings.acquire_connection)
+            release_mode = "release"
         else:
-            self._emit_event("connection.acquire.start", success=True)
-            self._transaction_connection = self._connect()
-            self._transaction_release_mode = "close"
-            self._emit_event(
-                "connection.acquire.end",
-                success=True,
-                connection_id=str(id(self._transaction_connection)),
-            )
+            conn = self._pool.acquire()
+            release_mode = "pool"
 
-        if normalized:
-            self._transaction_connection.execute(f"BEGIN {normalized}")
+        try:
+            conn.execute(f"BEGIN {normalized}" if normalized else "BEGIN")
+        except Exception:
+            self._release_connection(conn, release_mode)
+            raise
+        if self._observability_enabled:
+            tx = _SqliteTransaction(conn, release_mode, uuid4().hex, time.perf_counter())
         else:
-            self._transaction_connection.execute("BEGIN")
-        self._transaction_id = uuid4().hex
-        self._transaction_started_at = time.perf_counter()
+            tx = _SqliteTransaction(conn, release_mode, None, None)
+        self._tx = tx
         self._emit_event(
             "txn.begin",
             success=True,
-            transaction_id=self._transaction_id,
+            transaction_id=tx.transaction_id,
         )
 
+    def _transaction_duration_ms(self, tx: _SqliteTransaction) -> float | None:
+        if tx.started_at is None:
+            return None
+        return (time.perf_counter() - tx.started_at) * 1000
+
     def _finalize_transaction(self) -> None:
-        conn = self._transaction_connection
-        mode = self._transaction_release_mode
-        if conn is None:
+        tx = self._tx
+        if tx is None:
             return
-        self._transaction_connection = None
-        self._transaction_release_mode = None
-        self._transaction_id = None
-        self._transaction_started_at = None
-        self._release_connection(conn, mode)
+        self._tx = None
+        self._release_connection(tx.connection, tx.release_mode)
 
     def commit(self) -> None:
-        conn = self._require_active_transaction_connection()
-        tx_id = self._transaction_id
-        started_at = self._transaction_started_at
+        tx = self._require_active_transaction()
         try:
-            conn.commit()
-            duration_ms = None if started_at is None else (time.perf_counter() - started_at) * 1000
+            tx.connection.commit()
             self._emit_event(
                 "txn.commit",
                 success=True,
-                transaction_id=tx_id,
-                duration_ms=duration_ms,
+                transaction_id=tx.transaction_id,
+                duration_ms=self._transaction_duration_ms(tx),
             )
         finally:
             self._finalize_transaction()
 
     def rollback(self) -> None:
-        conn = self._require_active_transaction_connection()
-        tx_id = self._transaction_id
-        started_at = self._transaction_started_at
+        tx = self._require_active_transaction()
         try:
-            conn.rollback()
-            duration_ms = None if started_at is None else (time.perf_counter() - started_at) * 1000
+            tx.connection.rollback()
             self._emit_event(
                 "txn.rollback",
                 success=True,
-                transaction_id=tx_id,
-                duration_ms=duration_ms,
+                transaction_id=tx.transaction_id,
+                duration_ms=self._transaction_duration_ms(tx),
             )
         finally:
             self._finalize_transaction()
 
     def savepoint(self, name: str) -> None:
-        conn = self._require_active_transaction_connection()
-        conn.execute(f"SAVEPOINT {name}")
+        tx = self._require_active_transaction()
+        tx.connection.execute(_savepoint_sql("SAVEPOINT", name))
         self._emit_event(
             "txn.savepoint.create",
             success=True,
-            transaction_id=self._transaction_id,
+            transaction_id=tx.transaction_id,
             savepoint_name=name,
         )
 
     def rollback_to_savepoint(self, name: str) -> None:
-        conn = self._require_active_transaction_connection()
-        conn.execute(f"ROLLBACK TO SAVEPOINT {name}")
+        tx = self._require_active_transaction()
+        tx.connection.execute(_savepoint_sql("ROLLBACK TO SAVEPOINT", name))
         self._emit_event(
             "txn.savepoint.rollback",
             success=True,
-            transaction_id=self._transaction_id,
+            transaction_id=tx.transaction_id,
             savepoint_name=name,
         )
 
     def release_savepoint(self, name: str) -> None:
-        conn = self._require_active_transaction_connection()
-        conn.execute(f"RELEASE SAVEPOINT {name}")
+        tx = self._require_active_transaction()
+        tx.connection.execute(_savepoint_sql("RELEASE SAVEPOINT", name))
         self._emit_event(
             "txn.savepoint.release",
             success=True,
-            transaction_id=self._transaction_id,
+            transaction_id=tx.transaction_id,
             savepoint_name=name,
         )
 
     def close(self) -> None:
         if self._closed:
             return
-        if self._transaction_connection is not None:
-            conn = self._transaction_connection
-            tx_id = self._transaction_id
-            started_at = self._transaction_started_at
+        tx = self._tx
+        if tx is not None:
             try:
-                conn.rollback()
-                duration_ms = None if started_at is None else (time.perf_counter() - started_at) * 1000
+                tx.connection.rollback()
                 self._emit_event(
                     "txn.rollback",
                     success=True,
-                    transaction_id=tx_id,
-                    duration_ms=duration_ms,
+                    transaction_id=tx.transaction_id,
+                    duration_ms=self._transaction_duration_ms(tx),
                 )
             except Exception:
                 pass
             self._finalize_transaction()
+        self._pool.close()
+        if self._readers is not None:
+            self._readers.close()
+            self._readers = None
         self._closed = True
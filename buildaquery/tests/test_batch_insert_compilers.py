@@ -1,6 +1,7 @@
 import pytest
 
 from buildaquery.abstract_syntax_tree.models import (
+    BinaryOperationNode,
     ColumnNode,
     ConflictTargetNode,
     InsertStatementNode,
@@ -78,6 +79,56 @@ def test_compile_multi_row_insert_common_dialects(compiler, expected_sql, expect
     assert compiled.params == expected_params
 
 
+@pytest.mark.parametrize(
+    ("compiler", "expected_sql"),
+    [
+        (PostgresCompiler(), "INSERT INTO users (id, name) VALUES (%s, %s), ((%s + %s), %s)"),
+        (SqliteCompiler(), "INSERT INTO users (id, name) VALUES (?, ?), ((? + ?), ?)"),
+        (MySqlCompiler(), "INSERT INTO users (id, name) VALUES (%s, %s), ((%s + %s), %s)"),
+        (MariaDbCompiler(), "INSERT INTO users (id, name) VALUES (?, ?), ((? + ?), ?)"),
+        (MsSqlCompiler(), "INSERT INTO users (id, name) VALUES (?, ?), ((? + ?), ?)"),
+        (
+            CockroachDbCompiler(),
+            "INSERT INTO users (id, name) VALUES (%s, CAST(%s AS STRING)), ((%s + %s), CAST(%s AS STRING))",
+        ),
+    ],
+)
+def test_compile_multi_row_insert_with_expression_values(compiler, expected_sql):
+    query = InsertStatementNode(
+        table=TableNode(name="users"),
+        columns=[ColumnNode(name="id"), ColumnNode(name="name")],
+        rows=[
+            [LiteralNode(value=1), LiteralNode(value="a")],
+            [
+                BinaryOperationNode(left=LiteralNode(value=1), operator="+", right=LiteralNode(value=1)),
+                LiteralNode(value="b"),
+            ],
+        ],
+    )
+    compiled = compiler.compile(query)
+    assert compiled.sql == expected_sql
+    assert compiled.params == [1, "a", 1, 1, "b"]
+
+
+def test_compile_multi_row_insert_cockroach_casts_per_row_shape():
+    compiled = CockroachDbCompiler().compile(
+        InsertStatementNode(
+            table=TableNode(name="users"),
+            columns=[ColumnNode(name="id"), ColumnNode(name="name")],
+            rows=[
+                [LiteralNode(value=1), LiteralNode(value="a")],
+                [LiteralNode(value=2), LiteralNode(value=None)],
+                [LiteralNode(value=3), LiteralNode(value="c")],
+            ],
+        )
+    )
+    assert compiled.sql == (
+        "INSERT INTO users (id, name) VALUES "
+        "(%s, CAST(%s AS STRING)), (%s, %s), (%s, CAST(%s AS STRING))"
+    )
+    assert compiled.params == [1, "a", 2, None, 3, "c"]
+
+
 def test_compile_multi_row_insert_oracle():
     compiler = OracleCompiler()
     query = InsertStatementNode(
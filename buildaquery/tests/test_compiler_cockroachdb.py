@@ -12,14 +12,20 @@ from buildaquery.abstract_syntax_tree.models import (
     ConflictTargetNode, UpsertClauseNode, ReturningClauseNode
 )
 
-@pytest.fixture
+# Shared leaf nodes: the compiler only reads the AST, and no test below mutates these.
+USERS = TableNode(name="users")
+STAR = StarNode()
+ID_COL = ColumnNode(name="id")
+
+@pytest.fixture(scope="session")
 def compiler():
+    # compile() starts a fresh params list per call, so one instance is safe to share.
     return CockroachDbCompiler()
 
 def test_compile_simple_select(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
-        from_table=TableNode(name="users")
+        select_list=[STAR],
+        from_table=USERS
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "SELECT * FROM users"
@@ -28,7 +34,7 @@ def test_compile_simple_select(compiler):
 def test_compile_select_distinct(compiler):
     query = SelectStatementNode(
         select_list=[ColumnNode(name="city")],
-        from_table=TableNode(name="users"),
+        from_table=USERS,
         distinct=True
     )
     compiled = compiler.compile(query)
@@ -46,17 +52,35 @@ def test_compile_qualified_names(compiler):
 def test_compile_cast(compiler):
     query = SelectStatementNode(
         select_list=[CastNode(expression=ColumnNode(name="age"), data_type="STRING")],
-        from_table=TableNode(name="users")
+        from_table=USERS
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "SELECT CAST(age AS STRING) FROM users"
 
+def test_compile_literal_placeholders_by_type(compiler):
+    class Status(str):
+        pass
+
+    query = SelectStatementNode(
+        select_list=[
+            LiteralNode(value=1),
+            LiteralNode(value=1.5),
+            LiteralNode(value=True),
+            LiteralNode(value=None),
+            LiteralNode(value="a"),
+            LiteralNode(value=Status("b")),
+        ]
+    )
+    compiled = compiler.compile(query)
+    assert compiled.sql == "SELECT %s, %s, %s, %s, CAST(%s AS STRING), CAST(%s AS STRING)"
+    assert compiled.params == [1, 1.5, True, None, "a", "b"]
+
 def test_compile_delete(compiler):
     query = DeleteStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         where_clause=WhereClauseNode(
             condition=BinaryOperationNode(
-                left=ColumnNode(name="id"),
+                left=ID_COL,
                 operator="=",
                 right=LiteralNode(value=1)
             )
@@ -66,41 +90,30 @@ def test_compile_delete(compiler):
     assert compiled.sql == "DELETE FROM users WHERE (id = %s)"
     assert compiled.params == [1]
 
-def test_compile_set_operations(compiler):
-    select1 = SelectStatementNode(select_list=[ColumnNode(name="id")], from_table=TableNode(name="t1"))
-    select2 = SelectStatementNode(select_list=[ColumnNode(name="id")], from_table=TableNode(name="t2"))
-
-    union_query = UnionNode(left=select1, right=select2)
-    compiled = compiler.compile(union_query)
-    assert compiled.sql == "(SELECT id FROM t1 UNION SELECT id FROM t2)"
-
-    union_all_query = UnionNode(left=select1, right=select2, all=True)
-    compiled = compiler.compile(union_all_query)
-    assert compiled.sql == "(SELECT id FROM t1 UNION ALL SELECT id FROM t2)"
-
-    intersect_query = IntersectNode(left=select1, right=select2)
-    compiled = compiler.compile(intersect_query)
-    assert compiled.sql == "(SELECT id FROM t1 INTERSECT SELECT id FROM t2)"
-
-    intersect_all_query = IntersectNode(left=select1, right=select2, all=True)
-    compiled = compiler.compile(intersect_all_query)
-    assert compiled.sql == "(SELECT id FROM t1 INTERSECT ALL SELECT id FROM t2)"
-
-    except_query = ExceptNode(left=select1, right=select2)
-    compiled = compiler.compile(except_query)
-    assert compiled.sql == "(SELECT id FROM t1 EXCEPT SELECT id FROM t2)"
-
-    except_all_query = ExceptNode(left=select1, right=select2, all=True)
-    compiled = compiler.compile(except_all_query)
-    assert compiled.sql == "(SELECT id FROM t1 EXCEPT ALL SELECT id FROM t2)"
+SET_OPERATION_LEFT = SelectStatementNode(select_list=[ID_COL], from_table=TableNode(name="t1"))
+SET_OPERATION_RIGHT = SelectStatementNode(select_list=[ID_COL], from_table=TableNode(name="t2"))
+SET_OPERATION_CASES = [
+    (UnionNode, False, "(SELECT id FROM t1 UNION SELECT id FROM t2)"),
+    (UnionNode, True, "(SELECT id FROM t1 UNION ALL SELECT id FROM t2)"),
+    (IntersectNode, False, "(SELECT id FROM t1 INTERSECT SELECT id FROM t2)"),
+    (IntersectNode, True, "(SELECT id FROM t1 INTERSECT ALL SELECT id FROM t2)"),
+    (ExceptNode, False, "(SELECT id FROM t1 EXCEPT SELECT id FROM t2)"),
+    (ExceptNode, True, "(SELECT id FROM t1 EXCEPT ALL SELECT id FROM t2)"),
+]
+
+@pytest.mark.parametrize("node_cls,all_flag,expected", SET_OPERATION_CASES)
+def test_compile_set_operations(compiler, node_cls, all_flag, expected):
+    query = node_cls(left=SET_OPERATION_LEFT, right=SET_OPERATION_RIGHT, all=all_flag)
+    compiled = compiler.compile(query)
+    assert compiled.sql == expected
 
 def test_compile_in_between(compiler):
     in_query = SelectStatementNode(
-        select_list=[StarNode()],
-        from_table=TableNode(name="users"),
+        select_list=[STAR],
+        from_table=USERS,
         where_clause=WhereClauseNode(
             condition=InNode(
-                expression=ColumnNode(name="id"),
+                expression=ID_COL,
                 values=[LiteralNode(value=1), LiteralNode(value=2), LiteralNode(value=3)]
             )
         )
@@ -109,8 +122,23 @@ def test_compile_in_between(compiler):
     assert compiled.sql == "SELECT * FROM users WHERE (id IN (%s, %s, %s))"
     assert compiled.params == [1, 2, 3]
 
+    mixed_query = SelectStatementNode(
+        select_list=[STAR],
+        from_table=USERS,
+        where_clause=WhereClauseNode(
+            condition=InNode(
+                expression=ColumnNode(name="name"),
+                values=[LiteralNode(value="a"), ColumnNode(name="alias"), LiteralNode(value=2)],
+                negated=True
+            )
+        )
+    )
+    compiled = compiler.compile(mixed_query)
+    assert compiled.sql == "SELECT * FROM users WHERE (name NOT IN (CAST(%s AS STRING), alias, %s))"
+    assert compiled.params == ["a", 2]
+
     between_query = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=TableNode(name="products"),
         where_clause=WhereClauseNode(
             condition=BetweenNode(
@@ -126,7 +154,7 @@ def test_compile_in_between(compiler):
 
 def test_compile_insert(compiler):
     query = InsertStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         columns=[ColumnNode(name="name"), ColumnNode(name="age")],
         values=[LiteralNode(value="Alice"), LiteralNode(value=30)]
     )
@@ -134,13 +162,23 @@ def test_compile_insert(compiler):
     assert compiled.sql == "INSERT INTO users (name, age) VALUES (CAST(%s AS STRING), %s)"
     assert compiled.params == ["Alice", 30]
 
+def test_compile_insert_values_with_expressions(compiler):
+    query = InsertStatementNode(
+        table=USERS,
+        columns=[ColumnNode(name="name"), ColumnNode(name="created_at")],
+        values=[LiteralNode(value="Alice"), FunctionCallNode(name="now", args=[])]
+    )
+    compiled = compiler.compile(query)
+    assert compiled.sql == "INSERT INTO users (name, created_at) VALUES (CAST(%s AS STRING), now())"
+    assert compiled.params == ["Alice"]
+
 def test_compile_insert_upsert_do_nothing(compiler):
     query = InsertStatementNode(
-        table=TableNode(name="users"),
-        columns=[ColumnNode(name="id"), ColumnNode(name="name")],
+        table=USERS,
+        columns=[ID_COL, ColumnNode(name="name")],
         values=[LiteralNode(value=1), LiteralNode(value="Alice")],
         upsert_clause=UpsertClauseNode(
-            conflict_target=ConflictTargetNode(columns=[ColumnNode(name="id")]),
+            conflict_target=ConflictTargetNode(columns=[ID_COL]),
             do_nothing=True,
         ),
     )
@@ -153,11 +191,11 @@ def test_compile_insert_upsert_do_nothing(compiler):
 
 def test_compile_insert_upsert_do_update(compiler):
     query = InsertStatementNode(
-        table=TableNode(name="users"),
-        columns=[ColumnNode(name="id"), ColumnNode(name="name"), ColumnNode(name="age")],
+        table=USERS,
+        columns=[ID_COL, ColumnNode(name="name"), ColumnNode(name="age")],
         values=[LiteralNode(value=1), LiteralNode(value="Alice"), LiteralNode(value=30)],
         upsert_clause=UpsertClauseNode(
-            conflict_target=ConflictTargetNode(columns=[ColumnNode(name="id")]),
+            conflict_target=ConflictTargetNode(columns=[ID_COL]),
             update_columns=["name", "age"],
         ),
     )
@@ -170,7 +208,7 @@ def test_compile_insert_upsert_do_update(compiler):
 
 def test_compile_update(compiler):
     query = UpdateStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         set_clauses={"age": LiteralNode(value=31), "status": LiteralNode(value="active")},
         where_clause=WhereClauseNode(
             condition=BinaryOperationNode(
@@ -184,6 +222,18 @@ def test_compile_update(compiler):
     assert compiled.sql == "UPDATE users SET age = %s, status = CAST(%s AS STRING) WHERE (name = CAST(%s AS STRING))"
     assert compiled.params == [31, "active", "Alice"]
 
+def test_compile_update_set_clause_pairs(compiler):
+    query = UpdateStatementNode(
+        table=USERS,
+        set_clauses=[("age", LiteralNode(value=31)), ("status", LiteralNode(value="active"))],
+        where_clause=WhereClauseNode(
+            condition=BinaryOperationNode(left=ID_COL, operator="=", right=LiteralNode(value=1))
+        )
+    )
+    compiled = compiler.compile(query)
+    assert compiled.sql == "UPDATE users SET age = %s, status = CAST(%s AS STRING) WHERE (id = %s)"
+    assert compiled.params == [31, "active", 1]
+
 def test_compile_case_expression(compiler):
     query = SelectStatementNode(
         select_list=[
@@ -209,18 +259,18 @@ def test_compile_case_expression(compiler):
     assert compiled.params == [90, "A", 80, "B", "C"]
 
 def test_compile_subquery(compiler):
-    inner_select = SelectStatementNode(select_list=[ColumnNode(name="id")], from_table=TableNode(name="users"))
+    inner_select = SelectStatementNode(select_list=[ID_COL], from_table=USERS)
     subquery = SubqueryNode(statement=inner_select, alias="u")
 
     query = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=subquery
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "SELECT * FROM (SELECT id FROM users) AS u"
 
     query_in = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=TableNode(name="orders"),
         where_clause=WhereClauseNode(
             condition=InNode(
@@ -233,11 +283,11 @@ def test_compile_subquery(compiler):
     assert compiled_in.sql == "SELECT * FROM orders WHERE (user_id IN ((SELECT id FROM users)))"
 
 def test_compile_cte(compiler):
-    inner_select = SelectStatementNode(select_list=[StarNode()], from_table=TableNode(name="users"))
+    inner_select = SelectStatementNode(select_list=[STAR], from_table=USERS)
     cte = CTENode(name="user_subset", subquery=inner_select)
 
     query = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=TableNode(name="user_subset"),
         ctes=[cte]
     )
@@ -253,7 +303,7 @@ def test_compile_window_function(compiler):
                 args=[ColumnNode(name="salary")],
                 over=OverClauseNode(
                     partition_by=[ColumnNode(name="dept")],
-                    order_by=[OrderByClauseNode(expression=ColumnNode(name="id"))]
+                    order_by=[OrderByClauseNode(expression=ID_COL)]
                 )
             )
         ],
@@ -265,21 +315,27 @@ def test_compile_window_function(compiler):
 
 def test_compile_ddl(compiler):
     create_query = CreateStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         columns=[
             ColumnDefinitionNode(name="id", data_type="INT", primary_key=True),
             ColumnDefinitionNode(name="name", data_type="STRING", not_null=True),
-            ColumnDefinitionNode(name="age", data_type="INT", default=LiteralNode(value=18))
+            ColumnDefinitionNode(name="age", data_type="INT", default=LiteralNode(value=18)),
+            ColumnDefinitionNode(
+                name="code", data_type="STRING", primary_key=True, not_null=True, default=LiteralNode(value="x")
+            )
         ],
         if_not_exists=True
     )
     compiled_create = compiler.compile(create_query)
-    expected_create = "CREATE TABLE IF NOT EXISTS users (id INT PRIMARY KEY, name STRING NOT NULL, age INT DEFAULT %s)"
+    expected_create = (
+        "CREATE TABLE IF NOT EXISTS users (id INT PRIMARY KEY, name STRING NOT NULL, age INT DEFAULT %s, "
+        "code STRING PRIMARY KEY NOT NULL DEFAULT CAST(%s AS STRING))"
+    )
     assert compiled_create.sql == expected_create
-    assert compiled_create.params == [18]
+    assert compiled_create.params == [18, "x"]
 
     drop_query = DropStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         if_exists=True,
         cascade=True
     )
@@ -289,7 +345,7 @@ def test_compile_ddl(compiler):
 def test_compile_where_with_params(compiler):
     query = SelectStatementNode(
         select_list=[ColumnNode(name="name")],
-        from_table=TableNode(name="users"),
+        from_table=USERS,
         where_clause=WhereClauseNode(
             condition=BinaryOperationNode(
                 left=ColumnNode(name="age"),
@@ -304,7 +360,7 @@ def test_compile_where_with_params(compiler):
 
 def test_compile_multiple_params(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=TableNode(name="products"),
         where_clause=WhereClauseNode(
             condition=BinaryOperationNode(
@@ -328,17 +384,17 @@ def test_compile_multiple_params(compiler):
 
 def test_compile_order_by(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
-        from_table=TableNode(name="users"),
-        order_by_clause=[OrderByClauseNode(expression=ColumnNode(name="id"), direction="DESC")]
+        select_list=[STAR],
+        from_table=USERS,
+        order_by_clause=[OrderByClauseNode(expression=ID_COL, direction="DESC")]
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "SELECT * FROM users ORDER BY id DESC"
 
 def test_compile_top_translation(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
-        from_table=TableNode(name="users"),
+        select_list=[STAR],
+        from_table=USERS,
         top_clause=TopClauseNode(count=10, on_expression=ColumnNode(name="score"), direction="DESC")
     )
     compiled = compiler.compile(query)
@@ -346,8 +402,8 @@ def test_compile_top_translation(compiler):
 
 def test_compile_top_vs_limit_error(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
-        from_table=TableNode(name="users"),
+        select_list=[STAR],
+        from_table=USERS,
         top_clause=TopClauseNode(count=10),
         limit=5
     )
@@ -374,7 +430,7 @@ def test_compile_group_by_having(compiler):
 
 def test_compile_select_with_lock_clause(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=TableNode(name="jobs"),
         lock_clause=LockClauseNode(mode="UPDATE", skip_locked=True),
     )
@@ -383,7 +439,7 @@ def test_compile_select_with_lock_clause(compiler):
 
 def test_compile_lock_clause_conflict_error(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=TableNode(name="jobs"),
         lock_clause=LockClauseNode(mode="SHARE", nowait=True, skip_locked=True),
     )
@@ -392,10 +448,10 @@ def test_compile_lock_clause_conflict_error(compiler):
 
 def test_compile_insert_returning(compiler):
     query = InsertStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         columns=[ColumnNode(name="name"), ColumnNode(name="age")],
         values=[LiteralNode(value="Alice"), LiteralNode(value=30)],
-        returning_clause=ReturningClauseNode(expressions=[ColumnNode(name="id")]),
+        returning_clause=ReturningClauseNode(expressions=[ID_COL]),
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "INSERT INTO users (name, age) VALUES (CAST(%s AS STRING), %s) RETURNING id"
@@ -403,17 +459,127 @@ def test_compile_insert_returning(compiler):
 
 def test_compile_update_returning(compiler):
     query = UpdateStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         set_clauses={"status": LiteralNode(value="active")},
         where_clause=WhereClauseNode(
             condition=BinaryOperationNode(
-                left=ColumnNode(name="id"),
+                left=ID_COL,
                 operator="=",
                 right=LiteralNode(value=1),
             )
         ),
-        returning_clause=ReturningClauseNode(expressions=[ColumnNode(name="id"), ColumnNode(name="status")]),
+        returning_clause=ReturningClauseNode(expressions=[ID_COL, ColumnNode(name="status")]),
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "UPDATE users SET status = CAST(%s AS STRING) WHERE (id = %s) RETURNING id, status"
     assert compiled.params == ["active", 1]
+
+def test_compile_cache_tracks_structure_and_values():
+    compiler = CockroachDbCompiler()
+
+    def query(value):
+        return SelectStatementNode(
+            select_list=[STAR],
+            from_table=USERS,
+            where_clause=WhereClauseNode(
+                condition=BinaryOperationNode(left=ID_COL, operator="=", right=LiteralNode(value=value))
+            ),
+        )
+
+    first = compiler.compile(query(1))
+    first.params.append("caller mutation")
+    assert compiler.compile(query(1)).params == [1]
+    assert compiler.compile(query(True)).params == [True]
+    assert type(compiler.compile(query(True)).params[0]) is bool
+
+    node = query(2)
+    assert compiler.compile(node).params == [2]
+    node.from_table = TableNode(name="accounts")
+    assert compiler.compile(node).sql == "SELECT * FROM accounts WHERE (id = %s)"
+
+    array_query = query([1, 2])
+    assert compiler.compile(array_query).params == [[1, 2]]
+    assert compiler.compile(query("a")).sql == "SELECT * FROM users WHERE (id = CAST(%s AS STRING))"
+    assert len(compiler._compile_cache) == 5
+
+def test_compile_cache_rebinds_values_for_same_shape():
+    compiler = CockroachDbCompiler()
+
+    def query(outer, inner, limit_in):
+        # select_list is the first field, but the CTE is compiled (and bound) first.
+        return SelectStatementNode(
+            select_list=[STAR, LiteralNode(value=outer)],
+            from_table=TableNode(name="recent"),
+            where_clause=WhereClauseNode(
+                condition=InNode(expression=ID_COL, values=[LiteralNode(value=v) for v in limit_in])
+            ),
+            ctes=[
+                CTENode(
+                    name="recent",
+                    subquery=SelectStatementNode(
+                        select_list=[STAR],
+                        from_table=USERS,
+                        where_clause=WhereClauseNode(
+                            condition=BinaryOperationNode(
+                                left=ColumnNode(name="age"), operator=">", right=LiteralNode(value=inner)
+                            )
+                        ),
+                    ),
+                )
+            ],
+        )
+
+    first = compiler.compile(query(1, 18, [5, 6]))
+    second = compiler.compile(query(2, 21, [7, 8]))
+    assert len(compiler._compile_cache) == 1
+    assert second.sql == first.sql
+    assert first.params == [18, 1, 5, 6]
+    assert second.params == [21, 2, 7, 8]
+
+def test_compile_cache_skips_trees_that_reuse_a_literal_node():
+    compiler = CockroachDbCompiler()
+
+    def query(left, right):
+        return SelectStatementNode(
+            select_list=[STAR],
+            from_table=USERS,
+            where_clause=WhereClauseNode(
+                condition=BinaryOperationNode(
+                    left=BinaryOperationNode(left=ID_COL, operator="=", right=left),
+                    operator="OR",
+                    right=BinaryOperationNode(left=ColumnNode(name="age"), operator="=", right=right),
+                )
+            ),
+        )
+
+    shared = LiteralNode(value=1)
+    assert compiler.compile(query(shared, shared)).params == [1, 1]
+    assert len(compiler._compile_cache) == 0
+    assert compiler.compile(query(LiteralNode(value=1), LiteralNode(value=2))).params == [1, 2]
+    assert compiler.compile(query(shared, shared)).params == [1, 1]
+    assert compiler.compile(query(LiteralNode(value=3), LiteralNode(value=4))).params == [3, 4]
+
+def test_compile_long_binary_operation_chain(compiler):
+    condition = BinaryOperationNode(left=ID_COL, operator="=", right=LiteralNode(value=0))
+    for i in range(1, 3000):
+        condition = BinaryOperationNode(
+            left=condition,
+            operator="OR",
+            right=BinaryOperationNode(left=ID_COL, operator="=", right=LiteralNode(value=i)),
+        )
+    query = SelectStatementNode(
+        select_list=[STAR],
+        from_table=USERS,
+        where_clause=WhereClauseNode(condition=condition),
+    )
+    compiled = compiler.compile(query)
+    assert compiled.sql.startswith("SELECT * FROM users WHERE " + "(" * 2999 + "(id = %s) OR (id = %s))")
+    assert compiled.params == list(range(3000))
+
+def test_ast_nodes_are_slotted_but_mutable(compiler):
+    column = ColumnNode(name="id")
+    assert not hasattr(column, "__dict__")
+    with pytest.raises(AttributeError):
+        column.alias = "x"
+    column.table = "users"
+    assert compiler.compile(column).sql == "users.id"
@@ -12,6 +12,7 @@ from buildaquery.abstract_syntax_tree.models import (
 from buildaquery.compiler.clickhouse.clickhouse_compiler import ClickHouseCompiler
 from buildaquery.compiler.cockroachdb.cockroachdb_compiler import CockroachDbCompiler
 from buildaquery.compiler.duckdb.duckdb_compiler import DuckDbCompiler
+from buildaquery.compiler.identifier_validation import validate_identifier
 from buildaquery.compiler.mariadb.mariadb_compiler import MariaDbCompiler
 from buildaquery.compiler.mssql.mssql_compiler import MsSqlCompiler
 from buildaquery.compiler.mysql.mysql_compiler import MySqlCompiler
@@ -106,3 +107,13 @@ def test_allows_regular_identifier_alias(compiler_type) -> None:
     )
     compiled = compiler.compile(query)
     assert "item_id" in compiled.sql
+
+
+def test_cached_identifier_validation_keeps_rejecting_and_respects_mode() -> None:
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Unsafe SQL identifier for table name"):
+            validate_identifier("users; DROP TABLE users", kind="table name")
+
+    assert validate_identifier("COUNT(*)", allow_column_expression=True) == "COUNT(*)"
+    with pytest.raises(ValueError, match="Unsafe SQL identifier"):
+        validate_identifier("COUNT(*)")
@@ -12,14 +12,20 @@ from buildaquery.abstract_syntax_tree.models import (
     ConflictTargetNode, UpsertClauseNode, ReturningClauseNode
 )
 
-@pytest.fixture
+# Shared leaf nodes: the compiler only reads the AST, and no test below mutates these.
+USERS = TableNode(name="users")
+STAR = StarNode()
+ID_COL = ColumnNode(name="id")
+
+@pytest.fixture(scope="session")
 def compiler():
+    # compile() starts a fresh params list per call, so one instance is safe to share.
     return MsSqlCompiler()
 
 def test_compile_simple_select(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
-        from_table=TableNode(name="users")
+        select_list=[STAR],
+        from_table=USERS
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "SELECT * FROM users"
@@ -28,7 +34,7 @@ def test_compile_simple_select(compiler):
 def test_compile_select_distinct(compiler):
     query = SelectStatementNode(
         select_list=[ColumnNode(name="city")],
-        from_table=TableNode(name="users"),
+        from_table=USERS,
         distinct=True
     )
     compiled = compiler.compile(query)
@@ -46,17 +52,17 @@ def test_compile_qualified_names(compiler):
 def test_compile_cast(compiler):
     query = SelectStatementNode(
         select_list=[CastNode(expression=ColumnNode(name="age"), data_type="INT")],
-        from_table=TableNode(name="users")
+        from_table=USERS
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "SELECT CAST(age AS INT) FROM users"
 
 def test_compile_delete(compiler):
     query = DeleteStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         where_clause=WhereClauseNode(
             condition=BinaryOperationNode(
-                left=ColumnNode(name="id"),
+                left=ID_COL,
                 operator="=",
                 right=LiteralNode(value=1)
             )
@@ -66,43 +72,39 @@ def test_compile_delete(compiler):
     assert compiled.sql == "DELETE FROM users WHERE (id = ?)"
     assert compiled.params == [1]
 
-def test_compile_set_operations(compiler):
-    select1 = SelectStatementNode(select_list=[ColumnNode(name="id")], from_table=TableNode(name="t1"))
-    select2 = SelectStatementNode(select_list=[ColumnNode(name="id")], from_table=TableNode(name="t2"))
-
-    union_query = UnionNode(left=select1, right=select2)
-    compiled = compiler.compile(union_query)
-    assert compiled.sql == "(SELECT id FROM t1 UNION SELECT id FROM t2)"
-
-    union_all_query = UnionNode(left=select1, right=select2, all=True)
-    compiled = compiler.compile(union_all_query)
-    assert compiled.sql == "(SELECT id FROM t1 UNION ALL SELECT id FROM t2)"
-
-    intersect_query = IntersectNode(left=select1, right=select2)
-    compiled = compiler.compile(intersect_query)
-    assert compiled.sql == "(SELECT id FROM t1 INTERSECT SELECT id FROM t2)"
-
-    except_query = ExceptNode(left=select1, right=select2)
-    compiled = compiler.compile(except_query)
-    assert compiled.sql == "(SELECT id FROM t1 EXCEPT SELECT id FROM t2)"
-
-def test_compile_intersect_except_all_errors(compiler):
-    select1 = SelectStatementNode(select_list=[ColumnNode(name="id")], from_table=TableNode(name="t1"))
-    select2 = SelectStatementNode(select_list=[ColumnNode(name="id")], from_table=TableNode(name="t2"))
-
-    with pytest.raises(ValueError, match="SQL Server does not support INTERSECT ALL"):
-        compiler.compile(IntersectNode(left=select1, right=select2, all=True))
-
-    with pytest.raises(ValueError, match="SQL Server does not support EXCEPT ALL"):
-        compiler.compile(ExceptNode(left=select1, right=select2, all=True))
+SET_OPERATION_LEFT = SelectStatementNode(select_list=[ID_COL], from_table=TableNode(name="t1"))
+SET_OPERATION_RIGHT = SelectStatementNode(select_list=[ID_COL], from_table=TableNode(name="t2"))
+SET_OPERATION_CASES = [
+    (UnionNode, False, "(SELECT id FROM t1 UNION SELECT id FROM t2)"),
+    (UnionNode, True, "(SELECT id FROM t1 UNION ALL SELECT id FROM t2)"),
+    (IntersectNode, False, "(SELECT id FROM t1 INTERSECT SELECT id FROM t2)"),
+    (ExceptNode, False, "(SELECT id FROM t1 EXCEPT SELECT id FROM t2)"),
+]
+
+@pytest.mark.parametrize("node_cls,all_flag,expected", SET_OPERATION_CASES)
+def test_compile_set_operations(compiler, node_cls, all_flag, expected):
+    query = node_cls(left=SET_OPERATION_LEFT, right=SET_OPERATION_RIGHT, all=all_flag)
+    compiled = compiler.compile(query)
+    assert compiled.sql == expected
+
+@pytest.mark.parametrize(
+    "node_cls,message",
+    [
+        (IntersectNode, "SQL Server does not support INTERSECT ALL"),
+        (ExceptNode, "SQL Server does not support EXCEPT ALL"),
+    ],
+)
+def test_compile_intersect_except_all_errors(compiler, node_cls, message):
+    with pytest.raises(ValueError, match=message):
+        compiler.compile(node_cls(left=SET_OPERATION_LEFT, right=SET_OPERATION_RIGHT, all=True))
 
 def test_compile_in_between(compiler):
     in_query = SelectStatementNode(
-        select_list=[StarNode()],
-        from_table=TableNode(name="users"),
+        select_list=[STAR],
+        from_table=USERS,
         where_clause=WhereClauseNode(
             condition=InNode(
-                expression=ColumnNode(name="id"),
+                expression=ID_COL,
                 values=[LiteralNode(value=1), LiteralNode(value=2), LiteralNode(value=3)]
             )
         )
@@ -112,7 +114,7 @@ def test_compile_in_between(compiler):
     assert compiled.params == [1, 2, 3]
 
     between_query = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=TableNode(name="products"),
         where_clause=WhereClauseNode(
             condition=BetweenNode(
@@ -128,7 +130,7 @@ def test_compile_in_between(compiler):
 
 def test_compile_insert(compiler):
     query = InsertStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         columns=[ColumnNode(name="name"), ColumnNode(name="age")],
         values=[LiteralNode(value="Alice"), LiteralNode(value=30)]
     )
@@ -138,39 +140,44 @@ def test_compile_insert(compiler):
 
 def test_compile_insert_upsert_merge_update(compiler):
     query = InsertStatementNode(
-        table=TableNode(name="users"),
-        columns=[ColumnNode(name="id"), ColumnNode(name="name"), ColumnNode(name="age")],
+        table=USERS,
+        columns=[ID_COL, ColumnNode(name="name"), ColumnNode(name="age")],
         values=[LiteralNode(value=1), LiteralNode(value="Alice"), LiteralNode(value=30)],
         upsert_clause=UpsertClauseNode(
-            conflict_target=ConflictTargetNode(columns=[ColumnNode(name="id")]),
+            conflict_target=ConflictTargetNode(columns=[ID_COL]),
             update_columns=["name", "age"],
         ),
     )
     compiled = compiler.compile(query)
-    assert "MERGE INTO users AS target" in compiled.sql
-    assert "WHEN MATCHED THEN UPDATE SET target.name = source.name, target.age = source.age" in compiled.sql
-    assert "WHEN NOT MATCHED THEN INSERT (id, name, age) VALUES (source.id, source.name, source.age);" in compiled.sql
+    assert compiled.sql == (
+        "MERGE INTO users AS target USING (SELECT ? AS id, ? AS name, ? AS age) AS source "
+        "ON (target.id = source.id) "
+        "WHEN MATCHED THEN UPDATE SET target.name = source.name, target.age = source.age "
+        "WHEN NOT MATCHED THEN INSERT (id, name, age) VALUES (source.id, source.name, source.age);"
+    )
     assert compiled.params == [1, "Alice", 30]
 
 def test_compile_insert_upsert_merge_do_nothing(compiler):
     query = InsertStatementNode(
-        table=TableNode(name="users"),
-        columns=[ColumnNode(name="id"), ColumnNode(name="name")],
+        table=USERS,
+        columns=[ID_COL, ColumnNode(name="name")],
         values=[LiteralNode(value=1), LiteralNode(value="Alice")],
         upsert_clause=UpsertClauseNode(
-            conflict_target=ConflictTargetNode(columns=[ColumnNode(name="id")]),
+            conflict_target=ConflictTargetNode(columns=[ID_COL]),
             do_nothing=True,
         ),
     )
     compiled = compiler.compile(query)
-    assert "MERGE INTO users AS target" in compiled.sql
-    assert "WHEN MATCHED THEN UPDATE SET" not in compiled.sql
-    assert "WHEN NOT MATCHED THEN INSERT (id, name) VALUES (source.id, source.name);" in compiled.sql
+    assert compiled.sql == (
+        "MERGE INTO users AS target USING (SELECT ? AS id, ? AS name) AS source "
+        "ON (target.id = source.id) "
+        "WHEN NOT MATCHED THEN INSERT (id, name) VALUES (source.id, source.name);"
+    )
     assert compiled.params == [1, "Alice"]
 
 def test_compile_update(compiler):
     query = UpdateStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         set_clauses={"age": LiteralNode(value=31), "status": LiteralNode(value="active")},
         where_clause=WhereClauseNode(
             condition=BinaryOperationNode(
@@ -209,18 +216,18 @@ def test_compile_case_expression(compiler):
     assert compiled.params == [90, "A", 80, "B", "C"]
 
 def test_compile_subquery(compiler):
-    inner_select = SelectStatementNode(select_list=[ColumnNode(name="id")], from_table=TableNode(name="users"))
+    inner_select = SelectStatementNode(select_list=[ID_COL], from_table=USERS)
     subquery = SubqueryNode(statement=inner_select, alias="u")
 
     query = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=subquery
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "SELECT * FROM (SELECT id FROM users) AS u"
 
     query_in = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=TableNode(name="orders"),
         where_clause=WhereClauseNode(
             condition=InNode(
@@ -233,11 +240,11 @@ def test_compile_subquery(compiler):
     assert compiled_in.sql == "SELECT * FROM orders WHERE (user_id IN ((SELECT id FROM users)))"
 
 def test_compile_cte(compiler):
-    inner_select = SelectStatementNode(select_list=[StarNode()], from_table=TableNode(name="users"))
+    inner_select = SelectStatementNode(select_list=[STAR], from_table=USERS)
     cte = CTENode(name="user_subset", subquery=inner_select)
 
     query = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=TableNode(name="user_subset"),
         ctes=[cte]
     )
@@ -253,7 +260,7 @@ def test_compile_window_function(compiler):
                 args=[ColumnNode(name="salary")],
                 over=OverClauseNode(
                     partition_by=[ColumnNode(name="dept")],
-                    order_by=[OrderByClauseNode(expression=ColumnNode(name="id"))]
+                    order_by=[OrderByClauseNode(expression=ID_COL)]
                 )
             )
         ],
@@ -265,7 +272,7 @@ def test_compile_window_function(compiler):
 
 def test_compile_ddl(compiler):
     create_query = CreateStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         columns=[
             ColumnDefinitionNode(name="id", data_type="INT", primary_key=True),
             ColumnDefinitionNode(name="name", data_type="NVARCHAR(255)", not_null=True),
@@ -274,13 +281,14 @@ def test_compile_ddl(compiler):
         if_not_exists=True
     )
     compiled_create = compiler.compile(create_query)
-    assert "IF NOT EXISTS (SELECT 1 FROM sys.tables" in compiled_create.sql
-    assert "WHERE name = ? AND schema_id = SCHEMA_ID(?)" in compiled_create.sql
-    assert "CREATE TABLE users" in compiled_create.sql
-    assert compiled_create.params == [18, "users", "dbo"]
+    assert compiled_create.sql == (
+        "IF NOT EXISTS (SELECT 1 FROM sys.tables WHERE name = ? AND schema_id = SCHEMA_ID(?)) "
+        "BEGIN CREATE TABLE users (id INT PRIMARY KEY, name NVARCHAR(255) NOT NULL, age INT DEFAULT ?) END"
+    )
+    assert compiled_create.params == ["users", "dbo", 18]
 
     drop_query = DropStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         if_exists=True,
         cascade=False
     )
@@ -289,7 +297,7 @@ def test_compile_ddl(compiler):
 
 def test_compile_drop_cascade_error(compiler):
     drop_query = DropStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         if_exists=True,
         cascade=True
     )
@@ -311,7 +319,7 @@ def test_compile_ddl_if_not_exists_parameterizes_identifier_check(compiler):
 def test_compile_where_with_params(compiler):
     query = SelectStatementNode(
         select_list=[ColumnNode(name="name")],
-        from_table=TableNode(name="users"),
+        from_table=USERS,
         where_clause=WhereClauseNode(
             condition=BinaryOperationNode(
                 left=ColumnNode(name="age"),
@@ -326,7 +334,7 @@ def test_compile_where_with_params(compiler):
 
 def test_compile_multiple_params(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=TableNode(name="products"),
         where_clause=WhereClauseNode(
             condition=BinaryOperationNode(
@@ -350,17 +358,17 @@ def test_compile_multiple_params(compiler):
 
 def test_compile_order_by(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
-        from_table=TableNode(name="users"),
-        order_by_clause=[OrderByClauseNode(expression=ColumnNode(name="id"), direction="DESC")]
+        select_list=[STAR],
+        from_table=USERS,
+        order_by_clause=[OrderByClauseNode(expression=ID_COL, direction="DESC")]
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "SELECT * FROM users ORDER BY id DESC"
 
 def test_compile_top_translation(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
-        from_table=TableNode(name="users"),
+        select_list=[STAR],
+        from_table=USERS,
         top_clause=TopClauseNode(count=10, on_expression=ColumnNode(name="score"), direction="DESC")
     )
     compiled = compiler.compile(query)
@@ -368,8 +376,8 @@ def test_compile_top_translation(compiler):
 
 def test_compile_limit_offset(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
-        from_table=TableNode(name="users"),
+        select_list=[STAR],
+        from_table=USERS,
         limit=10,
         offset=5
     )
@@ -378,8 +386,8 @@ def test_compile_limit_offset(compiler):
 
 def test_compile_top_vs_limit_error(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
-        from_table=TableNode(name="users"),
+        select_list=[STAR],
+        from_table=USERS,
         top_clause=TopClauseNode(count=10),
         limit=5
     )
@@ -406,7 +414,7 @@ def test_compile_group_by_having(compiler):
 
 def test_compile_lock_clause_not_supported(compiler):
     query = SelectStatementNode(
-        select_list=[StarNode()],
+        select_list=[STAR],
         from_table=TableNode(name="jobs"),
         lock_clause=LockClauseNode(mode="UPDATE"),
     )
@@ -418,10 +426,10 @@ def test_compile_lock_clause_not_supported(compiler):
 
 def test_compile_insert_output(compiler):
     query = InsertStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         columns=[ColumnNode(name="name"), ColumnNode(name="age")],
         values=[LiteralNode(value="Alice"), LiteralNode(value=30)],
-        returning_clause=ReturningClauseNode(expressions=[ColumnNode(name="id")]),
+        returning_clause=ReturningClauseNode(expressions=[ID_COL]),
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "INSERT INTO users (name, age) OUTPUT INSERTED.id VALUES (?, ?)"
@@ -429,16 +437,16 @@ def test_compile_insert_output(compiler):
 
 def test_compile_update_output(compiler):
     query = UpdateStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         set_clauses={"status": LiteralNode(value="active")},
         where_clause=WhereClauseNode(
             condition=BinaryOperationNode(
-                left=ColumnNode(name="id"),
+                left=ID_COL,
                 operator="=",
                 right=LiteralNode(value=1),
             )
         ),
-        returning_clause=ReturningClauseNode(expressions=[ColumnNode(name="id"), ColumnNode(name="status")]),
+        returning_clause=ReturningClauseNode(expressions=[ID_COL, ColumnNode(name="status")]),
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "UPDATE users SET status = ? OUTPUT INSERTED.id, INSERTED.status WHERE (id = ?)"
@@ -446,15 +454,15 @@ def test_compile_update_output(compiler):
 
 def test_compile_delete_output_star(compiler):
     query = DeleteStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         where_clause=WhereClauseNode(
             condition=BinaryOperationNode(
-                left=ColumnNode(name="id"),
+                left=ID_COL,
                 operator="=",
                 right=LiteralNode(value=1),
             )
         ),
-        returning_clause=ReturningClauseNode(expressions=[StarNode()]),
+        returning_clause=ReturningClauseNode(expressions=[STAR]),
     )
     compiled = compiler.compile(query)
     assert compiled.sql == "DELETE FROM users OUTPUT DELETED.* WHERE (id = ?)"
@@ -462,7 +470,7 @@ def test_compile_delete_output_star(compiler):
 
 def test_compile_output_rejects_non_column_expression(compiler):
     query = InsertStatementNode(
-        table=TableNode(name="users"),
+        table=USERS,
         columns=[ColumnNode(name="name")],
         values=[LiteralNode(value="Alice")],
         returning_clause=ReturningClauseNode(expressions=[LiteralNode(value=1)]),
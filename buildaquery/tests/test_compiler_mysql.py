@@ -12,8 +12,9 @@ from buildaquery.abstract_syntax_tree.models import (
     ConflictTargetNode, UpsertClauseNode, ReturningClauseNode
 )
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def compiler():
+    # compile() starts a fresh params list per call, so one instance is safe to share.
     return MySqlCompiler()
 
 def test_compile_simple_select(compiler):
@@ -229,6 +230,49 @@ def test_compile_subquery(compiler):
     compiled_in = compiler.compile(query_in)
     assert compiled_in.sql == "SELECT * FROM orders WHERE (user_id IN ((SELECT id FROM users)))"
 
+def test_compile_repeated_subquery_statement():
+    compiler = MySqlCompiler()
+
+    def adults(min_age):
+        return SelectStatementNode(
+            select_list=[ColumnNode(name="id")],
+            from_table=TableNode(name="users"),
+            where_clause=WhereClauseNode(
+                condition=BinaryOperationNode(left=ColumnNode(name="age"), operator=">", right=LiteralNode(value=min_age))
+            ),
+        )
+
+    def query(min_age, other=None):
+        # Without `other`, the same statement object appears twice, so its params are bound twice.
+        outer = adults(min_age)
+        inner = outer if other is None else adults(other)
+        return SelectStatementNode(
+            select_list=[StarNode()],
+            from_table=SubqueryNode(statement=outer, alias="u"),
+            where_clause=WhereClauseNode(
+                condition=InNode(expression=ColumnNode(name="id"), values=[SubqueryNode(statement=inner)])
+            ),
+        )
+
+    expected_sql = (
+        "SELECT * FROM (SELECT id FROM users WHERE (age > %s)) AS u "
+        "WHERE (id IN ((SELECT id FROM users WHERE (age > %s))))"
+    )
+    compiled = compiler.compile(query(18))
+    assert compiled.sql == expected_sql
+    assert compiled.params == [18, 18]
+
+    compiled = compiler.compile(query(21))
+    assert compiled.sql == expected_sql
+    assert compiled.params == [21, 21]
+
+    # Distinct statements share the reused tree's shape; the cache must not rebind them as [x, x].
+    compiled = compiler.compile(query(30, 40))
+    assert compiled.sql == expected_sql
+    assert compiled.params == [30, 40]
+    assert compiler.compile(query(50, 60)).params == [50, 60]
+    assert compiler.compile(query(70)).params == [70, 70]
+
 def test_compile_cte(compiler):
     inner_select = SelectStatementNode(select_list=[StarNode()], from_table=TableNode(name="users"))
     cte = CTENode(name="user_subset", subquery=inner_select)
@@ -414,3 +458,58 @@ def test_compile_update_returning_not_supported(compiler):
     )
     with pytest.raises(ValueError, match="MySQL does not support generic RETURNING payloads for UPDATE"):
         compiler.compile(query)
+
+def test_compile_cache_rebinds_values_for_same_shape():
+    compiler = MySqlCompiler()
+
+    def query(status, ids):
+        return SelectStatementNode(
+            select_list=[StarNode(), LiteralNode(value=status)],
+            from_table=TableNode(name="users"),
+            where_clause=WhereClauseNode(
+                condition=InNode(expression=ColumnNode(name="id"), values=[LiteralNode(value=v) for v in ids])
+            ),
+            ctes=[
+                CTENode(
+                    name="recent",
+                    subquery=SelectStatementNode(
+                        select_list=[StarNode()],
+                        from_table=TableNode(name="users"),
+                        limit=5,
+                    ),
+                )
+            ],
+        )
+
+    first = compiler.compile(query("a", [1, 2]))
+    first.params.append("caller mutation")
+    second = compiler.compile(query("b", [3, 4]))
+    assert len(compiler._compile_cache) == 1
+    assert second.sql == "WITH recent AS (SELECT * FROM users LIMIT 5) SELECT *, %s FROM users WHERE (id IN (%s, %s))"
+    assert second.params == ["b", 3, 4]
+
+    compiler.compile(query("c", [5, 6, 7]))
+    assert len(compiler._compile_cache) == 2
+
+def test_compile_cache_skips_trees_that_reuse_a_literal_node():
+    compiler = MySqlCompiler()
+
+    def query(left, right):
+        return SelectStatementNode(
+            select_list=[StarNode()],
+            from_table=TableNode(name="users"),
+            where_clause=WhereClauseNode(
+                condition=BinaryOperationNode(
+                    left=BinaryOperationNode(left=ColumnNode(name="id"), operator="=", right=left),
+                    operator="OR",
+                    right=BinaryOperationNode(left=ColumnNode(name="age"), operator="=", right=right),
+                )
+            ),
+        )
+
+    shared = LiteralNode(value=1)
+    assert compiler.compile(query(shared, shared)).params == [1, 1]
+    assert len(compiler._compile_cache) == 0
+    assert compiler.compile(query(LiteralNode(value=1), LiteralNode(value=2))).params == [1, 2]
+    assert compiler.compile(query(shared, shared)).params == [1, 1]
+    assert compiler.compile(query(LiteralNode(value=3), LiteralNode(value=4))).params == [3, 4]
@@ -119,6 +119,40 @@ def test_compile_in_between(compiler):
     assert compiled.sql == "SELECT * FROM users WHERE (id IN (:1, :2, :3))"
     assert compiled.params == [1, 2, 3]
 
+    offset_query = SelectStatementNode(
+        select_list=[StarNode()],
+        from_table=TableNode(name="users"),
+        where_clause=WhereClauseNode(
+            condition=BinaryOperationNode(
+                left=BinaryOperationNode(left=ColumnNode(name="age"), operator=">", right=LiteralNode(value=18)),
+                operator="AND",
+                right=InNode(
+                    expression=ColumnNode(name="id"),
+                    values=[LiteralNode(value=1), ColumnNode(name="parent_id"), LiteralNode(value=3)],
+                    negated=True
+                )
+            )
+        )
+    )
+    compiled = compiler.compile(offset_query)
+    assert compiled.sql == "SELECT * FROM users WHERE ((age > :1) AND (id NOT IN (:2, parent_id, :3)))"
+    assert compiled.params == [18, 1, 3]
+
+    literal_offset_query = SelectStatementNode(
+        select_list=[StarNode()],
+        from_table=TableNode(name="users"),
+        where_clause=WhereClauseNode(
+            condition=BinaryOperationNode(
+                left=BinaryOperationNode(left=ColumnNode(name="age"), operator=">", right=LiteralNode(value=18)),
+                operator="AND",
+                right=InNode(expression=ColumnNode(name="id"), values=[LiteralNode(value=1), LiteralNode(value=2)])
+            )
+        )
+    )
+    compiled = compiler.compile(literal_offset_query)
+    assert compiled.sql == "SELECT * FROM users WHERE ((age > :1) AND (id IN (:2, :3)))"
+    assert compiled.params == [18, 1, 2]
+
     between_query = SelectStatementNode(
         select_list=[StarNode()],
         from_table=TableNode(name="products"),
@@ -408,3 +408,54 @@ def test_compile_delete_returning_star(compiler):
     compiled = compiler.compile(query)
     assert compiled.sql == "DELETE FROM users WHERE (id = ?) RETURNING *"
     assert compiled.params == [7]
+
+def test_compile_marks_whether_statement_returns_rows(compiler):
+    select = SelectStatementNode(select_list=[StarNode()], from_table=TableNode(name="users"))
+    insert = InsertStatementNode(
+        table=TableNode(name="users"),
+        columns=[ColumnNode(name="name")],
+        values=[LiteralNode(value="Alice")],
+    )
+    insert_returning = InsertStatementNode(
+        table=TableNode(name="users"),
+        columns=[ColumnNode(name="name")],
+        values=[LiteralNode(value="Alice")],
+        returning_clause=ReturningClauseNode(expressions=[ColumnNode(name="id")]),
+    )
+
+    assert compiler.compile(select).returns_rows is True
+    assert compiler.compile(UnionNode(left=select, right=select)).returns_rows is True
+    assert compiler.compile(insert).returns_rows is False
+    assert compiler.compile(insert_returning).returns_rows is True
+    assert compiler.compile(DropStatementNode(table=TableNode(name="users"))).returns_rows is False
+    assert compiler.compile(LiteralNode(value=1)).returns_rows is None
+
+def test_compile_single_row_insert_reuses_cached_sql(compiler):
+    def insert(name, age):
+        return InsertStatementNode(
+            table=TableNode(name="users"),
+            columns=[ColumnNode(name="name"), ColumnNode(name="age")],
+            values=[LiteralNode(value=name), LiteralNode(value=age)],
+        )
+
+    first = compiler.compile(insert("Alice", 30))
+    second = compiler.compile(insert("Bob", 41))
+
+    assert first.sql == "INSERT INTO users (name, age) VALUES (?, ?)"
+    assert second.sql is first.sql
+    assert second.params == ["Bob", 41]
+    with pytest.raises(ValueError, match="same length"):
+        compiler.compile(
+            InsertStatementNode(
+                table=TableNode(name="users"),
+                columns=[ColumnNode(name="name")],
+                values=[LiteralNode(value="Alice"), LiteralNode(value=30)],
+            )
+        )
+    with pytest.raises(ValueError, match="Unsafe SQL identifier"):
+        compiler.compile(
+            InsertStatementNode(
+                table=TableNode(name="users; DROP TABLE users"),
+                values=[LiteralNode(value=1)],
+            )
+        )
@@ -83,6 +83,22 @@ def test_normalize_generic_execution_error_fallback() -> None:
     assert type(err) is ExecutionError
 
 
+def test_normalize_message_category_outranks_weaker_sqlstate() -> None:
+    err = normalize_execution_error(
+        dialect="postgres",
+        operation="execute",
+        exc=_FakeDriverError("Deadlock detected while waiting for lock timeout", "55P03"),
+    )
+    assert isinstance(err, DeadlockError)
+
+    err = normalize_execution_error(
+        dialect="mysql",
+        operation="execute",
+        exc=_FakeDriverError("syntax error near duplicate key clause", "42000"),
+    )
+    assert isinstance(err, IntegrityConstraintError)
+
+
 def test_normalized_error_message_includes_sqlstate_and_redacted_sql() -> None:
     err = normalize_execution_error(
         dialect="postgres",
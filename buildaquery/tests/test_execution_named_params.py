@@ -106,3 +106,14 @@ def test_named_params_hostile_value_stays_out_of_sql() -> None:
 
     assert "DROP TABLE users" not in sql
     assert params == [hostile]
+
+
+def test_compile_if_needed_passes_positional_compiled_query_through() -> None:
+    executor = SqliteExecutor(connection=sqlite3.connect(":memory:"))
+    positional = CompiledQuery(sql="SELECT ?", params=[1])
+    named = CompiledQuery(sql="SELECT :value", params={"value": 1})
+
+    assert executor._compile_if_needed(positional) is positional
+    rewritten = executor._compile_if_needed(named)
+    assert rewritten is not named
+    assert (rewritten.sql, rewritten.params) == ("SELECT ?", [1])
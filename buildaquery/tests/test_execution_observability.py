@@ -382,3 +382,48 @@ def test_compose_event_observers_dispatches_to_all() -> None:
     )
     assert sink1 == ["query.start"]
     assert sink2 == ["query.start"]
+
+
+def test_observability_enabled_flag_tracks_settings_reassignment() -> None:
+    events: list[QueryObservation] = []
+    executor = SqliteExecutor(connection=sqlite3.connect(":memory:"))
+
+    assert ObservabilitySettings().has_any_subscriber() is False
+    assert executor._observability_enabled is False
+    executor.fetch_all(CompiledQuery(sql="SELECT 1", params=[]))
+
+    executor.observability_settings = ObservabilitySettings(query_observer=events.append)
+    assert executor._observability_enabled is True
+    executor.fetch_all(CompiledQuery(sql="SELECT 1", params=[]))
+
+    assert [event.operation for event in events] == ["fetch_all"]
+
+
+def test_execution_events_carry_precomputed_executor_fields() -> None:
+    events: list[ExecutionEvent] = []
+    executor = SqliteExecutor(
+        connection=sqlite3.connect(":memory:"),
+        observability_settings=ObservabilitySettings(event_observer=events.append),
+    )
+
+    executor.fetch_all(CompiledQuery(sql="SELECT 1", params=[]))
+
+    assert events
+    assert {(event.dialect, event.executor) for event in events} == {("sqlite", "SqliteExecutor")}
+    assert not hasattr(events[0], "__dict__")
+
+
+def test_connection_acquire_events_wrap_acquire_hook() -> None:
+    events: list[ExecutionEvent] = []
+    conn = sqlite3.connect(":memory:")
+    executor = SqliteExecutor(
+        acquire_connection=lambda: conn,
+        release_connection=lambda _: None,
+        observability_settings=ObservabilitySettings(event_observer=events.append),
+    )
+
+    executor.fetch_all(CompiledQuery(sql="SELECT 1", params=[]))
+
+    acquire_events = [event for event in events if event.event.startswith("connection.acquire")]
+    assert [event.event for event in acquire_events] == ["connection.acquire.start", "connection.acquire.end"]
+    assert acquire_events[1].connection_id == str(id(conn))
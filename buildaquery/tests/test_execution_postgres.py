@@ -21,15 +21,16 @@ def test_postgres_executor_fetch_all(mock_psycopg):
     query = CompiledQuery(sql="SELECT %s", params=[1])
     
     mock_conn = mock_psycopg.connect.return_value
-    mock_cur = mock_conn.cursor.return_value.__enter__.return_value
+    mock_cur = mock_conn.execute.return_value
     mock_cur.fetchall.return_value = [(1,)]
     
     results = executor.fetch_all(query)
     
     assert results == [(1,)]
     mock_psycopg.connect.assert_called_once_with("dsn")
-    mock_cur.execute.assert_called_once_with("SELECT %s", [1])
+    mock_conn.execute.assert_called_once_with("SELECT %s", [1])
     mock_cur.fetchall.assert_called_once()
+    mock_cur.close.assert_called_once()
     mock_conn.close.assert_called_once()
 
 
@@ -38,7 +39,7 @@ def test_postgres_executor_fetch_all_dict_rows(mock_psycopg):
     query = CompiledQuery(sql="SELECT %s AS id", params=[1])
 
     mock_conn = mock_psycopg.connect.return_value
-    mock_cur = mock_conn.cursor.return_value.__enter__.return_value
+    mock_cur = mock_conn.execute.return_value
     mock_cur.description = [("id", None, None, None, None, None, None)]
     mock_cur.fetchall.return_value = [(1,)]
 
@@ -52,7 +53,7 @@ def test_postgres_executor_fetch_one_model_row(mock_psycopg):
     query = CompiledQuery(sql="SELECT %s AS id", params=[1])
 
     mock_conn = mock_psycopg.connect.return_value
-    mock_cur = mock_conn.cursor.return_value.__enter__.return_value
+    mock_cur = mock_conn.execute.return_value
     mock_cur.description = [("id", None, None, None, None, None, None)]
     mock_cur.fetchone.return_value = (1,)
 
@@ -65,11 +66,12 @@ def test_postgres_executor_execute(mock_psycopg):
     query = CompiledQuery(sql="INSERT INTO t VALUES (%s)", params=[10])
     
     mock_conn = mock_psycopg.connect.return_value
-    mock_cur = mock_conn.cursor.return_value.__enter__.return_value
+    mock_cur = mock_conn.execute.return_value
     
     executor.execute(query)
     
-    mock_cur.execute.assert_called_once_with("INSERT INTO t VALUES (%s)", [10])
+    mock_conn.execute.assert_called_once_with("INSERT INTO t VALUES (%s)", [10])
+    mock_cur.close.assert_called_once()
     mock_conn.close.assert_called_once()
 
 def test_postgres_executor_execute_many(mock_psycopg):
@@ -88,6 +90,32 @@ def test_postgres_executor_execute_many(mock_psycopg):
     )
     mock_conn.close.assert_called_once()
 
+def test_postgres_executor_fetch_iter_streams_server_side_cursor(mock_psycopg):
+    executor = PostgresExecutor(connection_info="dsn")
+    query = CompiledQuery(sql="SELECT id FROM t", params=[])
+
+    mock_conn = mock_psycopg.connect.return_value
+    mock_conn.autocommit = False
+    mock_cur = mock_conn.cursor.return_value.__enter__.return_value
+    mock_cur.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+
+    rows = list(executor.fetch_iter(query, chunk_size=2))
+
+    assert rows == [(1,), (2,), (3,)]
+    cursor_kwargs = mock_conn.cursor.call_args.kwargs
+    assert cursor_kwargs["name"].startswith("baq_")
+    assert cursor_kwargs["withhold"] is False
+    assert mock_cur.itersize == 2
+    mock_cur.execute.assert_called_once_with("SELECT id FROM t", [])
+    mock_conn.rollback.assert_called_once()
+    mock_conn.close.assert_called_once()
+
+def test_postgres_executor_fetch_iter_rejects_invalid_chunk_size(mock_psycopg):
+    executor = PostgresExecutor(connection_info="dsn")
+
+    with pytest.raises(ValueError, match="chunk_size"):
+        executor.fetch_iter(CompiledQuery(sql="SELECT 1", params=[]), chunk_size=0)
+
 def test_postgres_transaction_lifecycle_connection_info(mock_psycopg):
     executor = PostgresExecutor(connection_info="dsn")
     mock_conn = mock_psycopg.connect.return_value
@@ -108,14 +136,14 @@ def test_postgres_transaction_lifecycle_connection_info(mock_psycopg):
 
 def test_postgres_transaction_with_existing_connection():
     mock_conn = MagicMock()
-    mock_cur = mock_conn.cursor.return_value.__enter__.return_value
+    mock_cur = mock_conn.execute.return_value
     executor = PostgresExecutor(connection=mock_conn)
 
     executor.begin()
     executor.execute(CompiledQuery(sql="SELECT %s", params=[1]))
     executor.rollback()
 
-    mock_cur.execute.assert_any_call("SELECT %s", [1])
+    mock_conn.execute.assert_any_call("SELECT %s", [1])
     mock_conn.rollback.assert_called_once()
     mock_conn.close.assert_not_called()
 
@@ -133,9 +161,11 @@ def test_postgres_transaction_errors():
     with pytest.raises(RuntimeError):
         executor.begin()
 
-def test_postgres_executor_import_error():
+def test_postgres_executor_import_error(monkeypatch):
     # Test that it raises ImportError if psycopg is missing
     executor = PostgresExecutor(connection_info="dsn")
+    # The module cache lives on the class, so clear anything an earlier test imported.
+    monkeypatch.setattr(PostgresExecutor, "_psycopg", None)
     
     # We patch 'builtins.__import__' but only for when 'psycopg' is requested
     # Actually, a cleaner way is to use 'side_effect' on a patch that we know will be called
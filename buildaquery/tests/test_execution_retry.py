@@ -5,7 +5,7 @@ import pytest
 from buildaquery.compiler.compiled_query import CompiledQuery
 from buildaquery.execution.base import Executor
 from buildaquery.execution.errors import DeadlockError, IntegrityConstraintError
-from buildaquery.execution.retry import RetryPolicy
+from buildaquery.execution.retry import RetryPolicy, _compute_delay, run_with_retry
 
 
 class _FakeExecutor(Executor):
@@ -130,3 +130,117 @@ def test_execute_many_with_retry_success_after_retry() -> None:
     )
 
     assert executor.execute_many_calls == 2
+
+
+def test_run_with_retry_first_retry_is_immediate() -> None:
+    executor = _FakeExecutor()
+    executor.execute_failures = [
+        _SqlStateError("deadlock detected", "40P01"),
+        _SqlStateError("deadlock detected", "40P01"),
+        _SqlStateError("deadlock detected", "40P01"),
+    ]
+    delays: list[float] = []
+    policy = RetryPolicy(max_attempts=4, base_delay_seconds=0.1, backoff_multiplier=2.0)
+
+    run_with_retry(
+        operation=lambda: executor.execute(CompiledQuery(sql="SELECT 1", params=[])),
+        normalize_error=lambda exc: executor._normalize_execution_error(operation="execute", exc=exc),
+        policy=policy,
+        sleep_fn=delays.append,
+    )
+
+    assert delays == [0.1, 0.2]
+    assert executor.execute_calls == 4
+
+
+def test_run_with_retry_backs_off_from_first_retry_when_disabled() -> None:
+    executor = _FakeExecutor()
+    executor.execute_failures = [
+        _SqlStateError("deadlock detected", "40P01"),
+        _SqlStateError("deadlock detected", "40P01"),
+    ]
+    delays: list[float] = []
+    policy = RetryPolicy(
+        max_attempts=3,
+        base_delay_seconds=0.1,
+        backoff_multiplier=2.0,
+        first_retry_immediate=False,
+    )
+
+    run_with_retry(
+        operation=lambda: executor.execute(CompiledQuery(sql="SELECT 1", params=[])),
+        normalize_error=lambda exc: executor._normalize_execution_error(operation="execute", exc=exc),
+        policy=policy,
+        sleep_fn=delays.append,
+    )
+
+    assert delays == [0.1, 0.2]
+
+
+def test_retry_policy_precomputes_capped_delay_table() -> None:
+    policy = RetryPolicy(max_attempts=10, base_delay_seconds=0.1, max_delay_seconds=0.5, backoff_multiplier=2.0)
+
+    assert policy._delays == (0.1, 0.2, 0.4, 0.5)
+    assert _compute_delay(policy, 1) == 0.0
+    assert _compute_delay(policy, 3) == 0.2
+    assert _compute_delay(policy, 9) == 0.5
+
+
+def test_retry_policy_delay_table_follows_field_changes() -> None:
+    policy = RetryPolicy(max_attempts=5)
+    assert [_compute_delay(policy, attempt) for attempt in range(1, 5)] == [0.0, 0.05, 0.1, 0.2]
+
+    policy.base_delay_seconds = 0.5
+    policy.max_delay_seconds = 3.0
+
+    assert [_compute_delay(policy, attempt) for attempt in range(1, 5)] == [0.0, 0.5, 1.0, 2.0]
+
+
+def test_retry_policy_large_attempt_budget_does_not_overflow() -> None:
+    policy = RetryPolicy(max_attempts=5000, base_delay_seconds=0.01, max_delay_seconds=1.0)
+
+    assert _compute_delay(policy, 4999) == 1.0
+
+
+def test_run_with_retry_shares_setup_context_across_attempts() -> None:
+    executor = _FakeExecutor()
+    executor.execute_failures = [_SqlStateError("deadlock detected", "40P01")]
+    contexts: list[object] = []
+    torn_down: list[object] = []
+    handle = object()
+
+    def operation(ctx: object) -> str:
+        contexts.append(ctx)
+        executor.execute(CompiledQuery(sql="SELECT 1", params=[]))
+        return "ok"
+
+    result = run_with_retry(
+        operation=operation,
+        normalize_error=lambda exc: executor._normalize_execution_error(operation="execute", exc=exc),
+        policy=RetryPolicy(max_attempts=3),
+        sleep_fn=lambda _: None,
+        setup=lambda: handle,
+        teardown=torn_down.append,
+    )
+
+    assert result == "ok"
+    assert contexts == [handle, handle]
+    assert torn_down == [handle]
+
+
+def test_run_with_retry_tears_down_setup_context_on_giveup() -> None:
+    torn_down: list[str] = []
+
+    def operation(ctx: str) -> None:
+        raise _SqlStateError("duplicate key value violates unique constraint", "23505")
+
+    with pytest.raises(IntegrityConstraintError):
+        run_with_retry(
+            operation=operation,
+            normalize_error=lambda exc: _FakeExecutor()._normalize_execution_error(operation="execute", exc=exc),
+            policy=RetryPolicy(max_attempts=3),
+            setup=lambda: "conn",
+            teardown=torn_down.append,
+        )
+
+    assert torn_down == ["conn"]
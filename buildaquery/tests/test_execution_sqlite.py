@@ -1,6 +1,7 @@
 import pytest
 import sqlite3
 from dataclasses import dataclass
+from unittest.mock import MagicMock, patch
 
 from buildaquery.abstract_syntax_tree.models import (
     BinaryOperationNode,
@@ -11,6 +12,8 @@ from buildaquery.abstract_syntax_tree.models import (
     WhereClauseNode,
 )
 from buildaquery.compiler.compiled_query import CompiledQuery
+from buildaquery.execution.errors import ProgrammingExecutionError
+from buildaquery.execution.observability import ObservabilitySettings
 from buildaquery.execution.sqlite import SqliteExecutor
 
 
@@ -150,3 +153,518 @@ def test_sqlite_executor_fetch_one_model_row() -> None:
 def test_sqlite_executor_row_output_model_requires_row_model() -> None:
     with pytest.raises(ValueError, match="row_model is required"):
         SqliteExecutor(connection=sqlite3.connect(":memory:"), row_output="model")
+
+
+def test_sqlite_execute_many_owned_connection_commits_batch(tmp_path) -> None:
+    db_path = tmp_path / "many.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path), batch_size=2)
+    executor.execute_raw("CREATE TABLE t_batch (id INTEGER PRIMARY KEY, value TEXT)")
+
+    executor.execute_many(
+        "INSERT INTO t_batch (id, value) VALUES (?, ?)",
+        [[1, "a"], [2, "b"], [3, "c"], [4, "d"], [5, "e"]],
+    )
+
+    rows = executor.fetch_all(CompiledQuery(sql="SELECT id FROM t_batch ORDER BY id", params=[]))
+    assert rows == [(1,), (2,), (3,), (4,), (5,)]
+
+
+def test_sqlite_execute_many_owned_connection_rolls_back_whole_batch(tmp_path) -> None:
+    db_path = tmp_path / "many_rollback.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path))
+    executor.execute_raw("CREATE TABLE t_batch (id INTEGER PRIMARY KEY, value TEXT)")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        executor.execute_many(
+            "INSERT INTO t_batch (id, value) VALUES (?, ?)",
+            [[1, "a"], [1, "dup"]],
+        )
+
+    rows = executor.fetch_all(CompiledQuery(sql="SELECT id FROM t_batch", params=[]))
+    assert rows == []
+
+
+def test_sqlite_driver_module_is_cached_on_class() -> None:
+    first = SqliteExecutor(connection_info=":memory:")
+    second = SqliteExecutor(connection_info=":memory:")
+
+    module = first._get_sqlite3()
+
+    assert SqliteExecutor._sqlite3 is module
+    assert second._get_sqlite3() is module
+    assert "_sqlite3" not in vars(second)
+
+
+def test_sqlite_execute_raw_row_sequences_dispatch_to_executemany(tmp_path) -> None:
+    db_path = tmp_path / "raw_many.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path))
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+
+    executor.execute_raw("INSERT INTO items (id, name) VALUES (?, ?)", [(1, "a"), [2, "b"]])
+    executor.execute_raw("INSERT INTO items (id, name) VALUES (?, ?)", (3, "c"))
+
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id, name FROM items ORDER BY id")) == [
+        (1, "a"),
+        (2, "b"),
+        (3, "c"),
+    ]
+
+
+def test_sqlite_execute_raw_row_sequences_skip_observation_without_observers() -> None:
+    executor = SqliteExecutor(connection_info=":memory:")
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+
+    with patch.object(SqliteExecutor, "_observe_query") as observe_query:
+        executor.execute_raw("INSERT INTO items (id) VALUES (?)", [(1,), (2,)])
+
+    observe_query.assert_not_called()
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM items ORDER BY id")) == [(1,), (2,)]
+    executor.close()
+
+
+def test_sqlite_batch_commits_queued_statements_once(tmp_path) -> None:
+    db_path = tmp_path / "batch.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path))
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+
+    with executor.batch():
+        executor.execute(CompiledQuery(sql="INSERT INTO items (id, name) VALUES (?, ?)", params=[1, "a"]))
+        executor.execute_raw("INSERT INTO items (id, name) VALUES (?, ?)", (2, "b"))
+        executor.execute_many("INSERT INTO items (id, name) VALUES (?, ?)", [(3, "c"), (4, "d")])
+        executor.execute_raw("UPDATE items SET name = :name WHERE id = :id", {"name": "z", "id": 1})
+        assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM items")) == []
+
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id, name FROM items ORDER BY id")) == [
+        (1, "z"),
+        (2, "b"),
+        (3, "c"),
+        (4, "d"),
+    ]
+
+
+def test_sqlite_batch_groups_identical_sql_into_executemany() -> None:
+    conn = MagicMock()
+    conn.in_transaction = False
+    executor = SqliteExecutor(acquire_connection=lambda: conn)
+
+    with executor.batch():
+        executor.execute_raw("INSERT INTO items (id) VALUES (?)", (1,))
+        executor.execute_raw("INSERT INTO items (id) VALUES (?)", (2,))
+        executor.execute_raw("DELETE FROM items WHERE id = ?", (1,))
+
+    conn.executemany.assert_called_once_with("INSERT INTO items (id) VALUES (?)", [(1,), (2,)])
+    assert [c.args for c in conn.execute.call_args_list] == [
+        ("BEGIN IMMEDIATE",),
+        ("DELETE FROM items WHERE id = ?", (1,)),
+    ]
+    conn.commit.assert_called_once()
+
+
+def test_sqlite_batch_runs_repeated_non_dml_statements_individually() -> None:
+    conn = MagicMock()
+    conn.in_transaction = False
+    executor = SqliteExecutor(acquire_connection=lambda: conn)
+
+    with executor.batch():
+        executor.execute_void(CompiledQuery(sql="PRAGMA optimize", params=[]))
+        executor.execute_void(CompiledQuery(sql="PRAGMA optimize", params=[]))
+
+    conn.executemany.assert_not_called()
+    assert [c.args for c in conn.execute.call_args_list] == [
+        ("BEGIN IMMEDIATE",),
+        ("PRAGMA optimize", []),
+        ("PRAGMA optimize", []),
+    ]
+
+
+def test_sqlite_batch_rejects_row_returning_statements() -> None:
+    executor = SqliteExecutor(connection_info=":memory:")
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+
+    with executor.batch():
+        with pytest.raises(RuntimeError, match="Row-returning"):
+            executor.execute(CompiledQuery(sql="SELECT id FROM items WHERE id = ?", params=[1]))
+        with pytest.raises(RuntimeError, match="Row-returning"):
+            executor.execute_raw("SELECT id FROM items WHERE id = ?", (1,))
+        executor.execute_raw("INSERT INTO items (id) VALUES (?)", (1,))
+
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM items")) == [(1,)]
+    executor.close()
+
+
+def test_sqlite_batch_discards_queue_on_error(tmp_path) -> None:
+    db_path = tmp_path / "batch_error.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path))
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+
+    with pytest.raises(ValueError):
+        with executor.batch():
+            executor.execute_raw("INSERT INTO items (id) VALUES (?)", (1,))
+            raise ValueError("boom")
+
+    with pytest.raises(sqlite3.IntegrityError):
+        with executor.batch():
+            executor.execute_raw("INSERT INTO items (id) VALUES (?)", (1,))
+            executor.execute_raw("INSERT INTO items (id) VALUES (?)", (1,))
+
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM items")) == []
+    with executor.batch():
+        with pytest.raises(RuntimeError, match="Batch already active"):
+            executor.batch().__enter__()
+
+
+def test_sqlite_pooled_connection_is_shared_with_transactions(tmp_path) -> None:
+    db_path = tmp_path / "pooled.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path))
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    pooled = executor._pool._idle[-1][0]
+
+    executor.begin()
+    assert executor._tx is not None and executor._tx.connection is pooled
+    executor.execute_raw("INSERT INTO items (id) VALUES (?)", (1,))
+    executor.commit()
+
+    assert [conn for conn, _ in executor._pool._idle] == [pooled]
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM items")) == [(1,)]
+
+    executor.close()
+    assert executor._pool._idle == []
+    assert executor._pool._open == 0
+
+
+def test_sqlite_pool_opens_up_to_pool_size_connections(tmp_path) -> None:
+    db_path = tmp_path / "pool_size.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path), pool_size=2)
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+
+    first = executor._pool.acquire()
+    second = executor._pool.acquire()
+    assert first is not second
+    assert executor._pool._open == 2
+    executor._pool.release(first)
+    executor._pool.release(second)
+
+    assert executor._pool.acquire() is second
+    executor._pool.release(second)
+    executor.close()
+
+    with pytest.raises(ValueError, match="pool_size"):
+        SqliteExecutor(connection_info=str(db_path), pool_size=0)
+
+
+def test_sqlite_exhausted_pool_raises_after_timeout(tmp_path) -> None:
+    db_path = tmp_path / "exhausted.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path), pool_size=1, pool_timeout_seconds=0.01)
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+
+    held = executor._pool.acquire()
+    with pytest.raises(RuntimeError, match="pooled connections are in use"):
+        executor.fetch_all(CompiledQuery(sql="SELECT id FROM items"))
+    executor._pool.release(held)
+
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM items")) == []
+    executor.close()
+
+    with pytest.raises(ValueError, match="pool_timeout_seconds"):
+        SqliteExecutor(connection_info=str(db_path), pool_timeout_seconds=0)
+
+
+def test_sqlite_close_uses_closed_flag_for_subclasses() -> None:
+    class TrackingExecutor(SqliteExecutor):
+        def _get_connection_for_query(self):
+            self.lookups = getattr(self, "lookups", 0) + 1
+            return super()._get_connection_for_query()
+
+    executor = TrackingExecutor(connection_info=":memory:")
+    executor.fetch_all(CompiledQuery(sql="SELECT 1"))
+    executor.close()
+
+    assert "_get_connection_for_query" not in vars(executor)
+    with pytest.raises(RuntimeError, match="Executor is closed"):
+        executor.fetch_all(CompiledQuery(sql="SELECT 1"))
+    assert executor.lookups == 2
+
+
+def test_sqlite_memory_database_uses_single_pooled_connection() -> None:
+    executor = SqliteExecutor(connection_info=":memory:", pool_size=4)
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    executor.execute_raw("INSERT INTO items (id) VALUES (?)", (1,))
+
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM items")) == [(1,)]
+    assert executor._pool._open == 1
+    executor.close()
+
+
+def test_sqlite_pooled_connection_rolls_back_failed_write(tmp_path) -> None:
+    db_path = tmp_path / "pooled_failure.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path))
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    executor.execute_raw("INSERT INTO items (id) VALUES (?)", (1,))
+
+    with pytest.raises(sqlite3.IntegrityError):
+        executor.execute_raw("INSERT INTO items (id) VALUES (?)", (1,))
+
+    assert executor._pool._idle[-1][0].in_transaction is False
+    executor.close()
+
+
+def test_sqlite_execute_skips_commit_without_open_transaction() -> None:
+    conn = MagicMock()
+    conn.in_transaction = False
+    conn.execute.return_value.description = (("id",),)
+    conn.execute.return_value.fetchall.return_value = [(1,)]
+    executor = SqliteExecutor(acquire_connection=lambda: conn)
+
+    assert executor.execute(CompiledQuery(sql="SELECT 1 AS id")) == [(1,)]
+    conn.commit.assert_not_called()
+
+    conn.in_transaction = True
+    executor.execute(CompiledQuery(sql="INSERT INTO t (id) VALUES (1) RETURNING id"))
+    conn.commit.assert_called_once()
+
+
+def test_sqlite_execute_raw_runs_trigger_bodies_inside_transactions(tmp_path) -> None:
+    db_path = tmp_path / "trigger.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path))
+    executor.execute_raw("CREATE TABLE a (id INTEGER PRIMARY KEY)")
+    executor.execute_raw("CREATE TABLE audit (id INTEGER)")
+
+    executor.begin()
+    executor.execute_raw(
+        "CREATE TRIGGER a_audit AFTER INSERT ON a BEGIN INSERT INTO audit (id) VALUES (NEW.id); END;"
+    )
+    executor.execute_raw("INSERT INTO a (id) VALUES (1)")
+    executor.commit()
+
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM audit")) == [(1,)]
+    executor.close()
+
+
+def test_sqlite_execute_raw_without_params_skips_binding() -> None:
+    conn = MagicMock()
+    conn.in_transaction = False
+    executor = SqliteExecutor(connection=conn)
+
+    executor.execute_raw("PRAGMA foreign_keys = ON;")
+    executor.execute_raw("CREATE TRIGGER t AFTER INSERT ON a BEGIN DELETE FROM b; END;")
+
+    assert [c.args for c in conn.execute.call_args_list] == [
+        ("PRAGMA foreign_keys = ON;",),
+        ("CREATE TRIGGER t AFTER INSERT ON a BEGIN DELETE FROM b; END;",),
+    ]
+    conn.executescript.assert_not_called()
+
+
+def test_sqlite_statement_cache_size_is_forwarded(monkeypatch) -> None:
+    module = MagicMock()
+    monkeypatch.setattr(SqliteExecutor, "_sqlite3", module)
+    executor = SqliteExecutor(connection_info="db.sqlite", connect_timeout_seconds=2, statement_cache_size=256)
+
+    executor.execute_raw("SELECT 1")
+
+    module.connect.assert_called_once_with(
+        "db.sqlite",
+        check_same_thread=False,
+        timeout=2,
+        cached_statements=256,
+    )
+    with pytest.raises(ValueError, match="statement_cache_size"):
+        SqliteExecutor(connection_info=":memory:", statement_cache_size=-1)
+    with pytest.raises(ValueError, match="batch_size"):
+        SqliteExecutor(connection_info=":memory:", batch_size=0)
+
+
+def test_sqlite_execute_raw_many_runs_statements_in_one_transaction(tmp_path) -> None:
+    db_path = tmp_path / "raw_many_script.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path))
+
+    executor.execute_raw_many(
+        [
+            "CREATE TABLE items (id INTEGER PRIMARY KEY)",
+            "INSERT INTO items (id) VALUES (1);",
+            "INSERT INTO items (id) VALUES (2)",
+        ]
+    )
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM items ORDER BY id")) == [(1,), (2,)]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        executor.execute_raw_many(
+            [
+                "INSERT INTO items (id) VALUES (3)",
+                "INSERT INTO items (id) VALUES (1)",
+            ]
+        )
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM items ORDER BY id")) == [(1,), (2,)]
+    assert executor._pool._idle[-1][0].in_transaction is False
+
+
+def test_sqlite_execute_raw_many_allows_trailing_line_comments(tmp_path) -> None:
+    db_path = tmp_path / "raw_many_comments.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path))
+    executor.execute_raw("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+
+    executor.execute_raw_many(["INSERT INTO t VALUES (1) -- first", "INSERT INTO t VALUES (2)"])
+
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM t ORDER BY id")) == [(1,), (2,)]
+    executor.close()
+
+
+def test_sqlite_execute_raw_many_respects_raw_sql_policy() -> None:
+    executor = SqliteExecutor(connection_info=":memory:", raw_sql_policy="deny_untrusted")
+
+    with pytest.raises(ProgrammingExecutionError):
+        executor.execute_raw_many(["CREATE TABLE t (id INTEGER)"])
+
+    executor.execute_raw_many(["CREATE TABLE t (id INTEGER)"], trusted=True)
+
+
+def test_sqlite_execute_many_chunks_by_batch_size() -> None:
+    conn = MagicMock()
+    conn.in_transaction = False
+    executor = SqliteExecutor(acquire_connection=lambda: conn, batch_size=2)
+
+    executor.execute_many("INSERT INTO t (id) VALUES (?)", [(1,), (2,), (3,), (4,), (5,)])
+
+    cursor = conn.cursor.return_value
+    assert conn.cursor.call_count == 1
+    assert [c.args[1] for c in cursor.executemany.call_args_list] == [[(1,), (2,)], [(3,), (4,)], [(5,)]]
+    cursor.close.assert_called_once()
+    conn.commit.assert_called_once()
+
+
+def test_sqlite_execute_many_streams_generator_param_sets(tmp_path) -> None:
+    db_path = tmp_path / "many_stream.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path), batch_size=3)
+    executor.execute_raw("CREATE TABLE t_stream (id INTEGER PRIMARY KEY)")
+
+    executor.execute_many("INSERT INTO t_stream (id) VALUES (?)", ((i,) for i in range(1, 8)))
+    executor.execute_many("INSERT INTO t_stream (id) VALUES (?)", iter(()))
+
+    rows = executor.fetch_all(CompiledQuery(sql="SELECT COUNT(*) FROM t_stream"))
+    assert rows == [(7,)]
+    executor.close()
+
+
+def test_sqlite_begin_failure_releases_connection_and_leaves_no_transaction() -> None:
+    conn = MagicMock()
+    conn.execute.side_effect = sqlite3.OperationalError("database is locked")
+    released: list[object] = []
+    executor = SqliteExecutor(acquire_connection=lambda: conn, release_connection=released.append)
+
+    with pytest.raises(sqlite3.OperationalError):
+        executor.begin("IMMEDIATE")
+
+    assert released == [conn]
+    assert executor._tx is None
+    with pytest.raises(RuntimeError, match="No active transaction"):
+        executor.commit()
+
+
+def test_sqlite_queries_after_close_raise() -> None:
+    executor = SqliteExecutor(connection_info=":memory:")
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    executor.close()
+
+    with pytest.raises(RuntimeError, match="Executor is closed"):
+        executor.fetch_all(CompiledQuery(sql="SELECT id FROM items"))
+    with pytest.raises(RuntimeError, match="Executor is closed"):
+        executor.execute_many("INSERT INTO items (id) VALUES (?)", [(1,)])
+    with pytest.raises(RuntimeError, match="Executor is closed"):
+        executor.begin()
+
+
+def test_sqlite_execute_skips_description_for_known_writes() -> None:
+    conn = MagicMock()
+    executor = SqliteExecutor(connection=conn)
+
+    result = executor.execute(CompiledQuery(sql="DELETE FROM items", params=[], returns_rows=False))
+
+    assert result is None
+    conn.execute.return_value.fetchall.assert_not_called()
+
+
+def test_sqlite_execute_void_runs_and_commits_without_reading_results(tmp_path) -> None:
+    db_path = tmp_path / "void.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path))
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+
+    assert executor.execute_void(CompiledQuery(sql="INSERT INTO items (id) VALUES (?)", params=[1])) is None
+    with executor.batch():
+        executor.execute_void(CompiledQuery(sql="INSERT INTO items (id) VALUES (?)", params=[2]))
+
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM items ORDER BY id")) == [(1,), (2,)]
+    executor.close()
+
+
+def test_sqlite_begin_skips_transaction_id_when_unobserved() -> None:
+    executor = SqliteExecutor(connection_info=":memory:")
+
+    executor.begin()
+    assert executor._tx is not None
+    assert executor._tx.transaction_id is None
+    assert executor._tx.started_at is None
+    executor.commit()
+
+    events: list[object] = []
+    executor.observability_settings = ObservabilitySettings(event_observer=events.append)
+    executor.begin()
+    assert executor._tx is not None and executor._tx.transaction_id is not None
+    executor.rollback()
+    executor.close()
+
+
+def test_sqlite_savepoint_names_are_validated() -> None:
+    executor = SqliteExecutor(connection_info=":memory:")
+    executor.begin()
+
+    with pytest.raises(ValueError, match="Unsafe SQL identifier for savepoint name"):
+        executor.savepoint("sp1; DROP TABLE items")
+
+    executor.savepoint("sp1")
+    executor.rollback_to_savepoint("sp1")
+    executor.release_savepoint("sp1")
+    executor.rollback()
+    executor.close()
+
+
+def test_sqlite_performance_profile_applies_pragmas_once_per_connection(tmp_path) -> None:
+    db_path = tmp_path / "bulk.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path), performance_profile="bulk")
+
+    assert executor.fetch_one(CompiledQuery(sql="PRAGMA journal_mode")) == ("wal",)
+    assert executor.fetch_one(CompiledQuery(sql="PRAGMA synchronous")) == (1,)
+    assert executor.fetch_one(CompiledQuery(sql="PRAGMA temp_store")) == (2,)
+    executor.close()
+
+    default = SqliteExecutor(connection_info=str(tmp_path / "safe.sqlite"))
+    assert default.fetch_one(CompiledQuery(sql="PRAGMA journal_mode")) == ("delete",)
+    default.close()
+
+    with pytest.raises(ValueError, match="performance_profile"):
+        SqliteExecutor(connection_info=str(db_path), performance_profile="turbo")  # type: ignore[arg-type]
+
+
+def test_sqlite_read_replicas_serve_selects_outside_transactions(tmp_path) -> None:
+    db_path = tmp_path / "replicas.sqlite"
+    executor = SqliteExecutor(connection_info=str(db_path), read_replicas=2)
+    executor.execute_raw("CREATE TABLE items (id INTEGER PRIMARY KEY)")
+    executor.execute_raw("INSERT INTO items (id) VALUES (?)", (1,))
+
+    assert executor.fetch_all(CompiledQuery(sql="SELECT id FROM items")) == [(1,)]
+    assert executor._readers is not None
+    reader = executor._readers._idle[-1][0]
+    assert reader not in [conn for conn, _ in executor._pool._idle]
+    assert reader.execute("PRAGMA query_only").fetchone() == (1,)
+
+    executor.begin()
+    executor.execute_raw("INSERT INTO items (id) VALUES (?)", (2,))
+    assert executor.fetch_one(CompiledQuery(sql="SELECT COUNT(*) FROM items")) == (2,)
+    executor.rollback()
+    assert executor.fetch_one(CompiledQuery(sql="SELECT COUNT(*) FROM items")) == (1,)
+
+    executor.close()
+    assert executor._readers is None
+    with pytest.raises(RuntimeError, match="Executor is closed"):
+        executor.fetch_all(CompiledQuery(sql="SELECT id FROM items"))
+    with pytest.raises(ValueError, match="read_replicas"):
+        SqliteExecutor(connection_info=":memory:", read_replicas=1)
@@ -3,6 +3,7 @@ from buildaquery import (
     ClickHouseCompiler,
     ClickHouseExecutor,
     CompiledQuery,
+    ConnectionPool,
     ConnectionSettings,
     ExecutorCapabilities,
     DuckDbCompiler,
@@ -33,6 +34,7 @@ def test_root_public_api_exports_are_importable() -> None:
     assert MySqlCompiler is not None
     assert RetryPolicy is not None
     assert ConnectionSettings is not None
+    assert ConnectionPool is not None
     assert ExecutorCapabilities is not None
     assert ObservabilitySettings is not None
     assert InMemoryMetricsAdapter is not None
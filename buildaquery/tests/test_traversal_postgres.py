@@ -42,3 +42,30 @@ def test_transformer_override():
     transformed = transformer.visit(col)
     assert transformed.name == "ID"
     assert transformed is not col
+
+def test_visitor_dispatch_table_is_per_class():
+    class OtherVisitor(Visitor):
+        def visit_ColumnNode(self, node: ColumnNode) -> str:
+            return f"Other:{node.name}"
+
+    col = ColumnNode(name="id")
+    assert MockVisitor().visit(col) == "Col:id"
+    assert OtherVisitor().visit(col) == "Other:id"
+    assert MockVisitor._dispatch[ColumnNode] == "visit_ColumnNode"
+    assert OtherVisitor._dispatch[ColumnNode] == "visit_ColumnNode"
+    assert Visitor._dispatch == {}
+
+def test_visitor_dispatch_resolves_handlers_on_instance():
+    class StaticVisitor(Visitor):
+        @staticmethod
+        def visit_ColumnNode(node: ColumnNode) -> str:
+            return f"Static:{node.name}"
+
+    col = ColumnNode(name="id")
+    assert StaticVisitor().visit(col) == "Static:id"
+
+    visitor = MockVisitor()
+    assert visitor.visit(col) == "Col:id"
+    visitor.visit_ColumnNode = lambda node: f"Patched:{node.name}"
+    assert visitor.visit(col) == "Patched:id"
+    assert MockVisitor().visit(col) == "Col:id"
@@ -1,15 +1,28 @@
-from typing import Any
+from typing import Any, ClassVar
 from buildaquery.abstract_syntax_tree.models import ASTNode
 
 class Visitor:
     """
     A base class for traversing the Abstract Syntax Tree.
     """
+    # Per-class table of node type -> visit method name, filled on first use of each node type.
+    # Only the name is cached; the method is looked up on the instance so instance-level
+    # overrides and static/class methods dispatch exactly as a plain getattr would.
+    _dispatch: ClassVar[dict[type, str]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+
     def visit(self, node: ASTNode) -> Any:
         """
         The entry point for visiting a node. Dispatches to the correct visit method.
         """
-        method_name = f'visit_{node.__class__.__name__}'
+        node_type = type(node)
+        method_name = self._dispatch.get(node_type)
+        if method_name is None:
+            method_name = f'visit_{node_type.__name__}'
+            self._dispatch[node_type] = method_name
         visitor = getattr(self, method_name, self.generic_visit)
         return visitor(node)
 